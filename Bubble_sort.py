@@ -1,35 +1,77 @@
 """
-Prompts the user to input a sequence of space-separated numbers, sorts them
-using the bubble sort algorithm, and visualizes each step using a bar chart.
+Sorts numbers using the bubble sort algorithm.
+
+bubble_sort(numbers) sorts a list in place with no visualization overhead.
+bubble_sort_steps(numbers) does the same but yields a step event for every
+comparison and swap, which the sort_visualizer functions turn into an animation.
+
+Run as a script, it prompts the user to input a sequence of space-separated
+numbers, sorts them and visualizes each step using a bar chart drawn by
+sort_visualizer.animate_sort. Pass an .mp4 or .gif path as the only argument
+to save the animation instead of showing it.
 
 Visualization:
-- Sky blue bars represent the current state of the list after each comparison.
+- Sky blue bars represent the current state of the list; the bars being
+  compared are highlighted.
 - Real-time updates illustrate how elements bubble up to their correct position.
 - The algorithm stops early if no swaps occur in a pass (optimized bubble sort).
 """
 
-import matplotlib.pyplot as plt
 
+def bubble_sort(numbers):
+    """
+    Sorts a list in place using bubble sort.
+
+    Parameters:
+        numbers (list): A list of comparable elements.
+
+    Returns:
+        list: The same list, sorted in ascending order.
+    """
+    n = len(numbers)
+    for i in range(n - 1):
+        swapped = False
+        for j in range(n - 1 - i):
+            if numbers[j] > numbers[j + 1]:
+                numbers[j], numbers[j + 1] = numbers[j + 1], numbers[j]
+                swapped = True
+        if not swapped:
+            break
+    return numbers
+
+
+def bubble_sort_steps(numbers):
+    """
+    Sorts a list in place using bubble sort, yielding each step.
+
+    Parameters:
+        numbers (list): A list of comparable elements.
 
-numbers = input('Enter numbers and split it with space: ').split()
-numbers = list(map(int, numbers))
-n = len(numbers)
+    Yields:
+        tuple: ("compare", j, j + 1) before each comparison and ("swap", j, j + 1)
+        after each exchange.
+    """
+    n = len(numbers)
+    for i in range(n - 1):
+        swapped = False
+        for j in range(n - 1 - i):
+            yield "compare", j, j + 1
+            if numbers[j] > numbers[j + 1]:
+                numbers[j], numbers[j + 1] = numbers[j + 1], numbers[j]
+                swapped = True
+                yield "swap", j, j + 1
+        if not swapped:
+            break
 
-for i in range(n - 1):
-    swapped = False
-    for j in range(n - 1 - i):
-        if numbers[j] > numbers[j + 1]:
-            numbers[j], numbers[j + 1] = numbers[j + 1], numbers[j]
-            swapped = True
 
-        # Show current comparison step
-        plt.bar(range(n), numbers, color='skyblue')
-        plt.pause(0.2)
-        plt.clf()
+if __name__ == "__main__":
+    import sys
 
-    if not swapped:
-        break
+    from sort_visualizer import animate_sort
 
-plt.bar(range(n), numbers, color='green')
-plt.show()
-print("Sorted numbers:", numbers)
\ No newline at end of file
+    numbers = input('Enter numbers and split it with space: ').split()
+    numbers = list(map(int, numbers))
+    # Optional argument: an .mp4 or .gif path to save the animation to instead of showing it
+    save = sys.argv[1] if len(sys.argv) > 1 else None
+    animate_sort(numbers, bubble_sort_steps(numbers), fps=5, save=save, title="Bubble sort")
+    print("Sorted numbers:", numbers)
@@ -1,99 +1,90 @@
-def caesar_encryption(number, text):
-  """Encrypts a string using Caesar cipher, shifting all characters.
-
-  This function shifts each character in the input text by the specified
-  number, wrapping around the ASCII table. It does not handle alphabetic
-  characters differently.
-
-  Args:
-    number (int): The shift value for the cipher.
-    text (str): The text to encrypt.
-
-  Returns:
-    str: The encrypted text.
-  """
-  output = ''
-  for i in text:
-    output += chr(ord(i) + number)
-  return output
-
-def caesar_decryption(number, enc_text):
-  """Decrypts a string encrypted with Caesar cipher, shifting all characters.
-
-  This function shifts each character in the encrypted text back by the
-  specified number, wrapping around the ASCII table. It does not handle
-  alphabetic characters differently.
-
-  Args:
-    number (int): The shift value for the cipher.
-    enc_text (str): The encrypted text.
-
-  Returns:
-    str: The decrypted text.
-  """
-  output = ''
-  for i in enc_text:
-    output += chr(ord(i) - number)
-  return output
-
-def caesar_encryption_only_alpha(number, text):
- """Encrypts a string using Caesar cipher, only for alphabet characters.
-
- Args:
-  number (int): The shift value for the cipher.
-  text (str): The text to encrypt.
-
- Returns:
-  str: The encrypted text.
- """
- output = ''
- for i in text:
-  if i.isalpha():
-   if i.isupper():
-    output += chr(((ord(i) + number - 65) % 26) + 65) 
-   else:
-    output += chr(((ord(i) + number - 97) % 26) + 97)
-  else:
-   output += i
- return output
-
-def caesar_decryption_only_alpha(number, text):
- """Decrypts a string encrypted with Caesar cipher, only for alphabet characters.
-
- Args:
-  number (int): The shift value for the cipher.
-  text (str): The encrypted text.
-
- Returns:
-  str: The decrypted text.
- """
- output = ''
- for i in text:
-  if i.isalpha(): 
-   if i.isupper(): 
-    output += chr(((ord(i) - number - 65) % 26) + 65)
-   else: 
-    output += chr(((ord(i) - number - 97) % 26) + 97)
-  else: 
-   output += i
- return output
-
-
-
-while True:
+"""
+A Caesar cipher, interactive or as a streaming filter.
+
+The cipher itself lives in caesar.py, which applies precomputed translation
+tables instead of building the output one character at a time.
+
+Run without arguments for the interactive menu. With encrypt or decrypt and
+a shift it works as a filter: the input file (or stdin) is streamed through
+the cipher in --buffer-size chunks, in constant memory, to the output file
+(or stdout). Only ASCII letters change, and they are single bytes in UTF-8,
+so the stream is ciphered as raw bytes and a chunk boundary inside a
+multi-byte character is harmless. Files of at least 64 MiB written to a file
+are split into byte ranges and ciphered in parallel, one process per CPU
+unless --workers says otherwise.
+
+Usage:
+------
+    python "Caesar cipher.py"
+    python "Caesar cipher.py" encrypt 3 -i corpus.txt -o corpus.enc --workers 8
+    cat corpus.enc | python "Caesar cipher.py" decrypt 3 --buffer-size 4M > corpus.txt
+"""
+import argparse
+import sys
+
+from caesar import (CHUNK_SIZE, caesar_decryption_only_alpha, caesar_encryption_only_alpha,
+                    encrypt_file, encrypt_stream)
+from byte_sizes import parse_size
+
+
+def interactive():
+  """Runs the menu loop until the user chooses Exit or closes the input."""
+  while True:
+    try:
+      choice = int(input('Enter your choice:\n1: Encrypt\n2: Decrypt\n3: Exit\n'))
+      match choice:
+        case 1:
+          text = input('Enter your simple text: ')
+          encrypt_number = int(input('Enter the encrypt code: '))
+          print(caesar_encryption_only_alpha(encrypt_number,text))
+        case 2:
+          text = input('Enter your encrypted text: ')
+          decrypt_number = int(input('Enter the decrypt code: '))
+          print(caesar_decryption_only_alpha(decrypt_number,text))
+        case 3:
+          break
+        case _:
+          print('Please choose 1, 2 or 3.')
+    except ValueError:
+      print(chr(27) + "[2J")
+      print('You enter a wrong input. Try again.')
+    except (EOFError, KeyboardInterrupt):
+      print()
+      break
+
+
+def main(argv=None):
+  parser = argparse.ArgumentParser(description="Caesar cipher: an interactive menu, or a streaming filter.")
+  parser.add_argument("mode", nargs="?", choices=("encrypt", "decrypt"), help="Filter mode; omit for the menu.")
+  parser.add_argument("shift", nargs="?", type=int, help="The shift value for the cipher.")
+  parser.add_argument("-i", "--input", help="File to read (default: stdin).")
+  parser.add_argument("-o", "--output", help="File to write (default: stdout).")
+  parser.add_argument("--buffer-size", type=parse_size, default=CHUNK_SIZE, help="Bytes per chunk, e.g. 64K or 4M.")
+  parser.add_argument("--workers", type=int, help="Processes for large files (default: one per CPU).")
+  args = parser.parse_args(argv)
+
+  if args.mode is None:
+    interactive()
+    return
+  if args.shift is None:
+    parser.error("a shift is required with encrypt or decrypt")
+  number = args.shift if args.mode == "encrypt" else -args.shift
+
+  if args.input and args.output:
+    encrypt_file(number, args.input, args.output, args.workers, args.buffer_size)
+    return
+  source = open(args.input, 'rb') if args.input else sys.stdin.buffer
+  target = open(args.output, 'wb') if args.output else sys.stdout.buffer
   try:
-    choice = int(input('Enter your choice:\n1: Encrypt\n2: Decrypt\n3: Exit\n'))
-    match choice:
-      case 1:
-        text = input('Enter your simple text: ')
-        encrypt_number = int(input('Enter the encrypt code: '))
-        print(caesar_encryption_only_alpha(encrypt_number,text))
-      case 2:
-        text = input('Enter your encrypted text: ')
-        decrypt_number = int(input('Enter the decrypt code: '))
-        print(caesar_decryption_only_alpha(decrypt_number,text))
-      case 3:
-        break
-  except:
-    print(chr(27) + "[2J")
-    print('You enter a wrong input. Try again.')
+    encrypt_stream(number, source, target, args.buffer_size)
+  finally:
+    if args.input:
+      source.close()
+    if args.output:
+      target.close()
+    else:
+      target.flush()
+
+
+if __name__ == "__main__":
+  main()
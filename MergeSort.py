@@ -1,11 +1,40 @@
 """
-    This script implements the merge sort algorithm using recursion.
+    This script implements the merge sort algorithm, both recursively
+    (merge/combine) and as an iterative bottom-up sort (merge_sort).
 
-    Then Generates a list of 10 random integers between 1 and 50,
-    prints the original list, and prints the sorted list.
+    merge_sort sorts runs of RUN_SIZE elements with insertion sort, then
+    merges runs of doubling width back and forth between the list and one
+    preallocated buffer, so no list is grown element by element and no level
+    allocates new lists for its halves. The only temporaries are the slices
+    that bulk-copy a run's leftover tail (or an already ordered pair of
+    runs) into the buffer; they are freed right away and never exceed n.
+    Like sorted(), it takes key= and reverse= and is stable.
+
+    parallel_merge_sort sorts large integer arrays on every core: the
+    numbers are copied once into a shared memory block, each worker process
+    sorts one chunk of it in place, and the chunks are merged pairwise, each
+    merge level split into one piece per worker, back and forth between two
+    shared blocks. Nothing but slice bounds is pickled between processes.
+
+    Run as a script, it generates a list of 10 random integers between 1
+    and 50, prints the original list, and prints the sorted list. With
+    --benchmark it times merge, merge_sort and sorted() instead:
+
+        python MergeSort.py --benchmark 1000000 10000000
+        python MergeSort.py --benchmark 100000000 --workers 32
 """
 
+import argparse
+import os
 import random
+import time
+import tracemalloc
+from array import array
+from multiprocessing import Pool
+from multiprocessing import shared_memory
+
+RUN_SIZE = 32
+PARALLEL_MIN_SIZE = 100_000  # below this the pool costs more than it saves
 
 def combine(first_list,second_list):
     """
@@ -47,7 +76,7 @@ def merge(_list):
         list: A new list containing the sorted elements.
     """
 
-    if len(_list) == 1:
+    if len(_list) <= 1:
         return _list
     else:
         mid = len(_list) // 2
@@ -57,6 +86,321 @@ def merge(_list):
         left = merge(left)
         return combine(left, right)
 
-l1 = [random.randint(1,50) for i in range(10)]
-print(l1)
-print(merge(l1))
+
+def _insertion_sort_run(keys, values, start, end):
+    """
+    Sorts keys[start:end] in place with insertion sort, moving values along when given.
+    """
+    for i in range(start + 1, end):
+        current = keys[i]
+        j = i - 1
+        if not current < keys[j]:
+            continue
+        if values is None:
+            while j >= start and current < keys[j]:
+                keys[j + 1] = keys[j]
+                j -= 1
+            keys[j + 1] = current
+        else:
+            value = values[i]
+            while j >= start and current < keys[j]:
+                keys[j + 1] = keys[j]
+                values[j + 1] = values[j]
+                j -= 1
+            keys[j + 1] = current
+            values[j + 1] = value
+
+
+def _merge_runs(source, target, low, mid, high):
+    """
+    Merges the sorted runs source[low:mid] and source[mid:high] into target[low:high].
+    """
+    if not source[mid] < source[mid - 1]:
+        target[low:high] = source[low:high]  # already in order
+        return
+    i, j, k = low, mid, low
+    left, right = source[i], source[j]
+    while True:
+        if right < left:
+            target[k] = right
+            k += 1
+            j += 1
+            if j == high:
+                target[k:high] = source[i:mid]
+                return
+            right = source[j]
+        else:
+            target[k] = left
+            k += 1
+            i += 1
+            if i == mid:
+                target[k:high] = source[j:high]
+                return
+            left = source[i]
+
+
+def _merge_runs_keyed(source_keys, target_keys, source, target, low, mid, high):
+    """
+    Like _merge_runs, but compares keys and moves the values along with them.
+    """
+    if not source_keys[mid] < source_keys[mid - 1]:
+        target_keys[low:high] = source_keys[low:high]
+        target[low:high] = source[low:high]
+        return
+    i, j, k = low, mid, low
+    left, right = source_keys[i], source_keys[j]
+    while True:
+        if right < left:
+            target_keys[k] = right
+            target[k] = source[j]
+            k += 1
+            j += 1
+            if j == high:
+                target_keys[k:high] = source_keys[i:mid]
+                target[k:high] = source[i:mid]
+                return
+            right = source_keys[j]
+        else:
+            target_keys[k] = left
+            target[k] = source[i]
+            k += 1
+            i += 1
+            if i == mid:
+                target_keys[k:high] = source_keys[j:high]
+                target[k:high] = source[j:high]
+                return
+            left = source_keys[i]
+
+
+def merge_sort(items, key=None, reverse=False):
+    """
+    Sorts items with an iterative bottom-up merge sort.
+
+    Parameters:
+        items (iterable): The elements to sort.
+        key (callable): Optional function computing the sort key of each element;
+            it is called once per element.
+        reverse (bool): Sort in descending order. Equal elements keep their
+            original order either way.
+
+    Returns:
+        list: A new list containing the sorted elements.
+    """
+    values = list(items)
+    n = len(values)
+    if reverse:
+        # Reversing before and after a stable ascending sort keeps equal elements in order.
+        values.reverse()
+    keys = values if key is None else list(map(key, values))
+    paired = key is not None
+
+    for start in range(0, n, RUN_SIZE):
+        _insertion_sort_run(keys, values if paired else None, start, min(start + RUN_SIZE, n))
+
+    if n > RUN_SIZE:
+        key_buffer = [None] * n
+        value_buffer = [None] * n if paired else None
+        width = RUN_SIZE
+        while width < n:
+            for low in range(0, n, 2 * width):
+                mid = min(low + width, n)
+                high = min(low + 2 * width, n)
+                if mid == high:
+                    # Lone last run: copy it over so the buffers stay in step.
+                    key_buffer[low:high] = keys[low:high]
+                    if paired:
+                        value_buffer[low:high] = values[low:high]
+                elif paired:
+                    _merge_runs_keyed(keys, key_buffer, values, value_buffer, low, mid, high)
+                else:
+                    _merge_runs(keys, key_buffer, low, mid, high)
+            keys, key_buffer = key_buffer, keys
+            if paired:
+                values, value_buffer = value_buffer, values
+            else:
+                values = keys
+            width *= 2
+
+    if reverse:
+        values.reverse()
+    return values
+
+
+_shared = ()  # the two SharedMemory blocks attached in each pool worker
+
+
+def _attach_shared(names):
+    """Pool initializer: attaches the two shared memory blocks by name."""
+    global _shared
+    _shared = tuple(shared_memory.SharedMemory(name=name) for name in names)
+
+
+def _sort_chunk(bounds):
+    """Pool worker: sorts numbers[start:end] of the first shared block in place."""
+    start, end = bounds
+    view = _shared[0].buf.cast('q')
+    try:
+        chunk = view[start:end].tolist()
+        chunk.sort()
+        view[start:end] = array('q', chunk)
+    finally:
+        view.release()
+
+
+def _merge_piece(task):
+    """
+    Pool worker: merges two sorted slices of one shared block into a slice of the other.
+
+    The slices are concatenated and sorted with list.sort, which finds the
+    two runs and merges them in C in linear time.
+    """
+    source_index, left_start, left_end, right_start, right_end, out_start = task
+    source = _shared[source_index].buf.cast('q')
+    target = _shared[1 - source_index].buf.cast('q')
+    try:
+        piece = source[left_start:left_end].tolist()
+        piece += source[right_start:right_end].tolist()
+        piece.sort()
+        target[out_start:out_start + len(piece)] = array('q', piece)
+    finally:
+        source.release()
+        target.release()
+
+
+def _merge_split(view, left_start, left_end, right_start, right_end, rank):
+    """
+    Finds how many of the first rank merged elements come from the left run.
+
+    Binary search along the merge path: the first rank outputs of merging
+    view[left_start:left_end] and view[right_start:right_end] are the first
+    i of the left run and the first rank - i of the right run.
+    """
+    low = max(0, rank - (right_end - right_start))
+    high = min(rank, left_end - left_start)
+    while low < high:
+        i = (low + high) // 2
+        if view[left_start + i] <= view[right_start + rank - i - 1]:
+            low = i + 1
+        else:
+            high = i
+    return low
+
+
+def parallel_merge_sort(numbers, workers=None, chunks=None):
+    """
+    Sorts 64-bit integers using a process pool and two shared memory buffers.
+
+    Workers first sort one chunk each in place. Then every level of pairwise
+    merges is split into about one piece per worker along the merge path,
+    so each level (including the last) runs on all workers and no worker
+    holds more than about n / workers numbers at a time. The levels ping-pong
+    between the two buffers.
+
+    Parameters:
+        numbers (iterable): Integers that fit in a signed 64-bit word, e.g.
+            a list or an array('q').
+        workers (int): Number of worker processes (default: all cores).
+        chunks (int): Number of chunks sorted separately and then merged
+            (default: one per worker).
+
+    Returns:
+        array: A new array('q') with the numbers in ascending order.
+    """
+    data = numbers if isinstance(numbers, array) and numbers.typecode == 'q' else array('q', numbers)
+    n = len(data)
+    workers = workers or os.cpu_count() or 1
+    if n < PARALLEL_MIN_SIZE or workers == 1:
+        return array('q', sorted(data))
+    chunks = max(1, min(chunks or workers, n))
+
+    blocks = [shared_memory.SharedMemory(create=True, size=n * data.itemsize) for _ in range(2)]
+    views = [block.buf[:n * data.itemsize].cast('q') for block in blocks]  # blocks may be rounded up to a page
+    try:
+        views[0][:] = data
+        step = -(-n // chunks)
+        runs = [(start, min(start + step, n)) for start in range(0, n, step)]
+        piece_size = -(-n // workers)
+        source = 0
+        with Pool(workers, initializer=_attach_shared, initargs=([block.name for block in blocks],)) as pool:
+            pool.map(_sort_chunk, runs, chunksize=1)
+            while len(runs) > 1:
+                view = views[source]
+                tasks = []
+                merged_runs = []
+                for index in range(0, len(runs), 2):
+                    left_start, left_end = runs[index]
+                    right_start, right_end = runs[index + 1] if index + 1 < len(runs) else (left_end, left_end)
+                    total = (left_end - left_start) + (right_end - right_start)
+                    previous_rank = previous_i = 0
+                    for rank in list(range(piece_size, total, piece_size)) + [total]:
+                        i = _merge_split(view, left_start, left_end, right_start, right_end, rank)
+                        tasks.append((source, left_start + previous_i, left_start + i,
+                                      right_start + previous_rank - previous_i, right_start + rank - i,
+                                      left_start + previous_rank))
+                        previous_rank, previous_i = rank, i
+                    merged_runs.append((left_start, left_start + total))
+                pool.map(_merge_piece, tasks, chunksize=1)
+                runs = merged_runs
+                source = 1 - source
+        result = array('q')
+        result.frombytes(views[source].cast('B'))
+        return result
+    finally:
+        for view in views:
+            view.release()
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def benchmark(sizes, repeat=1, memory=False, workers=None):
+    """
+    Times merge, merge_sort and sorted() on lists of random integers and prints a table.
+
+    Parameters:
+        sizes (list): The list lengths to test.
+        repeat (int): Runs per function and size; the best time is reported.
+        memory (bool): Also report peak memory with tracemalloc (in a separate, slower run).
+        workers (int): When given, also time parallel_merge_sort with this many processes.
+    """
+    sorters = [("merge (recursive)", merge), ("merge_sort (bottom-up)", merge_sort), ("sorted()", sorted)]
+    if workers:
+        sorters.append((f"parallel ({workers} workers)", lambda data: parallel_merge_sort(data, workers).tolist()))
+    header = f"{'n':>10}  {'function':<24}{'seconds':>10}"
+    print(header + (f"{'peak MiB':>10}" if memory else ""))
+    for size in sizes:
+        data = [random.randrange(size * 10) for _ in range(size)]
+        expected = sorted(data)
+        for name, sorter in sorters:
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                result = sorter(data)
+                best = min(best, time.perf_counter() - start)
+            assert result == expected, name
+            del result
+            line = f"{size:>10}  {name:<24}{best:>10.3f}"
+            if memory:
+                tracemalloc.start()
+                sorter(data)
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                line += f"{peak / 2 ** 20:>10.1f}"
+            print(line, flush=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Merge sort demo and benchmark.")
+    parser.add_argument("--benchmark", type=int, nargs="*", metavar="N",
+                        help="Time the sorts on lists of these sizes (default 10^6 and 10^7).")
+    parser.add_argument("--repeat", type=int, default=1, help="Benchmark runs per size; the best is reported.")
+    parser.add_argument("--memory", action="store_true", help="Also measure peak memory with tracemalloc.")
+    parser.add_argument("--workers", type=int, help="Also benchmark parallel_merge_sort with this many processes.")
+    args = parser.parse_args()
+
+    if args.benchmark is not None:
+        benchmark(args.benchmark or [10 ** 6, 10 ** 7], args.repeat, args.memory, args.workers)
+    else:
+        l1 = [random.randint(1,50) for i in range(10)]
+        print(l1)
+        print(merge(l1))
@@ -1,29 +1,69 @@
 """
-Prompts the user to input a sequence of space-separated numbers, sorts them
-using the selection sort algorithm, and visualizes each step using a bar chart.
+Sorts numbers using the selection sort algorithm.
+
+selection_sort(numbers) sorts a list in place with no visualization overhead.
+selection_sort_steps(numbers) does the same but yields a step event for every
+comparison and swap, which the sort_visualizer functions turn into an animation.
+
+Run as a script, it prompts the user to input a sequence of space-separated
+numbers, sorts them and visualizes each step using a bar chart drawn by
+sort_visualizer.animate_sort. Pass an .mp4 or .gif path as the only argument
+to save the animation instead of showing it.
 
 The bar chart updates in real-time to show the progression of the sort.
 """
-import matplotlib.pyplot as plt
 
 
-numbers = input('Enter numbers and split it with space: ').split()
-numbers = list(map(int, numbers))
-n = len(numbers)
+def selection_sort(numbers):
+    """
+    Sorts a list in place using selection sort.
+
+    Parameters:
+        numbers (list): A list of comparable elements.
+
+    Returns:
+        list: The same list, sorted in ascending order.
+    """
+    n = len(numbers)
+    for i in range(n - 1):
+        min_index = i
+        for j in range(i + 1, n):
+            if numbers[j] < numbers[min_index]:
+                min_index = j
+        numbers[i], numbers[min_index] = numbers[min_index], numbers[i]
+    return numbers
+
+
+def selection_sort_steps(numbers):
+    """
+    Sorts a list in place using selection sort, yielding each step.
+
+    Parameters:
+        numbers (list): A list of comparable elements.
+
+    Yields:
+        tuple: ("compare", j, min_index) for each comparison and
+        ("swap", i, min_index) when the minimum is moved into place.
+    """
+    n = len(numbers)
+    for i in range(n - 1):
+        min_index = i
+        for j in range(i + 1, n):
+            yield "compare", j, min_index
+            if numbers[j] < numbers[min_index]:
+                min_index = j
+        numbers[i], numbers[min_index] = numbers[min_index], numbers[i]
+        yield "swap", i, min_index
 
-for i in range(n - 1):
-    min_index = i
-    for j in range(i + 1, n):
-        if numbers[j] < numbers[min_index]:
-            min_index = j
-    numbers[i], numbers[min_index] = numbers[min_index], numbers[i]
 
-    # Visualize the current state of the list
-    plt.bar(range(n), numbers, color='skyblue')
-    plt.pause(0.5)
-    plt.clf()
+if __name__ == "__main__":
+    import sys
 
-plt.bar(range(n), numbers, color='green')
-plt.show()
+    from sort_visualizer import animate_sort
 
-print("Sorted numbers:", numbers)
\ No newline at end of file
+    numbers = input('Enter numbers and split it with space: ').split()
+    numbers = list(map(int, numbers))
+    # Optional argument: an .mp4 or .gif path to save the animation to instead of showing it
+    save = sys.argv[1] if len(sys.argv) > 1 else None
+    animate_sort(numbers, selection_sort_steps(numbers), fps=2, save=save, title="Selection sort")
+    print("Sorted numbers:", numbers)
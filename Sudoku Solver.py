@@ -3,15 +3,27 @@ Sudoku Solver with Tkinter GUI
 
 This code implements a Sudoku puzzle solver using a backtracking algorithm,
 integrated with a graphical user interface (GUI) built with Tkinter.
+A second engine, solving_bitmask, keeps row/column/box candidates as integer
+bitmasks, applies naked and hidden singles before every branch and branches
+on the cell with the fewest candidates. A third engine, solving_dlx, treats the
+puzzle as an exact-cover problem solved with Dancing Links; dlx_solutions and
+count_solutions use it to enumerate solutions lazily and check uniqueness.
+Engines are selectable by name through SOLVERS / solve().
+The solver engines live in sudoku_core.py so they can run without a display;
+see sudoku_batch.py for headless batch solving.
 
 Features:
 ---------
-- 9x9 interactive Sudoku grid for user input
-- Highlights 3x3 boxes with bold borders for better readability
+- 9x9 interactive Sudoku grid for user input (16x16 and 25x25 boards are
+  supported too: pass the size on the command line, e.g. `python "Sudoku Solver.py" 16`)
+- Highlights the boxes (3x3 on a 9x9 board) with bold borders for better readability
 - Pre-filled (user-entered) cells are highlighted in light gray
 - Solved cells appear with a white background
-- "Solve" button attempts to solve the current puzzle using backtracking
-- "Reset" button clears the board
+- "Solve" button attempts to solve the current puzzle using the bitmask solver
+- The solve runs in a background thread; the status line shows the nodes
+  explored per second and the window (including arrow-key navigation) stays responsive
+- "Cancel" button aborts a running solve
+- "Reset" button clears the board (cancelling any running solve)
 - Keyboard navigation with arrow keys and Enter key for fast input
 
 Keyboard Controls:
@@ -22,7 +34,7 @@ Keyboard Controls:
 How to Use:
 -----------
 1. Run the script to open the GUI window.
-2. Enter known numbers into the Sudoku grid (1–9). Leave unknowns blank.
+2. Enter known numbers into the Sudoku grid (1–9, or 1–N on an NxN board). Leave unknowns blank.
 3. Click "Solve" to see the completed solution, if solvable.
 4. Click "Reset" to clear the grid and start again.
 
@@ -34,111 +46,98 @@ Dependencies:
 Author: Minoo Sayyadpour
 Date: 2025-07-13
 """
+import queue
+import sys
+import threading
+import time
 import tkinter as tk
 from tkinter import messagebox
 
-def valid_move(grid, row, col, number):
-    """
-        Check if placing a number at the specified position is valid according to Sudoku rules.
+from sudoku_core import SolveCancelled, box_size, solve
 
-        Parameters:
-        grid : list[list[int]]
-            A 9x9 Sudoku grid represented as a list of lists.
-        row : int
-            Row index (0-based) where the number is to be placed.
-        col : int
-            Column index (0-based) where the number is to be placed.
-        number : int
-            The number (1–9) to be placed in the grid.
-        --------------
-        Returns:
-        bool
-            True if the number can be legally placed at the given position;
-            False if it violates Sudoku constraints (row, column, or 3x3 box).
+POLL_INTERVAL_MS = 100
+
+class SolveMonitor:
     """
-    if number in grid[row]:
-        return False
-    for x in range(9):
-        if grid[x][col] == number:
-            return False
-    corner_row = row - (row % 3)
-    corner_col = col - (col % 3)
-    for i in range(3):
-        for j in range(3):
-            if grid[corner_row + i][corner_col + j] == number:
-                return False
-    return True
-
-def solving(grid, row, col):
+        Progress callback handed to the solver running in the worker thread.
+
+        Counts search nodes and raises SolveCancelled at the next node once
+        cancel() has been called from the GUI thread.
     """
-       Recursively solves the given Sudoku grid using backtracking.
+    def __init__(self):
+        self.nodes = 0
+        self._cancelled = threading.Event()
 
-       This function attempts to fill the grid starting from the specified cell (row, col),
-       moving left to right and top to bottom. If it finds a valid number for an empty cell,
-       it proceeds to the next cell. If no valid number is found, it backtracks to try another possibility.
+    def __call__(self):
+        self.nodes += 1
+        if self._cancelled.is_set():
+            raise SolveCancelled()
 
-    -----------------
-       Returns:
-       bool
-           True if the grid can be completely and validly filled;
-           False if the puzzle has no solution from the current state.
-    """
-    if col == 9:
-        if row == 8:
-            return True
-        else:
-            row += 1
-            col = 0
-    if grid[row][col] > 0:
-        return solving(grid, row, col + 1)
-    for i in range(1, 10):
-        if valid_move(grid, row, col, i):
-            grid[row][col] = i
-            if solving(grid, row, col + 1):
-                return True
-        grid[row][col] = 0
-    return False
+    def cancel(self):
+        """Request cancellation; safe to call from any thread."""
+        self._cancelled.set()
 
 class SudokuGUI:
-    def __init__(self, root):
+    def __init__(self, root, engine="bitmask", size=9):
         """
             Initialize the Sudoku GUI.
 
-            Sets up the 9x9 entry grid, configures buttons, enables keyboard navigation,
+            Sets up the NxN entry grid, configures buttons, enables keyboard navigation,
             and prepares internal state for tracking user input and solved cells.
 
             Parameters:
             -----------
             root : tk.Tk
                 The main Tkinter root window.
+            engine : str
+                Name of the solver engine used by the "Solve" button (see SOLVERS).
+            size : int
+                Board size N: 9 for classic Sudoku, 16 or 25 for the larger variants.
         """
         self.root = root
+        self.engine = engine
+        self.size = size
+        self.box = box_size(size)
         self.root.title("Sudoku Solver")
-        self.entries = [[None for _ in range(9)] for _ in range(9)]
-        self.original_cells = [[False for _ in range(9)] for _ in range(9)]
+        self.entries = [[None for _ in range(size)] for _ in range(size)]
+        self.original_cells = [[False for _ in range(size)] for _ in range(size)]
 
         self.create_grid()
         self.selected_cell = (0, 0)  # for keyboard navigation
 
-        solve_btn = tk.Button(root, text="Solve", command=self.solve_puzzle, font=('Arial', 14), bg='green', fg='white')
-        solve_btn.grid(row=9, column=0, columnspan=5, sticky="nsew")
+        # State of the background solve, if one is running.
+        self.monitor = None
+        self.results = queue.Queue()
+        self.last_poll = (0.0, 0)
+
+        third = size // 3
+        self.solve_btn = tk.Button(root, text="Solve", command=self.solve_puzzle, font=('Arial', 14), bg='green', fg='white')
+        self.solve_btn.grid(row=size, column=0, columnspan=third, sticky="nsew")
+
+        self.cancel_btn = tk.Button(root, text="Cancel", command=self.cancel_solve, font=('Arial', 14), state=tk.DISABLED)
+        self.cancel_btn.grid(row=size, column=third, columnspan=third, sticky="nsew")
 
         reset_btn = tk.Button(root, text="Reset", command=self.reset_grid, font=('Arial', 14), bg='red', fg='white')
-        reset_btn.grid(row=9, column=5, columnspan=4, sticky="nsew")
+        reset_btn.grid(row=size, column=2 * third, columnspan=size - 2 * third, sticky="nsew")
+
+        self.status = tk.Label(root, text="", font=('Arial', 11), anchor='w')
+        self.status.grid(row=size + 1, column=0, columnspan=size, sticky="nsew")
 
         self.bind_keys()
 
     def create_grid(self):
         """
-        Create a 9x9 grid of Entry widgets for Sudoku input.
+        Create an NxN grid of Entry widgets for Sudoku input.
 
-        Each cell is placed in the GUI with padding to visually highlight 3x3 boxes.
+        Each cell is placed in the GUI with padding to visually highlight the boxes.
         Entry widgets are stored in a 2D list for easy access.
         """
-        for i in range(9):
-            for j in range(9):
-                entry = tk.Entry(self.root, width=3, font=('Arial', 18), justify='center', bg='white')
-                entry.grid(row=i, column=j, padx=(2 if j % 3 == 0 else 1), pady=(2 if i % 3 == 0 else 1), ipady=5)
+        box = self.box
+        font_size = max(10, 162 // self.size)  # 18pt on a 9x9 board, smaller on larger boards
+        for i in range(self.size):
+            for j in range(self.size):
+                entry = tk.Entry(self.root, width=3, font=('Arial', font_size), justify='center', bg='white')
+                entry.grid(row=i, column=j, padx=(2 if j % box == 0 else 1), pady=(2 if i % box == 0 else 1), ipady=5)
                 entry.bind("<FocusIn>", lambda e, row=i, col=j: self.set_selected_cell(row, col))
                 self.entries[i][j] = entry
 
@@ -182,8 +181,8 @@ class SudokuGUI:
             Column offset to move (positive or negative).
         """
         row, col = self.selected_cell
-        new_row = max(0, min(8, row + d_row))
-        new_col = max(0, min(8, col + d_col))
+        new_row = max(0, min(self.size - 1, row + d_row))
+        new_col = max(0, min(self.size - 1, col + d_col))
         self.entries[new_row][new_col].focus_set()
         self.selected_cell = (new_row, new_col)
 
@@ -191,22 +190,22 @@ class SudokuGUI:
         """
            Retrieve the current Sudoku grid values from the GUI entries.
 
-           Parses each Entry widget, converts valid digits (1–9) to integers,
+           Parses each Entry widget, converts valid numbers (1–N) to integers,
            and marks cells as pre-filled or empty. Updates cell background colors accordingly.
 
            Returns:
            --------
            list[list[int]]
-               A 9x9 grid of integers representing the current state of the Sudoku board,
+               An NxN grid of integers representing the current state of the Sudoku board,
                with 0 indicating empty cells.
         """
         grid = []
-        self.original_cells = [[False for _ in range(9)] for _ in range(9)]
-        for i in range(9):
+        self.original_cells = [[False for _ in range(self.size)] for _ in range(self.size)]
+        for i in range(self.size):
             row = []
-            for j in range(9):
+            for j in range(self.size):
                 val = self.entries[i][j].get()
-                if val.isdigit() and 1 <= int(val) <= 9:
+                if val.isdigit() and 1 <= int(val) <= self.size:
                     row.append(int(val))
                     self.entries[i][j].config(bg='lightgray')
                     self.original_cells[i][j] = True
@@ -226,10 +225,10 @@ class SudokuGUI:
         Parameters:
         -----------
         grid : list[list[int]]
-            A 9x9 grid of integers representing the solved Sudoku board.
+            An NxN grid of integers representing the solved Sudoku board.
         """
-        for i in range(9):
-            for j in range(9):
+        for i in range(self.size):
+            for j in range(self.size):
                 if not self.original_cells[i][j]:
                     self.entries[i][j].delete(0, tk.END)
                     self.entries[i][j].insert(0, str(grid[i][j]))
@@ -237,38 +236,120 @@ class SudokuGUI:
 
     def solve_puzzle(self):
         """
-        Attempt to solve the Sudoku puzzle using the backtracking solver.
+        Attempt to solve the Sudoku puzzle using the selected solver engine.
 
-        Retrieves the current grid from the GUI, runs the solver,
-        and updates the GUI with the solution if one exists.
-        Displays an error message if no solution is found.
+        Retrieves the current grid from the GUI and starts the solver in a
+        worker thread, so the Tk main loop keeps handling events. Progress and
+        the result are picked up by poll_solve via root.after.
         """
+        if self.monitor is not None:
+            return
         grid = self.get_grid()
-        if solving(grid, 0, 0):
+        self.monitor = SolveMonitor()
+        self.last_poll = (time.perf_counter(), 0)
+        self.solve_btn.config(state=tk.DISABLED)
+        self.cancel_btn.config(state=tk.NORMAL)
+        self.status.config(text="Solving...")
+        worker = threading.Thread(target=self.run_solver, args=(grid, self.monitor), daemon=True)
+        worker.start()
+        self.root.after(POLL_INTERVAL_MS, self.poll_solve)
+
+    def run_solver(self, grid, monitor):
+        """
+        Worker-thread body: run the solver and post the outcome to the result queue.
+
+        Must not touch any Tk widget; the GUI thread reads the queue in poll_solve.
+
+        Parameters:
+        -----------
+        grid : list[list[int]]
+            The grid to solve in place.
+        monitor : SolveMonitor
+            Progress callback used to count nodes and cancel the search.
+        """
+        try:
+            outcome = "solved" if solve(grid, self.engine, progress=monitor) else "unsolvable"
+        except SolveCancelled:
+            outcome = "cancelled"
+        self.results.put((monitor, outcome, grid))
+
+    def poll_solve(self):
+        """
+        Update the status line with the search rate and finish the solve once the worker reports back.
+        """
+        monitor = self.monitor
+        if monitor is None:
+            return
+        while True:
+            try:
+                finished, outcome, grid = self.results.get_nowait()
+            except queue.Empty:
+                now = time.perf_counter()
+                nodes = monitor.nodes
+                last_time, last_nodes = self.last_poll
+                rate = (nodes - last_nodes) / (now - last_time) if now > last_time else 0.0
+                self.last_poll = (now, nodes)
+                self.status.config(text=f"Solving... {nodes:,} nodes ({rate:,.0f} nodes/s)")
+                self.root.after(POLL_INTERVAL_MS, self.poll_solve)
+                return
+            if finished is monitor:  # skip results of solves abandoned by reset_grid
+                break
+
+        if outcome == "solved":
             self.set_grid(grid)
+            self.end_solve(f"Solved after {monitor.nodes:,} nodes.")
+        elif outcome == "cancelled":
+            self.end_solve(f"Cancelled after {monitor.nodes:,} nodes.")
         else:
+            self.end_solve("")
             messagebox.showerror("Sudoku Solver", "No solution exists for the given puzzle.")
 
+    def end_solve(self, message):
+        """
+        Forget the current solve, re-enable the "Solve" button and show a final status message.
+        """
+        self.monitor = None
+        self.solve_btn.config(state=tk.NORMAL)
+        self.cancel_btn.config(state=tk.DISABLED)
+        self.status.config(text=message)
+
+    def cancel_solve(self):
+        """
+        Ask the running solve to stop; the worker exits at its next search node.
+        """
+        if self.monitor is not None:
+            self.monitor.cancel()
+            self.status.config(text="Cancelling...")
+
     def reset_grid(self):
         """
         Clear all entries in the Sudoku grid and reset cell backgrounds.
 
         returning the board to its initial empty state.
+        A running solve is cancelled and its result discarded.
         """
-        for i in range(9):
-            for j in range(9):
+        if self.monitor is not None:
+            self.monitor.cancel()
+            self.end_solve("")
+        for i in range(self.size):
+            for j in range(self.size):
                 self.entries[i][j].delete(0, tk.END)
                 self.entries[i][j].config(bg='white')
-        self.original_cells = [[False for _ in range(9)] for _ in range(9)]
-
-root = tk.Tk()
-root.resizable(False, False)
-screen_width = root.winfo_screenwidth()
-screen_height = root.winfo_screenheight()
-
-x = (screen_width // 2) - 200
-y = (screen_height // 2) - 200
-
-root.geometry(f'412x430+{x}+{y}')
-gui = SudokuGUI(root)
-root.mainloop()
+        self.original_cells = [[False for _ in range(self.size)] for _ in range(self.size)]
+
+if __name__ == "__main__":
+    board_size = int(sys.argv[1]) if len(sys.argv) > 1 else 9
+    root = tk.Tk()
+    root.resizable(False, False)
+    screen_width = root.winfo_screenwidth()
+    screen_height = root.winfo_screenheight()
+
+    x = (screen_width // 2) - 200
+    y = (screen_height // 2) - 200
+
+    if board_size == 9:
+        root.geometry(f'412x460+{x}+{y}')
+    else:
+        root.geometry(f'+{x // 2}+{y // 4}')  # let Tk size the window to the larger grid
+    gui = SudokuGUI(root, size=board_size)
+    root.mainloop()
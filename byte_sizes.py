@@ -0,0 +1,21 @@
+"""
+Parses human-readable byte counts such as "64K" or "2G" for command-line options.
+
+Shared by the scripts that take memory limits, buffer sizes or sample sizes,
+so none of them has to import another script just for this.
+"""
+
+UNITS = {"K": 2 ** 10, "M": 2 ** 20, "G": 2 ** 30, "T": 2 ** 40}
+
+
+def parse_size(text):
+    """
+    Parses a byte count such as "512M", "2G" or "1048576".
+
+    Returns:
+        int: The number of bytes.
+    """
+    text = text.strip().upper().rstrip("B")
+    if text and text[-1] in UNITS:
+        return int(float(text[:-1]) * UNITS[text[-1]])
+    return int(text)
@@ -0,0 +1,265 @@
+"""
+Caesar cipher engine built on translation tables.
+
+The alphabet-only cipher moves each ASCII letter shift places along the
+alphabet and leaves every other character alone, so it is a fixed mapping of
+characters. CIPHERS[shift] is the classical_ciphers.Caesar for each of the
+26 shifts, built once with its tables: TABLES[shift] is the mapping as a
+str.maketrans table and BYTE_TABLES[shift] as a bytes.maketrans table.
+str.translate and bytes.translate apply them in C in a single pass, instead of
+building the output one character at a time.
+
+The bytes path works on anything that supports the buffer protocol:
+encrypt_buffer ciphers a bytearray, memoryview or mmap in place (or into a
+second buffer) chunk by chunk, so a file mapped with mmap is processed
+without ever being read into memory as a whole. ASCII letters are single
+bytes in UTF-8 and no byte of a multi-byte character falls in their range,
+so the bytes path is correct for UTF-8 text too.
+
+The same property makes streaming simple: encrypt_stream pushes a binary
+stream through the cipher buffer_size bytes at a time, in constant memory,
+and a chunk boundary inside a multi-byte character does no harm because
+nothing is ever decoded. For large files encrypt_file splits the input into
+byte ranges and ciphers them in a process pool, each worker writing its
+range straight to its offset in the output file.
+
+Only ASCII letters are shifted. The old per-character loops also shifted
+other letters (such as "é") into unrelated ASCII letters that did not
+decrypt back; the tables leave them unchanged.
+
+Usage:
+------
+    python caesar.py --benchmark
+    python caesar.py --benchmark 1000000 100000000
+"""
+import argparse
+import os
+import random
+import string
+import time
+from multiprocessing import Pool
+
+from classical_ciphers import ALPHABET_SIZE, CHUNK_SIZE, Caesar
+
+PARALLEL_MIN_SIZE = 64 * 2 ** 20  # smaller files are streamed by one process
+
+CIPHERS = [Caesar(shift) for shift in range(ALPHABET_SIZE)]  # one per shift, tables built once
+TABLES = [cipher.encrypt_tables[0] for cipher in CIPHERS]
+BYTE_TABLES = [cipher.encrypt_tables[1] for cipher in CIPHERS]
+
+
+def caesar_encryption(number, text):
+    """Encrypts a string using Caesar cipher, shifting all characters.
+
+    This function shifts each character in the input text by the specified
+    number of code points. It does not handle alphabetic characters
+    differently.
+
+    Args:
+        number (int): The shift value for the cipher.
+        text (str): The text to encrypt.
+
+    Returns:
+        str: The encrypted text.
+    """
+    return ''.join([chr(ord(character) + number) for character in text])
+
+
+def caesar_decryption(number, enc_text):
+    """Decrypts a string encrypted with caesar_encryption.
+
+    Args:
+        number (int): The shift value for the cipher.
+        enc_text (str): The encrypted text.
+
+    Returns:
+        str: The decrypted text.
+    """
+    return caesar_encryption(-number, enc_text)
+
+
+def caesar_encryption_only_alpha(number, text):
+    """Encrypts text using Caesar cipher, only for ASCII letters.
+
+    Args:
+        number (int): The shift value for the cipher; any integer, taken modulo 26.
+        text (str or bytes): The text to encrypt. Bytes and bytearrays are
+            translated with the byte tables.
+
+    Returns:
+        str or bytes: The encrypted text, of the same type as text.
+    """
+    return CIPHERS[number % ALPHABET_SIZE].encrypt(text)
+
+
+def caesar_decryption_only_alpha(number, text):
+    """Decrypts text encrypted with caesar_encryption_only_alpha.
+
+    Args:
+        number (int): The shift value for the cipher.
+        text (str or bytes): The encrypted text.
+
+    Returns:
+        str or bytes: The decrypted text, of the same type as text.
+    """
+    return caesar_encryption_only_alpha(-number, text)
+
+
+def encrypt_buffer(number, buffer, out=None, chunk_size=CHUNK_SIZE):
+    """Encrypts the ASCII letters of a bytes-like buffer, chunk_size bytes at a time.
+
+    Args:
+        number (int): The shift value for the cipher.
+        buffer: Any object supporting the buffer protocol, such as a
+            bytearray, memoryview or mmap.
+        out: A writable buffer at least as long as buffer to write the result
+            to. If None, buffer itself is overwritten, so it must be writable.
+        chunk_size (int): Bytes translated per step; memory use beyond the
+            buffers is about twice this.
+
+    Returns:
+        The buffer the result was written to.
+    """
+    return CIPHERS[number % ALPHABET_SIZE].encrypt_buffer(buffer, out, chunk_size)
+
+
+def decrypt_buffer(number, buffer, out=None, chunk_size=CHUNK_SIZE):
+    """Decrypts a buffer encrypted with encrypt_buffer; see encrypt_buffer for the arguments."""
+    return encrypt_buffer(-number, buffer, out, chunk_size)
+
+
+def encrypt_stream(number, source, target, buffer_size=CHUNK_SIZE):
+    """Encrypts a binary stream into another, buffer_size bytes at a time.
+
+    Args:
+        number (int): The shift value for the cipher; negative to decrypt.
+        source: A binary file object open for reading, such as sys.stdin.buffer.
+        target: A binary file object open for writing, such as sys.stdout.buffer.
+        buffer_size (int): The most bytes read, ciphered and written per step.
+
+    Returns:
+        int: The number of bytes processed.
+    """
+    return CIPHERS[number % ALPHABET_SIZE].encrypt_stream(source, target, buffer_size)
+
+
+def _encrypt_range(task):
+    """Pool worker: encrypts bytes start:end of the input file into the same range of the output file."""
+    number, input_path, output_path, start, end, buffer_size = task
+    table = BYTE_TABLES[number % ALPHABET_SIZE]
+    with open(input_path, 'rb', buffering=0) as source, open(output_path, 'r+b', buffering=0) as target:
+        source.seek(start)
+        target.seek(start)
+        while start < end:
+            chunk = source.read(min(buffer_size, end - start))
+            if not chunk:
+                break
+            target.write(chunk.translate(table))
+            start += len(chunk)
+
+
+def encrypt_file(number, input_path, output_path, workers=None, buffer_size=CHUNK_SIZE):
+    """Encrypts a file into another (or into itself) using a process pool.
+
+    The file is split into one byte range per worker, and every worker
+    ciphers its range buffer_size bytes at a time and writes it at the same
+    offset of the output file, which is sized up front.
+
+    Args:
+        number (int): The shift value for the cipher; negative to decrypt.
+        input_path (str): The file to encrypt.
+        output_path (str): Where to write the result; may be input_path.
+        workers (int): Processes to use (default: one per CPU). With one
+            worker, or for files under PARALLEL_MIN_SIZE, the file is
+            streamed by this process instead.
+        buffer_size (int): Bytes read, ciphered and written per step.
+
+    Returns:
+        int: The number of bytes processed.
+    """
+    size = os.path.getsize(input_path)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or size < PARALLEL_MIN_SIZE:
+        if os.path.abspath(input_path) == os.path.abspath(output_path):
+            _encrypt_range((number, input_path, output_path, 0, size, buffer_size))
+            return size
+        with open(input_path, 'rb') as source, open(output_path, 'wb') as target:
+            return encrypt_stream(number, source, target, buffer_size)
+
+    if os.path.abspath(input_path) != os.path.abspath(output_path):
+        with open(output_path, 'wb') as target:
+            target.truncate(size)
+    step = -(-size // workers)
+    tasks = [(number, input_path, output_path, start, min(start + step, size), buffer_size)
+             for start in range(0, size, step)]
+    with Pool(workers) as pool:
+        pool.map(_encrypt_range, tasks)
+    return size
+
+
+def _encryption_only_alpha_loop(number, text):
+    # The original per-character implementation, kept as the benchmark reference.
+    output = ''
+    for i in text:
+        if i.isalpha():
+            if i.isupper():
+                output += chr(((ord(i) + number - 65) % 26) + 65)
+            else:
+                output += chr(((ord(i) + number - 97) % 26) + 97)
+        else:
+            output += i
+    return output
+
+
+def benchmark(sizes=(100_000, 10_000_000), seed=0, loop_limit=10_000_000):
+    """
+    Prints the throughput of the original loop, the str and bytes tables and
+    encrypt_buffer for texts of the given sizes, and checks that they agree.
+
+    Args:
+        sizes (tuple): Text sizes in characters.
+        seed (int): Seed for the random texts.
+        loop_limit (int): The original loop is skipped for larger texts.
+    """
+    rng = random.Random(seed)
+    alphabet = string.ascii_letters + string.digits + " .,;:!?\n" * 3
+    print(f"{'size':>12}{'loop':>12}{'str':>12}{'bytes':>12}{'buffer':>12}   (MB/s)")
+    for size in sizes:
+        text = ''.join(rng.choices(alphabet, k=size))
+        data = text.encode()
+        expected = None
+        line = f"{size:>12}"
+
+        if size <= loop_limit:
+            start = time.perf_counter()
+            expected = _encryption_only_alpha_loop(7, text)
+            line += f"{size / 1e6 / (time.perf_counter() - start):>12.1f}"
+        else:
+            line += f"{'-':>12}"
+
+        start = time.perf_counter()
+        result = caesar_encryption_only_alpha(7, text)
+        line += f"{size / 1e6 / (time.perf_counter() - start):>12.1f}"
+        if expected is None:
+            expected = result
+        assert result == expected
+
+        start = time.perf_counter()
+        result = caesar_encryption_only_alpha(7, data)
+        line += f"{size / 1e6 / (time.perf_counter() - start):>12.1f}"
+        assert result == expected.encode()
+
+        buffer = bytearray(data)
+        start = time.perf_counter()
+        encrypt_buffer(7, buffer)
+        line += f"{size / 1e6 / (time.perf_counter() - start):>12.1f}"
+        assert buffer == result
+        print(line, flush=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the table-driven Caesar cipher.")
+    parser.add_argument("--benchmark", type=int, nargs="*", metavar="N", required=True,
+                        help="Text sizes to benchmark (default: 100000 10000000).")
+    args = parser.parse_args()
+    benchmark(args.benchmark or (100_000, 10_000_000))
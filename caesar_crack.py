@@ -0,0 +1,218 @@
+"""
+Breaks Caesar ciphers with an unknown shift by letter-frequency analysis.
+
+The letters of the ciphertext are counted once into a 26-bin histogram
+(case folded). Decrypting with shift s turns cipher letter (i + s) % 26 into
+plaintext letter i, so the histogram of every candidate plaintext is just
+the ciphertext histogram rotated by s: all 26 shifts are scored with the
+chi-squared statistic against English letter frequencies without decrypting
+the text even once. The lowest score wins, and only the winner is decrypted
+with caesar.caesar_decryption_only_alpha.
+
+The histogram is taken over bytes (ASCII letters are single bytes in UTF-8),
+with NumPy's bincount when NumPy is installed. A few kilobytes of text are
+plenty, so only the first --sample bytes are analysed; --decrypt then
+streams the whole input through the cipher in constant memory.
+
+crack_many scores a whole batch of ciphertexts at once: with NumPy their
+histograms are counted in one bincount and all shifts of all texts are
+scored in one array expression. Texts of only a few words have too few
+letters for reliable statistics and may get the wrong shift.
+
+Usage:
+------
+    python caesar_crack.py secret.txt
+    python caesar_crack.py --sample 64K --decrypt huge.enc > huge.txt
+    python caesar_crack.py --batch < one_ciphertext_per_line.txt
+    python caesar_crack.py --benchmark
+"""
+import argparse
+import random
+import string
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+from byte_sizes import parse_size
+from caesar import ALPHABET_SIZE, caesar_decryption_only_alpha, caesar_encryption_only_alpha, encrypt_stream
+
+# Relative frequencies of a to z in English text, in percent
+ENGLISH_FREQUENCIES = (8.167, 1.492, 2.782, 4.253, 12.702, 2.228, 2.015, 6.094, 6.966, 0.153, 0.772, 4.025, 2.406,
+                       6.749, 7.507, 1.929, 0.095, 5.987, 6.327, 9.056, 2.758, 0.978, 2.360, 0.150, 1.974, 0.074)
+DEFAULT_SAMPLE = 2 ** 20  # bytes of a file read for the histogram
+
+_LOWER = [ord(letter) for letter in string.ascii_lowercase]
+_UPPER = [ord(letter) for letter in string.ascii_uppercase]
+_EXPECTED = [frequency / 100 for frequency in ENGLISH_FREQUENCIES]
+
+
+def _as_bytes(text):
+    return text.encode('utf-8', 'surrogateescape') if isinstance(text, str) else bytes(text)
+
+
+def letter_counts(text):
+    """Counts each letter of a text, ignoring case.
+
+    Args:
+        text (str or bytes): The text. Only ASCII letters are counted.
+
+    Returns:
+        list: 26 counts, for a to z.
+    """
+    data = _as_bytes(text)
+    if np is not None:
+        counts = np.bincount(np.frombuffer(data, dtype=np.uint8), minlength=256)
+        return (counts[_LOWER] + counts[_UPPER]).tolist()
+    return [data.count(lower) + data.count(upper) for lower, upper in zip(_LOWER, _UPPER)]
+
+
+def shift_scores(counts):
+    """Scores every shift by the chi-squared distance of its plaintext from English.
+
+    Args:
+        counts (list): The 26 letter counts of the ciphertext.
+
+    Returns:
+        list: 26 scores, indexed by shift; lower is more English-like.
+        All are 0.0 if there are no letters.
+    """
+    total = sum(counts)
+    if not total:
+        return [0.0] * ALPHABET_SIZE
+    expected = [total * frequency for frequency in _EXPECTED]
+    return [sum((counts[(i + shift) % ALPHABET_SIZE] - expected[i]) ** 2 / expected[i]
+                for i in range(ALPHABET_SIZE))
+            for shift in range(ALPHABET_SIZE)]
+
+
+def find_shift(text):
+    """Finds the most likely shift of a Caesar-encrypted text.
+
+    Args:
+        text (str or bytes): The ciphertext, or a sample of it.
+
+    Returns:
+        tuple: (shift, chi-squared score of that shift).
+    """
+    scores = shift_scores(letter_counts(text))
+    shift = min(range(ALPHABET_SIZE), key=scores.__getitem__)
+    return shift, scores[shift]
+
+
+def crack(text):
+    """Decrypts a Caesar-encrypted text without knowing the shift.
+
+    Args:
+        text (str or bytes): The ciphertext.
+
+    Returns:
+        tuple: (shift, decrypted text).
+    """
+    shift, _ = find_shift(text)
+    return shift, caesar_decryption_only_alpha(shift, text)
+
+
+def crack_many(texts):
+    """Finds the most likely shift of each of many ciphertexts.
+
+    Args:
+        texts (list): Ciphertexts, as str or bytes.
+
+    Returns:
+        list: The shift of each text.
+    """
+    if np is None:
+        return [find_shift(text)[0] for text in texts]
+    if not texts:
+        return []
+    # One bincount over every text, with each byte offset by 256 * its text's index
+    encoded = [_as_bytes(text) for text in texts]
+    lengths = np.fromiter(map(len, encoded), dtype=np.intp, count=len(encoded))
+    data = np.frombuffer(b''.join(encoded), dtype=np.uint8).astype(np.intp)
+    data += np.repeat(np.arange(len(encoded), dtype=np.intp) * 256, lengths)
+    counts = np.bincount(data, minlength=256 * len(encoded)).reshape(len(encoded), 256)
+    counts = counts[:, _LOWER] + counts[:, _UPPER]
+
+    # observed[t, s, i] is the count of plaintext letter i of text t under shift s
+    rotations = (np.arange(ALPHABET_SIZE)[None, :] + np.arange(ALPHABET_SIZE)[:, None]) % ALPHABET_SIZE
+    observed = counts[:, rotations]
+    expected = counts.sum(axis=1)[:, None, None] * np.array(_EXPECTED)[None, None, :]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        scores = np.nan_to_num(((observed - expected) ** 2 / expected).sum(axis=2))
+    return scores.argmin(axis=1).tolist()
+
+
+def read_sample(path, size=DEFAULT_SAMPLE):
+    """Reads at most size bytes from the start of a file."""
+    with open(path, 'rb') as source:
+        return source.read(size)
+
+
+def _english_like(length, rng):
+    letters = rng.choices(string.ascii_lowercase, weights=ENGLISH_FREQUENCIES, k=length)
+    return ''.join(letter if rng.random() > 0.18 else ' ' for letter in letters)
+
+
+def benchmark(count=10_000, length=200, seed=0):
+    """Prints how many random English-like ciphertexts per second find_shift and crack_many break."""
+    rng = random.Random(seed)
+    shifts = [rng.randrange(ALPHABET_SIZE) for _ in range(count)]
+    texts = [caesar_encryption_only_alpha(shift, _english_like(length, rng)) for shift in shifts]
+
+    start = time.perf_counter()
+    found = [find_shift(text)[0] for text in texts]
+    one_by_one = time.perf_counter() - start
+    print(f"find_shift: {count / one_by_one:,.0f} texts/s, {sum(map(int.__eq__, found, shifts))}/{count} correct")
+
+    start = time.perf_counter()
+    found = crack_many(texts)
+    batch = time.perf_counter() - start
+    print(f"crack_many: {count / batch:,.0f} texts/s, {sum(map(int.__eq__, found, shifts))}/{count} correct"
+          f"{'' if np is not None else ' (without NumPy)'}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Find the shift of Caesar-encrypted text by letter frequencies.")
+    parser.add_argument("files", nargs="*", help="Ciphertext files (default: stdin).")
+    parser.add_argument("--sample", type=parse_size, default=DEFAULT_SAMPLE,
+                        help="Bytes of each input to analyse, e.g. 64K (default: 1M).")
+    parser.add_argument("--decrypt", action="store_true", help="Print the decrypted text instead of the shift.")
+    parser.add_argument("--batch", action="store_true", help="Treat every input line as a separate ciphertext.")
+    parser.add_argument("--benchmark", action="store_true", help="Measure cracking throughput.")
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        benchmark()
+        return
+    if args.batch:
+        lines = [line.rstrip(b'\r\n') for line in sys.stdin.buffer]
+        for line, shift in zip(lines, crack_many(lines)):
+            if args.decrypt:
+                sys.stdout.buffer.write(caesar_decryption_only_alpha(shift, line) + b'\n')
+            else:
+                print(shift)
+        return
+    if not args.files:
+        sample = sys.stdin.buffer.read(args.sample)
+        shift, score = find_shift(sample)
+        if args.decrypt:
+            sys.stdout.buffer.write(caesar_decryption_only_alpha(shift, sample))
+            encrypt_stream(-shift, sys.stdin.buffer, sys.stdout.buffer)
+        else:
+            print(f"shift {shift} (chi-squared {score:.1f})")
+        return
+    for path in args.files:
+        shift, score = find_shift(read_sample(path, args.sample))
+        if args.decrypt:
+            with open(path, 'rb') as source:
+                encrypt_stream(-shift, source, sys.stdout.buffer)
+        else:
+            print(f"{path}: shift {shift} (chi-squared {score:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,382 @@
+"""
+Classical ciphers (Caesar, ROT13, affine, Vigenère) on shared table-driven kernels.
+
+Every cipher here only changes ASCII letters, keeps their case and leaves all
+other characters alone, so all of them work on str, on bytes and on UTF-8
+streams split at arbitrary byte boundaries.
+
+Monoalphabetic ciphers (SubstitutionCipher and its subclasses Caesar, ROT13
+and Affine) are a permutation of the 26 letters. letter_tables turns a
+permutation into a str.maketrans and a bytes.maketrans table once, and every
+call after that is a single str.translate or bytes.translate pass in C.
+
+Vigenère is polyalphabetic: the shift changes from letter to letter with the
+key, so one table is not enough. With NumPy the letters are found with a
+mask and shifted with uint8 modular arithmetic in a few array passes. Without
+it the letters are pulled out with bytes.translate, and every key position
+i gets its own Caesar table applied to the strided slice letters[i::len(key)],
+one C pass per key letter, before the letters are put back between the
+other characters run by run. The key advances on letters only, as in the
+classical cipher.
+
+Every cipher can also process a binary stream or a writable buffer (bytearray,
+memoryview, mmap) chunk by chunk in constant memory; Vigenère carries its key
+position across chunks.
+
+Usage:
+------
+    python classical_ciphers.py vigenere encrypt --key LEMON -i plain.txt -o secret.txt
+    python classical_ciphers.py affine decrypt --key 5,8 < secret.txt
+    python classical_ciphers.py rot13 encrypt < plain.txt
+    python classical_ciphers.py --benchmark
+"""
+import argparse
+import math
+from abc import ABC, abstractmethod
+import random
+import re
+import string
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+ALPHABET_SIZE = 26
+CHUNK_SIZE = 2 ** 20  # bytes processed per step by the stream and buffer methods
+_VIGENERE_BLOCK = 2 ** 18  # bytes per NumPy pass of the Vigenère kernel
+
+_NON_LETTERS = bytes(byte for byte in range(256) if chr(byte) not in string.ascii_letters)
+_LETTER_RUN = re.compile(rb'([A-Za-z]+)')
+
+
+def letter_tables(permutation):
+    """
+    Builds the translation tables of a monoalphabetic cipher.
+
+    Parameters:
+        permutation (list): permutation[i] is the index of the letter that
+            letter i becomes (0 for a, 25 for z); case is preserved.
+
+    Returns:
+        tuple: (str.maketrans table, bytes.maketrans table).
+    """
+    lower = ''.join(string.ascii_lowercase[index] for index in permutation)
+    target = lower + lower.upper()
+    return (str.maketrans(string.ascii_letters, target),
+            bytes.maketrans(string.ascii_letters.encode(), target.encode()))
+
+
+def translate_buffer(buffer, byte_table, out=None, chunk_size=CHUNK_SIZE):
+    """
+    Applies a bytes translation table to a buffer, chunk_size bytes at a time.
+
+    Parameters:
+        buffer: Any object supporting the buffer protocol, such as a
+            bytearray, memoryview or mmap.
+        byte_table (bytes): A bytes.maketrans table.
+        out: A writable buffer at least as long as buffer to write the result
+            to. If None, buffer itself is overwritten, so it must be writable.
+        chunk_size (int): Bytes translated per step.
+
+    Returns:
+        The buffer the result was written to.
+    """
+    target_buffer = buffer if out is None else out
+    with memoryview(buffer) as source, memoryview(target_buffer) as target:
+        source, target = source.cast('B'), target.cast('B')
+        if len(target) < len(source):
+            raise ValueError("The output buffer is shorter than the input")
+        for start in range(0, len(source), chunk_size):
+            end = min(start + chunk_size, len(source))
+            target[start:end] = source[start:end].tobytes().translate(byte_table)
+    return target_buffer
+
+
+def _vigenere_numpy(data, shifts, position):
+    values = np.frombuffer(data, dtype=np.uint8)
+    result = values.copy()
+    key = np.array(shifts, dtype=np.uint8)
+    period = len(shifts)
+    alphabet_size = np.uint8(ALPHABET_SIZE)
+    # Blocks small enough for the temporaries to stay in the CPU cache
+    for start in range(0, len(values), _VIGENERE_BLOCK):
+        block = values[start:start + _VIGENERE_BLOCK]
+        folded = block | 0x20  # lower case; no other byte lands in a..z
+        indices = np.flatnonzero((folded >= 0x61) & (folded <= 0x7A))
+        offsets = np.tile(np.roll(key, -(position % period)), len(indices) // period + 1)[:len(indices)]
+        letters = block[indices]
+        base = (letters & 0x20) | 0x41  # 'A' or 'a'
+        letters -= base
+        letters += offsets
+        letters -= (letters >= alphabet_size) * alphabet_size
+        letters += base
+        result[start:start + _VIGENERE_BLOCK][indices] = letters
+        position += len(indices)
+    return result.tobytes(), position
+
+
+def _vigenere_tables(data, byte_tables, position):
+    letters = data.translate(None, _NON_LETTERS)
+    period = len(byte_tables)
+    shifted = bytearray(letters)
+    for i in range(min(period, len(letters))):
+        shifted[i::period] = letters[i::period].translate(byte_tables[(i + position) % period])
+    if len(letters) == len(data):
+        return bytes(shifted), position + len(letters)
+    pieces = _LETTER_RUN.split(data)  # the odd pieces are the runs of letters
+    cursor = 0
+    for i in range(1, len(pieces), 2):
+        end = cursor + len(pieces[i])
+        pieces[i] = shifted[cursor:end]
+        cursor = end
+    return b''.join(pieces), position + len(letters)
+
+
+class Cipher(ABC):
+    """
+    Base class of the ciphers: str and bytes in, the same type out.
+
+    Subclasses implement _transform, which the stream and buffer methods are
+    built on.
+    """
+
+    @abstractmethod
+    def _transform(self, data, decrypt, position):
+        """Ciphers a bytes chunk that starts position letters into the text; returns (result, position after it)."""
+
+    def _apply(self, text, decrypt):
+        if isinstance(text, str):
+            data, _ = self._transform(text.encode('utf-8', 'surrogateescape'), decrypt, 0)
+            return data.decode('utf-8', 'surrogateescape')
+        return self._transform(bytes(text), decrypt, 0)[0]
+
+    def encrypt(self, text):
+        """Encrypts a str or bytes; returns the same type."""
+        return self._apply(text, False)
+
+    def decrypt(self, text):
+        """Decrypts a str or bytes; returns the same type."""
+        return self._apply(text, True)
+
+    def _stream(self, source, target, decrypt, buffer_size):
+        # read1 returns what is available instead of waiting for a full buffer
+        read = getattr(source, 'read1', source.read)
+        position = total = 0
+        while True:
+            chunk = read(buffer_size)
+            if not chunk:
+                return total
+            data, position = self._transform(chunk, decrypt, position)
+            target.write(data)
+            total += len(chunk)
+
+    def encrypt_stream(self, source, target, buffer_size=CHUNK_SIZE):
+        """
+        Encrypts a binary stream into another, buffer_size bytes at a time.
+
+        Returns:
+            int: The number of bytes processed.
+        """
+        return self._stream(source, target, False, buffer_size)
+
+    def decrypt_stream(self, source, target, buffer_size=CHUNK_SIZE):
+        """Decrypts a binary stream into another; see encrypt_stream."""
+        return self._stream(source, target, True, buffer_size)
+
+    def _buffer(self, buffer, out, decrypt, chunk_size):
+        target_buffer = buffer if out is None else out
+        position = 0
+        with memoryview(buffer) as source, memoryview(target_buffer) as target:
+            source, target = source.cast('B'), target.cast('B')
+            if len(target) < len(source):
+                raise ValueError("The output buffer is shorter than the input")
+            for start in range(0, len(source), chunk_size):
+                end = min(start + chunk_size, len(source))
+                target[start:end], position = self._transform(source[start:end].tobytes(), decrypt, position)
+        return target_buffer
+
+    def encrypt_buffer(self, buffer, out=None, chunk_size=CHUNK_SIZE):
+        """
+        Encrypts a bytes-like buffer (bytearray, memoryview, mmap) chunk by chunk.
+
+        Parameters:
+            buffer: The data to encrypt.
+            out: A writable buffer at least as long as buffer for the result;
+                if None, buffer itself is overwritten.
+            chunk_size (int): Bytes processed per step.
+
+        Returns:
+            The buffer the result was written to.
+        """
+        return self._buffer(buffer, out, False, chunk_size)
+
+    def decrypt_buffer(self, buffer, out=None, chunk_size=CHUNK_SIZE):
+        """Decrypts a bytes-like buffer chunk by chunk; see encrypt_buffer."""
+        return self._buffer(buffer, out, True, chunk_size)
+
+
+class SubstitutionCipher(Cipher):
+    """
+    A monoalphabetic cipher given by a permutation of the 26 letters.
+
+    The translation tables for both directions are built once, here.
+    """
+
+    def __init__(self, permutation):
+        self.permutation = tuple(permutation)
+        if sorted(self.permutation) != list(range(ALPHABET_SIZE)):
+            raise ValueError("The permutation must contain each of 0..25 exactly once")
+        inverse = [0] * ALPHABET_SIZE
+        for index, image in enumerate(self.permutation):
+            inverse[image] = index
+        self.encrypt_tables = letter_tables(self.permutation)
+        self.decrypt_tables = letter_tables(inverse)
+
+    def _transform(self, data, decrypt, position):
+        return data.translate((self.decrypt_tables if decrypt else self.encrypt_tables)[1]), position
+
+    def _apply(self, text, decrypt):
+        tables = self.decrypt_tables if decrypt else self.encrypt_tables
+        return text.translate(tables[0] if isinstance(text, str) else tables[1])
+
+    def _buffer(self, buffer, out, decrypt, chunk_size):
+        return translate_buffer(buffer, (self.decrypt_tables if decrypt else self.encrypt_tables)[1], out, chunk_size)
+
+
+class Caesar(SubstitutionCipher):
+    """Shifts every letter shift places along the alphabet."""
+
+    def __init__(self, shift):
+        self.shift = shift % ALPHABET_SIZE
+        super().__init__([(index + self.shift) % ALPHABET_SIZE for index in range(ALPHABET_SIZE)])
+
+
+class ROT13(Caesar):
+    """The Caesar cipher with shift 13, which is its own inverse."""
+
+    def __init__(self):
+        super().__init__(13)
+
+
+class Affine(SubstitutionCipher):
+    """Maps letter x to (a * x + b) mod 26; a must be coprime with 26."""
+
+    def __init__(self, a, b):
+        if math.gcd(a, ALPHABET_SIZE) != 1:
+            raise ValueError(f"a = {a} has no inverse mod 26; use one of 1, 3, 5, 7, 9, 11, 15, 17, 19, 21, 23, 25")
+        self.a, self.b = a % ALPHABET_SIZE, b % ALPHABET_SIZE
+        super().__init__([(self.a * index + self.b) % ALPHABET_SIZE for index in range(ALPHABET_SIZE)])
+
+
+class Vigenere(Cipher):
+    """
+    Shifts each letter by the next letter of the key (A = 0, B = 1, ...).
+
+    The key advances on letters only; other characters are copied unchanged.
+    """
+
+    def __init__(self, key):
+        if not key or not all(letter in string.ascii_letters for letter in key):
+            raise ValueError("The Vigenère key must be a non-empty string of ASCII letters")
+        self.key = key
+        self.shifts = [string.ascii_lowercase.index(letter.lower()) for letter in key]
+        self._inverse_shifts = [-shift % ALPHABET_SIZE for shift in self.shifts]
+        self._tables = [Caesar(shift).encrypt_tables[1] for shift in self.shifts]
+        self._inverse_tables = [Caesar(shift).decrypt_tables[1] for shift in self.shifts]
+
+    def _transform(self, data, decrypt, position):
+        if np is not None:
+            return _vigenere_numpy(data, self._inverse_shifts if decrypt else self.shifts, position)
+        return _vigenere_tables(data, self._inverse_tables if decrypt else self._tables, position)
+
+
+CIPHERS = {"caesar": Caesar, "rot13": ROT13, "affine": Affine, "vigenere": Vigenere}
+
+
+def make_cipher(name, key=None):
+    """
+    Creates a cipher from its name and a key given as text.
+
+    Parameters:
+        name (str): A key of CIPHERS.
+        key (str): The shift for caesar ("3"), "a,b" for affine ("5,8"), the
+            key word for vigenere ("LEMON"); rot13 takes none.
+
+    Returns:
+        Cipher: The cipher.
+    """
+    if name == "rot13":
+        return ROT13()
+    if key is None:
+        raise ValueError(f"The {name} cipher needs a key")
+    if name == "caesar":
+        return Caesar(int(key))
+    if name == "affine":
+        a, b = map(int, key.split(","))
+        return Affine(a, b)
+    if name == "vigenere":
+        return Vigenere(key)
+    raise ValueError(f"Unknown cipher {name!r}; choose one of {', '.join(CIPHERS)}")
+
+
+def benchmark(size=10_000_000, seed=0):
+    """Prints the encryption throughput of each cipher on size bytes and checks the round trip."""
+    rng = random.Random(seed)
+    data = ''.join(rng.choices(string.ascii_letters + " .,\n" * 4, k=size)).encode()
+    for name, cipher in [("caesar", Caesar(3)), ("rot13", ROT13()), ("affine", Affine(5, 8)),
+                         ("vigenere", Vigenere("LEMON"))]:
+        start = time.perf_counter()
+        encrypted = cipher.encrypt(data)
+        elapsed = time.perf_counter() - start
+        assert cipher.decrypt(encrypted) == data
+        print(f"{name:<20}{size / 1e6 / elapsed:>10.1f} MB/s", flush=True)
+    if np is not None:
+        start = time.perf_counter()
+        result, _ = _vigenere_tables(data, cipher._tables, 0)
+        elapsed = time.perf_counter() - start
+        assert result == encrypted
+        print(f"{'vigenere (no NumPy)':<20}{size / 1e6 / elapsed:>10.1f} MB/s", flush=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Encrypt or decrypt a stream with a classical cipher.")
+    parser.add_argument("cipher", nargs="?", choices=CIPHERS)
+    parser.add_argument("mode", nargs="?", choices=("encrypt", "decrypt"))
+    parser.add_argument("--key", help='Shift for caesar, "a,b" for affine, a key word for vigenere.')
+    parser.add_argument("-i", "--input", help="File to read (default: stdin).")
+    parser.add_argument("-o", "--output", help="File to write (default: stdout).")
+    parser.add_argument("--buffer-size", type=int, default=CHUNK_SIZE, help="Bytes per chunk.")
+    parser.add_argument("--benchmark", action="store_true", help="Measure the throughput of each cipher.")
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        benchmark()
+        return
+    if args.cipher is None or args.mode is None:
+        parser.error("a cipher and a mode are required")
+    try:
+        cipher = make_cipher(args.cipher, args.key)
+    except ValueError as error:
+        parser.error(str(error))
+
+    source = open(args.input, 'rb') if args.input else sys.stdin.buffer
+    target = open(args.output, 'wb') if args.output else sys.stdout.buffer
+    try:
+        if args.mode == "encrypt":
+            cipher.encrypt_stream(source, target, args.buffer_size)
+        else:
+            cipher.decrypt_stream(source, target, args.buffer_size)
+    finally:
+        if args.input:
+            source.close()
+        if args.output:
+            target.close()
+        else:
+            target.flush()
+
+
+if __name__ == "__main__":
+    main()
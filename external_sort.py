@@ -0,0 +1,221 @@
+"""
+External (out-of-core) merge sort for numeric text files larger than memory.
+
+The input has one number per line. Sorting happens in two phases:
+
+1. Runs: the input is read in runs of at most run_size numbers, each run is
+   sorted in memory and spilled to a temporary file as raw 64-bit values
+   (array.tofile), which is compact and needs no parsing when read back.
+2. Merge: the runs are merged k at a time, the way MergeSort.combine merges
+   two lists, but with a heap over k buffered streaming readers. If there
+   are more runs than fan_in, intermediate merge passes combine them into
+   longer runs (still in binary) until one last pass writes the text output.
+
+Memory use is bounded by memory_limit: it decides the run size and how large
+the read buffers of the merge may be. Progress and throughput are reported
+on stderr while sorting.
+
+Usage:
+------
+    python external_sort.py numbers.txt sorted.txt --memory 2G --fan-in 64 --tmp-dir /scratch
+    python external_sort.py measurements.txt sorted.txt --type float
+"""
+import argparse
+import heapq
+import os
+import sys
+import tempfile
+import time
+from array import array
+
+from byte_sizes import parse_size
+
+TYPES = {"int": ('q', int), "float": ('d', float)}
+BYTES_PER_ITEM = 64  # rough memory per number while a run is parsed and sorted in a list
+DEFAULT_MEMORY = 256 * 2 ** 20
+DEFAULT_FAN_IN = 64
+OUTPUT_BATCH = 8192  # numbers formatted per write
+PROGRESS_INTERVAL = 1.0  # seconds between progress lines
+
+
+class _Progress:
+    """Prints throughput lines on stderr at most every PROGRESS_INTERVAL seconds."""
+
+    def __init__(self, total_bytes, stream=sys.stderr, enabled=True):
+        self.total_bytes = total_bytes
+        self.stream = stream
+        self.enabled = enabled
+        self.start = self.last = time.perf_counter()
+
+    def update(self, phase, items, done_bytes=None, force=False):
+        now = time.perf_counter()
+        if not self.enabled or (not force and now - self.last < PROGRESS_INTERVAL):
+            return
+        self.last = now
+        elapsed = max(now - self.start, 1e-9)
+        line = f"{phase}: {items:,} numbers, {items / elapsed:,.0f}/s"
+        if done_bytes is not None and self.total_bytes:
+            line += f", {done_bytes / self.total_bytes:.0%} of input ({done_bytes / elapsed / 2 ** 20:.1f} MiB/s)"
+        print(line, file=self.stream, flush=True)
+
+
+def _read_run(path, typecode, buffer_items):
+    """
+    Streams the numbers of a binary run file, buffer_items at a time.
+    """
+    itemsize = array(typecode).itemsize
+    with open(path, 'rb', buffering=0) as run:
+        while True:
+            data = run.read(buffer_items * itemsize)
+            if not data:
+                return
+            chunk = array(typecode)
+            chunk.frombytes(data)
+            yield from chunk
+
+
+def _write_binary(numbers, path, typecode, batch):
+    """Writes a stream of numbers to a binary run file in batches. Returns the count."""
+    count = 0
+    buffer = array(typecode)
+    with open(path, 'wb') as run:
+        for number in numbers:
+            buffer.append(number)
+            if len(buffer) >= batch:
+                buffer.tofile(run)
+                count += len(buffer)
+                del buffer[:]
+        buffer.tofile(run)
+        count += len(buffer)
+    return count
+
+
+def _make_runs(source, directory, typecode, parse, run_size, progress):
+    """
+    Phase 1: reads sorted runs of at most run_size numbers and spills them to disk.
+
+    Returns:
+        tuple: (list of run file paths, number of numbers read).
+    """
+    runs = []
+    total = 0
+    done_bytes = 0
+    run = []
+    for line in source:
+        done_bytes += len(line)
+        if line.strip():
+            run.append(parse(line))
+        if len(run) >= run_size:
+            runs.append(_spill(run, directory, typecode, len(runs)))
+            total += len(run)
+            run = []
+            progress.update("runs", total, done_bytes)
+    if run or not runs:
+        runs.append(_spill(run, directory, typecode, len(runs)))
+        total += len(run)
+    progress.update("runs", total, done_bytes, force=True)
+    return runs, total
+
+
+def _spill(run, directory, typecode, index):
+    """Sorts one run in memory and writes it to a binary file. Returns the file path."""
+    run.sort()
+    path = os.path.join(directory, f"run-{index:06d}.bin")
+    with open(path, 'wb') as target:
+        array(typecode, run).tofile(target)
+    return path
+
+
+def external_sort(input_path, output_path, number_type="int", memory_limit=DEFAULT_MEMORY,
+                  run_size=None, fan_in=DEFAULT_FAN_IN, tmp_dir=None, progress=True):
+    """
+    Sorts a text file of numbers (one per line) that may not fit in memory.
+
+    Parameters:
+        input_path (str): The file to sort.
+        output_path (str): Where to write the sorted numbers, one per line.
+        number_type (str): "int" (64-bit signed) or "float".
+        memory_limit (int): Approximate bytes of memory to use.
+        run_size (int): Numbers per in-memory run; derived from memory_limit when None.
+        fan_in (int): Maximum number of runs merged at once.
+        tmp_dir (str): Directory for the run files (default: the system temp dir).
+        progress (bool): Report progress and throughput on stderr.
+
+    Returns:
+        dict: Statistics: numbers, runs, merge_passes, seconds.
+    """
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+    typecode, parse = TYPES[number_type]
+    itemsize = array(typecode).itemsize
+    run_size = run_size or max(1024, memory_limit // BYTES_PER_ITEM)
+    # Each input of a merge gets an equal share of the memory as its read buffer.
+    buffer_items = max(1024, memory_limit // (2 * (fan_in + 1) * itemsize))
+    reporter = _Progress(os.path.getsize(input_path), enabled=progress)
+
+    with tempfile.TemporaryDirectory(prefix="external-sort-", dir=tmp_dir) as directory:
+        with open(input_path, 'r', buffering=2 ** 20) as source:
+            runs, total = _make_runs(source, directory, typecode, parse, run_size, reporter)
+        n_runs = len(runs)
+
+        passes = 0
+        while len(runs) > fan_in:
+            passes += 1
+            merged_runs = []
+            for group_start in range(0, len(runs), fan_in):
+                group = runs[group_start:group_start + fan_in]
+                path = os.path.join(directory, f"pass-{passes:02d}-{group_start // fan_in:06d}.bin")
+                _write_binary(heapq.merge(*(_read_run(run, typecode, buffer_items) for run in group)),
+                              path, typecode, buffer_items)
+                for run in group:
+                    os.remove(run)
+                merged_runs.append(path)
+                reporter.update(f"merge pass {passes}", total)
+            runs = merged_runs
+
+        written = 0
+        with open(output_path, 'w', buffering=2 ** 20) as target:
+            merged = heapq.merge(*(_read_run(run, typecode, buffer_items) for run in runs))
+            batch = []
+            for number in merged:
+                batch.append(number)
+                if len(batch) >= OUTPUT_BATCH:
+                    target.write("\n".join(map(str, batch)))
+                    target.write("\n")
+                    written += len(batch)
+                    batch.clear()
+                    reporter.update("final merge", written)
+            if batch:
+                target.write("\n".join(map(str, batch)))
+                target.write("\n")
+                written += len(batch)
+        reporter.update("final merge", written, force=True)
+
+    seconds = time.perf_counter() - reporter.start
+    return {"numbers": total, "runs": n_runs, "merge_passes": passes + 1, "seconds": seconds}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sort a file of numbers (one per line) that may not fit in memory.")
+    parser.add_argument("input", help="Text file with one number per line.")
+    parser.add_argument("output", help="Where to write the sorted numbers.")
+    parser.add_argument("--type", choices=sorted(TYPES), default="int", help="Number type (default: int).")
+    parser.add_argument("--memory", type=parse_size, default=DEFAULT_MEMORY, help="Memory limit, e.g. 512M or 2G.")
+    parser.add_argument("--run-size", type=int, help="Numbers per sorted run (default: from --memory).")
+    parser.add_argument("--fan-in", type=int, default=DEFAULT_FAN_IN, help="Runs merged at once.")
+    parser.add_argument("--tmp-dir", help="Directory for temporary run files.")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Do not report progress.")
+    args = parser.parse_args(argv)
+
+    stats = external_sort(args.input, args.output, args.type, args.memory, args.run_size,
+                          args.fan_in, args.tmp_dir, not args.quiet)
+    size = os.path.getsize(args.input)
+    seconds = stats["seconds"]
+    rate = stats["numbers"] / seconds if seconds > 0 else 0.0
+    print(f"Sorted {stats['numbers']:,} numbers from {stats['runs']} runs in {stats['merge_passes']} merge "
+          f"pass(es), {seconds:.2f}s ({rate:,.0f} numbers/s, {size / max(seconds, 1e-9) / 2 ** 20:.1f} MiB/s)",
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,350 @@
 """
-Prompts the user to enter space-separated numbers, then sorts them using
-the insertion sort algorithm while visualizing each step with a bar chart.
+Sorts numbers using the insertion sort algorithm and its variants.
+
+insertion_sort(numbers) sorts a list in place with no visualization overhead.
+insertion_sort_steps(numbers) does the same but yields a step event for every
+comparison and write, which the sort_visualizer functions turn into an animation.
+
+Two variants are available as modes, each with a steps generator too:
+
+- "binary": binary_insertion_sort finds each insertion point with bisect,
+  so it makes O(n log n) comparisons, and shifts the tail with one slice
+  assignment instead of one element at a time.
+- "shell": shell_sort runs gapped insertion sorts over a shrinking gap
+  sequence (Ciura's, extended by a factor of 2.25 for large lists), which
+  moves far-away elements early and is much faster than plain insertion.
+
+SortedReadings is the online form: numbers are inserted one at a time with
+bisect.insort as they arrive, and order statistics (min, max, median,
+percentiles) can be read at any moment.
+
+Run as a script, it prompts the user to enter space-separated numbers, then
+sorts them while visualizing each step with a bar chart drawn by
+sort_visualizer.animate_sort. Pass an .mp4 or .gif path to save the animation
+instead of showing it. With --online it reads numbers from a file or stdin
+instead and prints the order statistics as they stream in.
 
 Visualization:
 - Sky blue bars show the list at each step of the sorting process.
 - Green bars represent the fully sorted list at the end.
+
+Usage:
+------
+    python insertion_sort.py --mode shell
+    python insertion_sort.py --mode binary insertion.gif
+    tail -f readings.log | python insertion_sort.py --online --report-every 100
+    python insertion_sort.py --online readings.txt --percentiles 5 50 95
 """
+import bisect
+import sys
+
+# Ciura's experimentally best gaps, largest first
+CIURA_GAPS = (1750, 701, 301, 132, 57, 23, 10, 4, 1)
+
+
+def insertion_sort(numbers):
+    """
+    Sorts a list in place using insertion sort.
+
+    Parameters:
+        numbers (list): A list of comparable elements.
+
+    Returns:
+        list: The same list, sorted in ascending order.
+    """
+    for i in range(1, len(numbers)):
+        key = numbers[i]
+        j = i - 1
+        while j >= 0 and numbers[j] > key:
+            numbers[j + 1] = numbers[j]
+            j -= 1
+        numbers[j + 1] = key
+    return numbers
+
+
+def insertion_sort_steps(numbers):
+    """
+    Sorts a list in place using insertion sort, yielding each step.
+
+    Parameters:
+        numbers (list): A list of comparable elements.
+
+    Yields:
+        tuple: ("compare", j, i) for each comparison with the key taken from
+        position i, and ("set", index, value) for each element shifted or inserted.
+    """
+    for i in range(1, len(numbers)):
+        key = numbers[i]
+        j = i - 1
+        while j >= 0:
+            yield "compare", j, i
+            if numbers[j] <= key:
+                break
+            numbers[j + 1] = numbers[j]
+            yield "set", j + 1, numbers[j]
+            j -= 1
+        if j + 1 != i:
+            numbers[j + 1] = key
+            yield "set", j + 1, key
+
+
+def binary_insertion_sort(numbers):
+    """
+    Sorts a list in place using insertion sort with a binary search for each position.
+
+    bisect_right puts a key after the equal elements already placed, so the
+    sort is stable like insertion_sort.
+
+    Parameters:
+        numbers (list): A list of comparable elements.
+
+    Returns:
+        list: The same list, sorted in ascending order.
+    """
+    for i in range(1, len(numbers)):
+        key = numbers[i]
+        position = bisect.bisect_right(numbers, key, 0, i)
+        if position != i:
+            numbers[position + 1:i + 1] = numbers[position:i]
+            numbers[position] = key
+    return numbers
+
+
+def binary_insertion_sort_steps(numbers):
+    """
+    Sorts a list in place using binary insertion sort, yielding each step.
+
+    Yields:
+        tuple: ("compare", middle, i) for each probe of the binary search for
+        the key taken from position i, and ("set", index, value) for each
+        element shifted or inserted.
+    """
+    for i in range(1, len(numbers)):
+        key = numbers[i]
+        low, high = 0, i
+        while low < high:
+            middle = (low + high) // 2
+            yield "compare", middle, i
+            if key < numbers[middle]:
+                high = middle
+            else:
+                low = middle + 1
+        if low != i:
+            for j in range(i, low, -1):
+                numbers[j] = numbers[j - 1]
+                yield "set", j, numbers[j]
+            numbers[low] = key
+            yield "set", low, key
+
+
+def shell_gaps(n):
+    """
+    Returns the gap sequence shell_sort uses for a list of n elements.
+
+    Parameters:
+        n (int): The length of the list.
+
+    Returns:
+        list: Gaps smaller than n in decreasing order, ending with 1.
+    """
+    gaps = list(CIURA_GAPS)
+    while gaps[0] * 2.25 < n:
+        gaps.insert(0, int(gaps[0] * 2.25))
+    return [gap for gap in gaps if gap < n] or [1]
+
+
+def shell_sort(numbers, gaps=None):
+    """
+    Sorts a list in place using Shell sort.
+
+    Parameters:
+        numbers (list): A list of comparable elements.
+        gaps (list): Decreasing gaps ending with 1; shell_gaps(len(numbers)) if None.
+
+    Returns:
+        list: The same list, sorted in ascending order.
+    """
+    for gap in gaps or shell_gaps(len(numbers)):
+        for i in range(gap, len(numbers)):
+            key = numbers[i]
+            j = i - gap
+            while j >= 0 and numbers[j] > key:
+                numbers[j + gap] = numbers[j]
+                j -= gap
+            numbers[j + gap] = key
+    return numbers
+
+
+def shell_sort_steps(numbers, gaps=None):
+    """
+    Sorts a list in place using Shell sort, yielding each step.
+
+    Yields:
+        tuple: ("compare", j, i) for each comparison with the key taken from
+        position i, and ("set", index, value) for each element shifted or inserted.
+    """
+    for gap in gaps or shell_gaps(len(numbers)):
+        for i in range(gap, len(numbers)):
+            key = numbers[i]
+            j = i - gap
+            while j >= 0:
+                yield "compare", j, i
+                if numbers[j] <= key:
+                    break
+                numbers[j + gap] = numbers[j]
+                yield "set", j + gap, numbers[j]
+                j -= gap
+            if j + gap != i:
+                numbers[j + gap] = key
+                yield "set", j + gap, key
+
+
+# mode: (sort function, steps generator)
+MODES = {
+    "linear": (insertion_sort, insertion_sort_steps),
+    "binary": (binary_insertion_sort, binary_insertion_sort_steps),
+    "shell": (shell_sort, shell_sort_steps),
+}
+
+
+class SortedReadings:
+    """
+    Keeps numbers in sorted order as they arrive and answers order statistics.
+
+    Each add is a binary search plus one memmove of the items after the
+    insertion point (bisect.insort), which stays in the microseconds for up
+    to a few hundred thousand readings. Every statistic is read straight off the sorted
+    list, in O(1).
+    """
+
+    def __init__(self, values=()):
+        self.values = sorted(values)
+
+    def add(self, value):
+        """Inserts one number, keeping the readings sorted."""
+        bisect.insort(self.values, value)
+
+    def extend(self, values):
+        """Inserts several numbers."""
+        for value in values:
+            bisect.insort(self.values, value)
+
+    def __len__(self):
+        return len(self.values)
+
+    def min(self):
+        return self.values[0]
+
+    def max(self):
+        return self.values[-1]
+
+    def percentile(self, p):
+        """
+        Returns the p-th percentile, interpolating linearly between the closest ranks.
+
+        Parameters:
+            p (float): A percentage from 0 to 100.
+
+        Raises:
+            ValueError: If there are no readings yet or p is out of range.
+        """
+        if not self.values:
+            raise ValueError("No readings yet")
+        if not 0 <= p <= 100:
+            raise ValueError("The percentile must be between 0 and 100")
+        position = (len(self.values) - 1) * p / 100
+        lower = int(position)
+        if lower + 1 == len(self.values):
+            return self.values[lower]
+        fraction = position - lower
+        return self.values[lower] + (self.values[lower + 1] - self.values[lower]) * fraction
+
+    def median(self):
+        return self.percentile(50)
+
+    def rank(self, value):
+        """Returns how many readings are less than or equal to value."""
+        return bisect.bisect_right(self.values, value)
+
+    def summary(self, percentiles=(25, 50, 75)):
+        """
+        Returns a one-line report of the count, min, max and the given percentiles.
+        """
+        if not self.values:
+            return "count=0"
+        parts = [f"count={len(self.values)}", f"min={self.min():g}", f"max={self.max():g}"]
+        parts += [f"p{p:g}={self.percentile(p):g}" for p in percentiles]
+        return " ".join(parts)
+
+
+def _parse_number(text):
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def stream_readings(source, readings=None, report_every=0, percentiles=(25, 50, 75), out=None):
+    """
+    Adds the numbers read from a text stream to a SortedReadings as they arrive.
+
+    Numbers are separated by whitespace. A "?" in the stream prints the current
+    statistics immediately, and so does every report_every-th number.
 
+    Parameters:
+        source (file): An open text file or sys.stdin.
+        readings (SortedReadings): Where to add the numbers; a new one if None.
+        report_every (int): Print the statistics every this many numbers (0: only on "?").
+        percentiles (tuple): The percentiles included in each report.
+        out (file): Where reports go (default: stdout).
 
-import matplotlib.pyplot as plt
+    Returns:
+        SortedReadings: The readings, including everything read.
+    """
+    readings = SortedReadings() if readings is None else readings
+    out = out or sys.stdout
+    for line in source:
+        for token in line.split():
+            if token == "?":
+                print(readings.summary(percentiles), file=out, flush=True)
+                continue
+            try:
+                readings.add(_parse_number(token))
+            except ValueError:
+                print(f"Skipping {token!r}: not a number", file=sys.stderr)
+                continue
+            if report_every and len(readings) % report_every == 0:
+                print(readings.summary(percentiles), file=out, flush=True)
+    return readings
 
-numbers = input('Enter numbers and split it with space: ').split()
-numbers = list(map(int, numbers))
-n = len(numbers)
 
-for i in range(1, n):
-    key = numbers[i]
-    j = i - 1
+if __name__ == "__main__":
+    import argparse
 
-    while j >= 0 and numbers[j] > key:
-        numbers[j + 1] = numbers[j]
-        j -= 1
-    numbers[j + 1] = key
-    plt.bar(range(n), numbers, color='skyblue')
-    plt.pause(0.5)
-    plt.clf()
+    parser = argparse.ArgumentParser(description="Visualize insertion sort, or keep streamed numbers sorted.")
+    parser.add_argument("save", nargs="?", help="An .mp4 or .gif path to save the animation to instead of showing it.")
+    parser.add_argument("--mode", choices=MODES, default="linear", help="The insertion sort variant to visualize.")
+    parser.add_argument("--online", nargs="?", const="-", metavar="FILE",
+                        help="Read numbers from FILE (default: stdin) and report order statistics.")
+    parser.add_argument("--report-every", type=int, default=0, metavar="N",
+                        help="With --online, print the statistics every N numbers.")
+    parser.add_argument("--percentiles", type=float, nargs="+", default=[25, 50, 75],
+                        help="With --online, the percentiles to report.")
+    args = parser.parse_args()
 
-plt.bar(range(n), numbers, color='green')
-plt.show()
+    if args.online is not None:
+        if args.online == "-":
+            readings = stream_readings(sys.stdin, None, args.report_every, args.percentiles)
+        else:
+            with open(args.online) as source:
+                readings = stream_readings(source, None, args.report_every, args.percentiles)
+        print(readings.summary(args.percentiles))
+    else:
+        from sort_visualizer import animate_sort
 
-print("Sorted numbers:", numbers)
\ No newline at end of file
+        numbers = input('Enter numbers and split it with space: ').split()
+        numbers = list(map(int, numbers))
+        steps = MODES[args.mode][1](numbers)
+        title = {"linear": "Insertion sort", "binary": "Binary insertion sort", "shell": "Shell sort"}[args.mode]
+        animate_sort(numbers, steps, fps=2, save=args.save, title=title)
+        print("Sorted numbers:", numbers)
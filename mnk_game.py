@@ -0,0 +1,352 @@
+"""
+Generalized m,n,k-game engine: Tic-Tac-Toe on any board, e.g. 7x7 with four in
+a row or 15x15 gomoku (five in a row).
+
+MNKGame keeps the board as a flat list of cells and updates everything
+incrementally as moves are played and undone:
+
+- win detection only walks the four lines through the last move,
+- every length-k window of the board has a running stone count per player,
+  which gives an O(1) heuristic evaluation,
+- a Zobrist hash identifies positions for the transposition table.
+
+search_move picks a move with depth-limited negamax and alpha-beta pruning,
+iterative deepening and a per-move time budget. Moves are ordered by the
+transposition-table move of the previous iteration, then by a history
+heuristic, and only cells next to existing stones are considered.
+"""
+import random
+import time
+
+DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+_geometries = {}
+_zobrist_rng = random.Random(20250713)
+_zobrist = {}
+
+
+def _geometry(rows, cols, k):
+    """
+    Returns the cached (windows, windows_of_cell, neighbours) tables for a board shape.
+
+    windows is a list of the cell tuples of every length-k line segment,
+    windows_of_cell[cell] the indices of the windows that contain cell and
+    neighbours[cell] the cells around it (distance 1, all eight directions).
+    """
+    key = (rows, cols, k)
+    if key not in _geometries:
+        windows = []
+        for row in range(rows):
+            for col in range(cols):
+                for d_row, d_col in DIRECTIONS:
+                    end_row, end_col = row + d_row * (k - 1), col + d_col * (k - 1)
+                    if 0 <= end_row < rows and 0 <= end_col < cols:
+                        windows.append(tuple((row + d_row * i) * cols + col + d_col * i for i in range(k)))
+        windows_of_cell = [[] for _ in range(rows * cols)]
+        for index, window in enumerate(windows):
+            for cell in window:
+                windows_of_cell[cell].append(index)
+        neighbours = []
+        for row in range(rows):
+            for col in range(cols):
+                neighbours.append(tuple(
+                    r * cols + c
+                    for r in range(max(0, row - 1), min(rows, row + 2))
+                    for c in range(max(0, col - 1), min(cols, col + 2))
+                    if (r, c) != (row, col)
+                ))
+        _geometries[key] = (windows, windows_of_cell, neighbours)
+    return _geometries[key]
+
+
+def _zobrist_keys(n_cells):
+    """Returns two lists of random 64-bit keys per cell, one per player."""
+    if n_cells not in _zobrist:
+        _zobrist[n_cells] = tuple([_zobrist_rng.getrandbits(64) for _ in range(n_cells)] for _ in range(2))
+    return _zobrist[n_cells]
+
+
+class MNKGame:
+    """
+    An m x n board where the first player to get k in a row wins.
+
+    Players are 0 and 1; player 0 moves first. Cells are numbered row by row,
+    cell = row * cols + col.
+    """
+
+    def __init__(self, rows=3, cols=3, k=3, marks=("X", "O")):
+        """
+        Parameters:
+            rows (int), cols (int): Board size.
+            k (int): Number in a row needed to win.
+            marks (tuple): The marks shown for player 0 and player 1.
+        """
+        if not 1 <= k <= max(rows, cols):
+            raise ValueError(f"k must be between 1 and {max(rows, cols)}, got {k}")
+        self.rows, self.cols, self.k = rows, cols, k
+        self.marks = marks
+        self.cells = [-1] * (rows * cols)  # -1 for empty, otherwise the player index
+        self.moves = []
+        self.winner = None
+        self.hash = 0
+        self.windows, self.windows_of_cell, self.neighbours = _geometry(rows, cols, k)
+        self._zobrist = _zobrist_keys(rows * cols)
+        self._counts = ([0] * len(self.windows), [0] * len(self.windows))
+        self._weights = [0] + [10 ** n for n in range(1, k)] + [0]
+        self.score = 0  # heuristic value for player 0
+
+    @property
+    def to_move(self):
+        """The index of the player whose turn it is."""
+        return len(self.moves) % 2
+
+    def is_full(self):
+        return len(self.moves) == len(self.cells)
+
+    def is_over(self):
+        return self.winner is not None or self.is_full()
+
+    def legal_moves(self):
+        return [cell for cell, owner in enumerate(self.cells) if owner < 0]
+
+    def play(self, cell):
+        """
+        Plays a move for the player to move.
+
+        Parameters:
+            cell (int): The empty cell to take.
+
+        Returns:
+            bool: True if the move wins the game.
+        """
+        player = len(self.moves) % 2
+        own, other = self._counts[player], self._counts[1 - player]
+        weights = self._weights
+        sign = 1 if player == 0 else -1
+        delta = 0
+        for window in self.windows_of_cell[cell]:
+            if other[window]:
+                # Blocks the opponent's window: it no longer counts for them.
+                if not own[window]:
+                    delta += weights[other[window]]
+            else:
+                delta += weights[own[window] + 1] - weights[own[window]]
+            own[window] += 1
+        self.score += sign * delta
+        self.cells[cell] = player
+        self.hash ^= self._zobrist[player][cell]
+        self.moves.append(cell)
+        if self.check_winner(cell):
+            self.winner = player
+            return True
+        return False
+
+    def undo(self):
+        """Takes back the last move."""
+        cell = self.moves.pop()
+        player = self.cells[cell]
+        own, other = self._counts[player], self._counts[1 - player]
+        weights = self._weights
+        sign = 1 if player == 0 else -1
+        delta = 0
+        for window in self.windows_of_cell[cell]:
+            own[window] -= 1
+            if other[window]:
+                if not own[window]:
+                    delta += weights[other[window]]
+            else:
+                delta += weights[own[window] + 1] - weights[own[window]]
+        self.score -= sign * delta
+        self.cells[cell] = -1
+        self.hash ^= self._zobrist[player][cell]
+        self.winner = None
+
+    def check_winner(self, cell):
+        """
+        Checks if the stone on cell completes k in a row.
+
+        Only the four lines through cell are walked, so this is O(k)
+        regardless of the board size.
+
+        Returns:
+            bool: True if the owner of cell has k in a row through it.
+        """
+        player = self.cells[cell]
+        if player < 0:
+            return False
+        row, col = divmod(cell, self.cols)
+        for d_row, d_col in DIRECTIONS:
+            count = 1
+            for sign in (1, -1):
+                r, c = row + sign * d_row, col + sign * d_col
+                while 0 <= r < self.rows and 0 <= c < self.cols and self.cells[r * self.cols + c] == player:
+                    count += 1
+                    r += sign * d_row
+                    c += sign * d_col
+            if count >= self.k:
+                return True
+        return False
+
+    def candidate_moves(self):
+        """
+        Returns the empty cells next to an existing stone (or the center on an empty board).
+        """
+        if not self.moves:
+            return [(self.rows // 2) * self.cols + self.cols // 2]
+        cells = self.cells
+        seen = set()
+        for cell in self.moves:
+            for neighbour in self.neighbours[cell]:
+                if cells[neighbour] < 0:
+                    seen.add(neighbour)
+        return list(seen) if seen else self.legal_moves()
+
+    def to_board(self):
+        """
+        Returns the board as a list of rows of marks, with " " for empty cells.
+        """
+        marks = self.marks
+        return [[marks[owner] if owner >= 0 else " " for owner in self.cells[row * self.cols:(row + 1) * self.cols]]
+                for row in range(self.rows)]
+
+
+def check_winner(board, player, k=3, last_move=None):
+    """
+    Checks if the player has k in a row on a list-of-lists board of any size.
+
+    Parameters:
+        board (list): A list of rows of marks.
+        player (str): The mark to check.
+        k (int): Number in a row needed to win.
+        last_move (tuple): Optional (row, col) of the latest move. When given,
+            only the lines through it are checked.
+
+    Returns:
+        bool: True if the player has won, False otherwise.
+    """
+    rows, cols = len(board), len(board[0])
+    if last_move is not None:
+        starts = [last_move]
+    else:
+        starts = [(r, c) for r in range(rows) for c in range(cols)]
+    for row, col in starts:
+        if board[row][col] != player:
+            continue
+        for d_row, d_col in DIRECTIONS:
+            count = 1
+            for sign in (1, -1):
+                r, c = row + sign * d_row, col + sign * d_col
+                while 0 <= r < rows and 0 <= c < cols and board[r][c] == player:
+                    count += 1
+                    r += sign * d_row
+                    c += sign * d_col
+            if count >= k:
+                return True
+    return False
+
+
+class _Timeout(Exception):
+    """Raised inside the search when the time budget is used up."""
+
+
+_EXACT, _LOWER, _UPPER = 0, 1, 2
+
+
+class _Search:
+    """State of one search_move call: deadline, transposition table and history scores."""
+
+    def __init__(self, game, deadline):
+        self.game = game
+        self.deadline = deadline
+        self.win_score = 10 ** (game.k + 2)
+        self.table = {}
+        self.history = {}
+        self.nodes = 0
+
+    def ordered_moves(self, tt_move):
+        moves = self.game.candidate_moves()
+        history = self.history
+        moves.sort(key=lambda cell: history.get(cell, 0), reverse=True)
+        if tt_move is not None and tt_move in moves:
+            moves.remove(tt_move)
+            moves.insert(0, tt_move)
+        return moves
+
+    def negamax(self, depth, alpha, beta, ply):
+        """
+        Returns the value of the position for the player to move, searched depth plies deep.
+        """
+        self.nodes += 1
+        if self.nodes & 255 == 0 and time.perf_counter() > self.deadline:
+            raise _Timeout()
+        game = self.game
+        if depth == 0:
+            return game.score if game.to_move == 0 else -game.score
+
+        entry = self.table.get(game.hash)
+        tt_move = None
+        if entry is not None:
+            entry_depth, value, flag, tt_move = entry
+            if entry_depth >= depth and (flag == _EXACT or (flag == _LOWER and value >= beta)
+                                         or (flag == _UPPER and value <= alpha)):
+                return value
+
+        original_alpha = alpha
+        best, best_move = -self.win_score * 2, None
+        for cell in self.ordered_moves(tt_move):
+            if game.play(cell):
+                score = self.win_score - ply
+            elif game.is_full():
+                score = 0
+            else:
+                score = -self.negamax(depth - 1, -beta, -alpha, ply + 1)
+            game.undo()
+            if score > best:
+                best, best_move = score, cell
+            if best > alpha:
+                alpha = best
+            if alpha >= beta:
+                self.history[cell] = self.history.get(cell, 0) + depth * depth
+                break
+
+        flag = _UPPER if best <= original_alpha else _LOWER if best >= beta else _EXACT
+        self.table[game.hash] = (depth, best, flag, best_move)
+        return best
+
+
+def search_move(game, max_depth=None, time_budget=1.0):
+    """
+    Chooses a move for the player to move with iterative-deepening alpha-beta search.
+
+    Each iteration searches one ply deeper than the last, reusing its
+    transposition table for move ordering. When the time budget runs out the
+    best move of the last completed iteration is returned.
+
+    Parameters:
+        game (MNKGame): The position; it is restored before returning.
+        max_depth (int): Optional depth limit in plies.
+        time_budget (float): Seconds allowed for this move.
+
+    Returns:
+        int: The chosen cell.
+    """
+    search = _Search(game, time.perf_counter() + time_budget)
+    moves = search.ordered_moves(None)
+    best_move = moves[0]
+    limit = len(game.cells) - len(game.moves)
+    if max_depth is not None:
+        limit = min(limit, max_depth)
+    depth = 1
+    while depth <= limit:
+        moves_played = len(game.moves)
+        try:
+            value = search.negamax(depth, -search.win_score * 2, search.win_score * 2, 1)
+        except _Timeout:
+            while len(game.moves) > moves_played:
+                game.undo()
+            break
+        best_move = search.table[game.hash][3]
+        if abs(value) >= search.win_score - len(game.cells):
+            break  # forced win or loss found; deeper search cannot change it
+        depth += 1
+    return best_move
@@ -0,0 +1,277 @@
+"""
+Benchmark suite for the sorting scripts, with operation counters.
+
+Every algorithm is imported headlessly from its script and run over standard
+input distributions at growing sizes. Each (algorithm, distribution, n) cell
+is measured three times, so the instruments do not distort each other:
+
+1. wall time on plain ints (best of --repeat runs, garbage collector off),
+2. comparisons and writes, with the values wrapped in Counted (which counts
+   every <, <=, >, >=) inside a CountingList (which counts every item or slice
+   assignment); algorithms that sort into lists of their own, like the merge
+   sorts, report no write count,
+3. peak memory allocated during the sort, with tracemalloc.
+
+Results go to a table on stdout and optionally to CSV and JSON. A JSON file
+from an earlier run can be passed as --baseline: any cell that got slower or
+hungrier than --tolerance allows, or that makes more comparisons or writes
+(these are deterministic for a given seed), is reported as a regression and
+the exit status is 1, so the suite can gate a CI job. Timings are noisy on
+shared machines, hence the generous default tolerance; the counters are exact.
+
+Usage:
+------
+    python sort_benchmark.py --sizes 100 1000 --json baseline.json
+    python sort_benchmark.py --sizes 100 1000 --baseline baseline.json --tolerance 0.3
+    python sort_benchmark.py --algorithms merge_sort sorted --sizes 10000 100000 --csv results.csv
+"""
+import argparse
+import csv
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+
+from Bubble_sort import bubble_sort
+from MergeSort import merge, merge_sort
+from Selection_sort import selection_sort
+from insertion_sort import binary_insertion_sort, insertion_sort, shell_sort
+
+# name: (function, in place, largest n it is run at by default)
+ALGORITHMS = {
+    "bubble": (bubble_sort, True, 2000),
+    "selection": (selection_sort, True, 2000),
+    "insertion": (insertion_sort, True, 2000),
+    "binary_insertion": (binary_insertion_sort, True, 10 ** 5),
+    "shell": (shell_sort, True, 10 ** 6),
+    "merge": (merge, False, 10 ** 6),
+    "merge_sort": (merge_sort, False, 10 ** 6),
+    "sorted": (sorted, False, 10 ** 7),
+}
+
+FIELDS = ("algorithm", "distribution", "n", "seconds", "comparisons", "writes", "peak_bytes")
+
+
+def _nearly_sorted(n, rng):
+    values = list(range(n))
+    for _ in range(max(1, n // 100)):
+        i, j = rng.randrange(n), rng.randrange(n)
+        values[i], values[j] = values[j], values[i]
+    return values
+
+
+DISTRIBUTIONS = {
+    "random": lambda n, rng: [rng.randrange(n * 10) for _ in range(n)],
+    "sorted": lambda n, rng: list(range(n)),
+    "reversed": lambda n, rng: list(range(n, 0, -1)),
+    "few-unique": lambda n, rng: [rng.randrange(8) for _ in range(n)],
+    "nearly-sorted": lambda n, rng: _nearly_sorted(n, rng) if n else [],
+}
+
+
+class Counter:
+    """A mutable tally shared by the Counted values and the CountingList of one run."""
+
+    def __init__(self):
+        self.comparisons = 0
+        self.writes = 0
+
+
+class Counted:
+    """Wraps a value and counts every ordering comparison made on it."""
+
+    __slots__ = ("value", "counter")
+
+    def __init__(self, value, counter):
+        self.value = value
+        self.counter = counter
+
+    def __lt__(self, other):
+        self.counter.comparisons += 1
+        return self.value < other.value
+
+    def __le__(self, other):
+        self.counter.comparisons += 1
+        return self.value <= other.value
+
+    def __gt__(self, other):
+        self.counter.comparisons += 1
+        return self.value > other.value
+
+    def __ge__(self, other):
+        self.counter.comparisons += 1
+        return self.value >= other.value
+
+
+class CountingList(list):
+    """A list that counts the items written into it by index or slice assignment."""
+
+    def __init__(self, items, counter):
+        super().__init__(items)
+        self.counter = counter
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            self.counter.writes += len(value)
+        else:
+            self.counter.writes += 1
+        super().__setitem__(index, value)
+
+
+def measure(name, values, repeat=1):
+    """
+    Measures one algorithm on one input.
+
+    Parameters:
+        name (str): A key of ALGORITHMS.
+        values (list): The input; it is not modified.
+        repeat (int): Timed runs; the best is kept.
+
+    Returns:
+        dict: A result row with the keys in FIELDS (minus algorithm, distribution and n).
+    """
+    function, in_place, _ = ALGORITHMS[name]
+    expected = sorted(values)
+
+    best = float("inf")
+    for _ in range(repeat):
+        data = values[:]
+        gc.disable()  # like timeit: keep collections triggered by earlier cells out of the timing
+        try:
+            start = time.perf_counter()
+            result = function(data)
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+        if (data if in_place else result) != expected:
+            raise AssertionError(f"{name} did not sort its input")
+
+    counter = Counter()
+    data = CountingList((Counted(value, counter) for value in values), counter)
+    function(data)
+
+    data = values[:]
+    tracemalloc.start()
+    function(data)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {"seconds": best, "comparisons": counter.comparisons,
+            "writes": counter.writes if in_place else None, "peak_bytes": peak}
+
+
+def run(algorithms, distributions, sizes, repeat=1, seed=0, max_sizes=True, stream=sys.stdout):
+    """
+    Runs every algorithm over every distribution and size and prints a table.
+
+    Parameters:
+        algorithms (list), distributions (list): Keys of ALGORITHMS and DISTRIBUTIONS.
+        sizes (list): Input sizes.
+        repeat (int): Timed runs per cell.
+        seed (int): Seed for the random inputs; the same seed gives the same inputs.
+        max_sizes (bool): Skip sizes above each algorithm's default limit, so
+            the quadratic sorts are not run on huge inputs.
+        stream (file): Where the table goes, or None for no output.
+
+    Returns:
+        list: One dict per measured cell, with the keys in FIELDS.
+    """
+    rows = []
+    if stream is not None:
+        print(f"{'algorithm':<17}{'distribution':<15}{'n':>9}{'seconds':>11}{'comparisons':>14}"
+              f"{'writes':>12}{'peak KiB':>10}", file=stream)
+    for n in sizes:
+        for distribution in distributions:
+            values = DISTRIBUTIONS[distribution](n, random.Random(f"{seed}-{distribution}-{n}"))
+            for name in algorithms:
+                if max_sizes and n > ALGORITHMS[name][2]:
+                    continue
+                row = {"algorithm": name, "distribution": distribution, "n": n}
+                row.update(measure(name, values, repeat))
+                rows.append(row)
+                if stream is not None:
+                    writes = "-" if row["writes"] is None else row["writes"]
+                    print(f"{name:<17}{distribution:<15}{n:>9}{row['seconds']:>11.5f}{row['comparisons']:>14}"
+                          f"{writes:>12}{row['peak_bytes'] / 1024:>10.1f}", file=stream, flush=True)
+    return rows
+
+
+def write_csv(rows, path):
+    with open(path, 'w', newline='') as target:
+        writer = csv.DictWriter(target, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def write_json(rows, path):
+    with open(path, 'w') as target:
+        json.dump(rows, target, indent=1)
+
+
+def compare(rows, baseline, tolerance=0.5, min_seconds=0.005):
+    """
+    Checks results against a baseline run.
+
+    Parameters:
+        rows (list): Results of this run.
+        baseline (list): Results of an earlier run (e.g. loaded from its JSON file).
+        tolerance (float): Allowed relative growth of time and peak memory.
+        min_seconds (float): Cells faster than this in the baseline are too
+            noisy to time and only have their counters checked.
+
+    Returns:
+        list: A message per regression; empty if there are none.
+    """
+    previous = {(row["algorithm"], row["distribution"], row["n"]): row for row in baseline}
+    regressions = []
+    for row in rows:
+        old = previous.get((row["algorithm"], row["distribution"], row["n"]))
+        if old is None:
+            continue
+        cell = f"{row['algorithm']} on {row['distribution']} n={row['n']}"
+        for counter in ("comparisons", "writes"):
+            if row[counter] is not None and old.get(counter) is not None and row[counter] > old[counter]:
+                regressions.append(f"{cell}: {counter} {old[counter]} -> {row[counter]}")
+        if old["seconds"] >= min_seconds and row["seconds"] > old["seconds"] * (1 + tolerance):
+            regressions.append(f"{cell}: {old['seconds']:.5f}s -> {row['seconds']:.5f}s")
+        if row["peak_bytes"] > old["peak_bytes"] * (1 + tolerance) + 1024:
+            regressions.append(f"{cell}: peak memory {old['peak_bytes']} -> {row['peak_bytes']} bytes")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the sorting scripts.")
+    parser.add_argument("--algorithms", nargs="+", choices=list(ALGORITHMS), default=list(ALGORITHMS))
+    parser.add_argument("--distributions", nargs="+", choices=list(DISTRIBUTIONS), default=list(DISTRIBUTIONS))
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000], help="Input sizes.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per cell; the best is kept.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the random inputs.")
+    parser.add_argument("--no-limits", action="store_true", help="Run every algorithm at every size.")
+    parser.add_argument("--csv", help="Write the results to this CSV file.")
+    parser.add_argument("--json", help="Write the results to this JSON file (usable as a baseline).")
+    parser.add_argument("--baseline", help="JSON results of an earlier run to check for regressions.")
+    parser.add_argument("--tolerance", type=float, default=0.5,
+                        help="Allowed relative growth of time and memory against the baseline.")
+    args = parser.parse_args(argv)
+
+    rows = run(args.algorithms, args.distributions, args.sizes, args.repeat, args.seed, not args.no_limits)
+    if args.csv:
+        write_csv(rows, args.csv)
+    if args.json:
+        write_json(rows, args.json)
+    if args.baseline:
+        with open(args.baseline) as source:
+            regressions = compare(rows, json.load(source), args.tolerance)
+        for message in regressions:
+            print(f"REGRESSION {message}", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"No regressions against {args.baseline}.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,214 @@
+"""
+Bar-chart visualizer for the step events of the sorting scripts.
+
+The sorting algorithms (Bubble_sort.py, Selection_sort.py, insertion_sort.py)
+know nothing about plotting: their *_steps generators sort a list in place and
+yield small event tuples. This module consumes those events:
+
+- ("compare", i, j): positions i and j are being compared
+- ("swap", i, j): the values at i and j were exchanged
+- ("set", i, value): position i now holds value
+
+All bars live in one BarContainer created up front; each frame only updates
+the heights and colors of the bars that changed, instead of clearing the
+figure and drawing a new chart. There are two front ends:
+
+- show_sort: a simple interactive loop. Events keep being applied at full
+  speed and frames are only drawn when the next frame is due, so the
+  animation holds the target FPS no matter how many steps the sort makes.
+- animate_sort: a FuncAnimation with blitting. Every frame coalesces up to
+  steps_per_frame events and only the changed bars are redrawn over a cached
+  background. It can also write the animation to an MP4 (ffmpeg) or GIF
+  (Pillow) file without opening a window.
+
+Usage:
+------
+    from Bubble_sort import bubble_sort_steps
+    from sort_visualizer import animate_sort, show_sort
+
+    numbers = [5, 3, 8, 1]
+    show_sort(numbers, bubble_sort_steps(numbers), steps_per_second=20)
+
+    numbers = list(range(2000, 0, -1))
+    animate_sort(numbers, insertion_sort_steps(numbers), steps_per_frame=5000, save="insertion.mp4")
+"""
+import time
+
+import matplotlib.pyplot as plt
+from matplotlib.animation import FFMpegWriter, FuncAnimation, PillowWriter
+from matplotlib.figure import Figure
+
+WRITERS = {".mp4": FFMpegWriter, ".gif": PillowWriter}
+
+BAR_COLOR = 'skyblue'
+ACTIVE_COLOR = 'orange'
+DONE_COLOR = 'green'
+
+
+def _bar_chart(axes, heights, title):
+    """Draws the initial bars on axes and returns their BarContainer."""
+    bars = axes.bar(range(len(heights)), heights, color=BAR_COLOR)
+    axes.set_xlim(-0.5, len(heights) - 0.5)
+    axes.set_ylim(min(0, min(heights, default=0)), max(heights, default=1) * 1.05 or 1)
+    if title:
+        axes.set_title(title)
+    return bars
+
+
+def show_sort(data, steps, fps=30, steps_per_second=None, title=None):
+    """
+    Animates a sort from its step events.
+
+    Parameters:
+        data (list): The values before sorting. A copy is taken, so the list
+            may be the one the steps generator sorts in place.
+        steps (iterable): Step events, e.g. from bubble_sort_steps(data).
+        fps (float): Maximum frames drawn per second; events between frames
+            are applied without drawing.
+        steps_per_second (float): Optional playback speed. None plays the
+            events as fast as they come.
+        title (str): Optional figure title.
+
+    Returns:
+        int: The number of events consumed.
+    """
+    heights = list(data)
+    plt.ion()
+    figure, axes = plt.subplots()
+    bars = _bar_chart(axes, heights, title)
+
+    frame_interval = 1.0 / fps
+    step_interval = 1.0 / steps_per_second if steps_per_second else 0.0
+    start = next_frame = time.perf_counter()
+    dirty = set()
+    active = ()
+    count = 0
+
+    def draw():
+        for index in dirty:
+            bars[index].set_height(heights[index])
+        dirty.clear()
+        figure.canvas.draw_idle()
+        figure.canvas.flush_events()
+
+    for event in steps:
+        kind = event[0]
+        if kind == "swap":
+            i, j = event[1], event[2]
+            heights[i], heights[j] = heights[j], heights[i]
+            dirty.update((i, j))
+        elif kind == "set":
+            heights[event[1]] = event[2]
+            dirty.add(event[1])
+        count += 1
+
+        if step_interval:
+            delay = start + count * step_interval - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        now = time.perf_counter()
+        if now >= next_frame:
+            for index in active:
+                bars[index].set_color(BAR_COLOR)
+            active = event[1:3] if kind in ("compare", "swap") else event[1:2]
+            for index in active:
+                bars[index].set_color(ACTIVE_COLOR)
+            draw()
+            next_frame = now + frame_interval
+
+    for bar in bars:
+        bar.set_color(DONE_COLOR)
+    draw()
+    plt.ioff()
+    plt.show()
+    return count
+
+
+def animate_sort(data, steps, fps=60, steps_per_frame=1, save=None, title=None, dpi=100):
+    """
+    Animates a sort with a blitted FuncAnimation, or renders it to a video file.
+
+    Parameters:
+        data (list): The values before sorting. A copy is taken, so the list
+            may be the one the steps generator sorts in place.
+        steps (iterable): Step events, e.g. from bubble_sort_steps(data).
+        fps (int): Frames per second of the animation.
+        steps_per_frame (int): Events coalesced into each frame; raise it for
+            large inputs so the animation does not take hours.
+        save (str): Optional .mp4 or .gif path. The animation is written
+            frame by frame on an off-screen figure and no window is opened.
+        title (str): Optional figure title.
+        dpi (int): Resolution of the saved frames.
+
+    Returns:
+        int: The number of frames drawn.
+    """
+    writer_class = None
+    if save is not None:
+        suffix = save[save.rfind('.'):].lower() if '.' in save else ''
+        if suffix not in WRITERS:
+            raise ValueError(f"Cannot save to {save!r}; use one of {', '.join(WRITERS)}")
+        writer_class = WRITERS[suffix]
+
+    heights = list(data)
+    if save is not None:
+        figure = Figure()  # not managed by pyplot, so no window is ever shown
+        axes = figure.add_subplot()
+    else:
+        figure, axes = plt.subplots()
+    bars = _bar_chart(axes, heights, title)
+    events = iter(steps)
+    state = {"active": (), "frames": 0, "finished": False}
+
+    def frames():
+        while not state["finished"]:
+            yield state["frames"]
+        yield None  # one last frame with the sorted bars in DONE_COLOR
+
+    def update(frame):
+        if frame is None:
+            for bar in bars:
+                bar.set_color(DONE_COLOR)
+            return list(bars)
+        changed = set(state["active"])
+        active = ()
+        for _ in range(steps_per_frame):
+            event = next(events, None)
+            if event is None:
+                state["finished"] = True
+                break
+            kind = event[0]
+            if kind == "swap":
+                i, j = event[1], event[2]
+                heights[i], heights[j] = heights[j], heights[i]
+                changed.update((i, j))
+            elif kind == "set":
+                heights[event[1]] = event[2]
+                changed.add(event[1])
+            active = event[1:3] if kind in ("compare", "swap") else event[1:2]
+        for index in state["active"]:
+            bars[index].set_color(BAR_COLOR)
+        for index in active:
+            bars[index].set_color(ACTIVE_COLOR)
+        changed.update(active)
+        state["active"] = active
+        state["frames"] += 1
+        for index in changed:
+            bars[index].set_height(heights[index])
+        return [bars[index] for index in changed]
+
+    if save is not None:
+        # Drive the same update function from the writer: a generator of
+        # unknown length cannot be trusted to FuncAnimation.save in every
+        # matplotlib version, and no event loop is needed off-screen.
+        writer = writer_class(fps=fps)
+        with writer.saving(figure, save, dpi):
+            for frame in frames():
+                update(frame)
+                writer.grab_frame()
+        return state["frames"] + 1
+
+    animation = FuncAnimation(figure, update, frames=frames, interval=1000 / fps, blit=True,
+                              repeat=False, cache_frame_data=False)
+    plt.show()
+    return state["frames"] + 1
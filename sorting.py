@@ -0,0 +1,313 @@
+"""
+One sorting entry point that picks an algorithm from the data.
+
+sort(data) sorts lists, array.array buffers and NumPy arrays in place and
+returns them. With algorithm="auto" it chooses by size, type and value range:
+
+- tiny inputs (at most SMALL_SIZE items): insertion sort from insertion_sort.py
+- integer buffers spanning a small range: counting sort
+- large integer buffers: LSD radix sort on 16-bit digits
+- everything else: TimSort (list.sort / ndarray.sort)
+
+Counting and radix sort are only chosen automatically for buffers NumPy can
+view; on Python lists the interpreter overhead makes list.sort faster.
+
+The teaching implementations can be requested by name as well: "bubble",
+"selection", "insertion" and "merge" (the bottom-up MergeSort.merge_sort).
+
+NumPy is optional. When it is installed, array.array buffers are sorted
+through a zero-copy NumPy view and NumPy arrays use vectorized kernels;
+without it, everything falls back to the pure Python paths.
+
+Usage:
+------
+    echo 5 3 9 1 | python sorting.py
+    python sorting.py --benchmark
+    python sorting.py --check
+"""
+import argparse
+import random
+import sys
+import time
+from array import array
+from collections import Counter
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+from Bubble_sort import bubble_sort
+from MergeSort import merge_sort
+from Selection_sort import selection_sort
+from insertion_sort import insertion_sort
+
+SMALL_SIZE = 16
+COUNTING_MAX_SPAN = 1 << 24  # largest value range worth a count table
+COUNTING_SPAN_FACTOR = 4  # counting sort if the range is at most this many times the size
+RADIX_MIN_SIZE = 1 << 16  # smaller NumPy arrays are sorted by ndarray.sort
+ALGORITHMS = ("auto", "bubble", "selection", "insertion", "merge", "timsort", "counting", "radix")
+
+# array.array typecodes that map onto NumPy integer and float dtypes
+_ARRAY_DTYPES = {'b': 'i1', 'B': 'u1', 'h': 'i2', 'H': 'u2', 'i': 'i4', 'I': 'u4',
+                 'l': 'i8', 'L': 'u8', 'q': 'i8', 'Q': 'u8', 'f': 'f4', 'd': 'f8'}
+
+
+def _is_numpy(data):
+    return np is not None and isinstance(data, np.ndarray)
+
+
+def _as_numpy(data):
+    """Returns a zero-copy NumPy view of an array.array, NumPy array, or None."""
+    if _is_numpy(data):
+        return data
+    if np is not None and isinstance(data, array) and data.typecode in _ARRAY_DTYPES:
+        dtype = np.dtype(_ARRAY_DTYPES[data.typecode])
+        if dtype.itemsize == data.itemsize:
+            return np.frombuffer(data, dtype=dtype)
+    return None
+
+
+def _integer_span(data):
+    """
+    Returns (lowest, highest) if every item is an int, otherwise None.
+    """
+    view = _as_numpy(data)
+    if view is not None:
+        if view.dtype.kind not in "iu" or not len(view):
+            return None
+        return int(view.min()), int(view.max())
+    if isinstance(data, array):
+        if data.typecode in "fdu" or not data:
+            return None
+    elif not data or not all(type(item) is int for item in data):
+        return None
+    return min(data), max(data)
+
+
+def choose_algorithm(data):
+    """
+    Picks the algorithm sort(data) uses with algorithm="auto".
+
+    Parameters:
+        data: A list, array.array or NumPy array.
+
+    Returns:
+        str: One of ALGORITHMS other than "auto".
+    """
+    n = len(data)
+    if n <= SMALL_SIZE and not _is_numpy(data):
+        return "insertion"
+    view = _as_numpy(data)
+    span = _integer_span(view) if view is not None else None
+    if span is not None:
+        width = span[1] - span[0] + 1
+        if width <= COUNTING_MAX_SPAN and width <= COUNTING_SPAN_FACTOR * n:
+            return "counting"
+        if n >= RADIX_MIN_SIZE:
+            return "radix"
+    return "timsort"
+
+
+def _counting_sort_numpy(view, lowest, highest):
+    # Subtract in the unsigned dtype of the same width, where it wraps around
+    # to the offset 0..highest - lowest, and only then widen to intp: int8
+    # values minus their lowest can overflow int8, and uint64 values above
+    # 2**63 do not fit in intp at all.
+    unsigned = np.dtype(f"u{view.dtype.itemsize}")
+    offsets = view.view(unsigned) - unsigned.type(lowest % 2 ** (8 * view.dtype.itemsize))
+    counts = np.bincount(offsets.astype(np.intp), minlength=highest - lowest + 1)
+    view[:] = np.repeat(np.arange(lowest, highest + 1, dtype=view.dtype), counts)
+
+
+def _store(data, values, view=None):
+    """
+    Overwrites the contents of a list, array.array or NumPy array with values.
+
+    An array.array cannot be resized while a NumPy view of it exists, so
+    when view is given the values are written through it instead.
+    """
+    if view is not None:
+        view[:] = values
+    elif isinstance(data, array):
+        data[:] = array(data.typecode, values)
+    else:
+        data[:] = values
+
+
+def _counting_sort_python(data, lowest, highest):
+    counts = Counter(data)
+    result = []
+    for value in range(lowest, highest + 1):
+        count = counts.get(value)
+        if count:
+            result += [value] * count
+    _store(data, result)
+
+
+def _radix_sort_numpy(view):
+    """LSD radix sort of an integer array, 16 bits per pass, via stable argsort on each digit."""
+    bits = view.dtype.itemsize * 8
+    unsigned = np.dtype(f"u{view.dtype.itemsize}")
+    keys = view.view(unsigned)
+    if view.dtype.kind == "i":
+        keys = keys ^ unsigned.type(1 << (bits - 1))  # flip the sign bit so negatives come first
+    if bits <= 16:
+        view[:] = view[np.argsort(keys, kind="stable")]  # a single digit
+        return
+    order = np.arange(len(view))
+    for shift in range(0, bits, 16):
+        digit = ((keys[order] >> unsigned.type(shift)) & unsigned.type(0xFFFF)).astype(np.uint16)
+        order = order[np.argsort(digit, kind="stable")]
+    view[:] = view[order]
+
+
+def sort(data, algorithm="auto"):
+    """
+    Sorts data in place in ascending order.
+
+    Parameters:
+        data: A list, array.array or one-dimensional NumPy array. Buffers are
+            sorted without being copied into a list when NumPy is installed.
+        algorithm (str): One of ALGORITHMS; "auto" chooses with choose_algorithm.
+
+    Returns:
+        The same object, sorted.
+    """
+    if algorithm == "auto":
+        algorithm = choose_algorithm(data)
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm {algorithm!r}; choose one of {', '.join(ALGORITHMS)}")
+    if len(data) < 2:
+        return data
+
+    view = _as_numpy(data)
+    if algorithm in ("counting", "radix"):
+        span = _integer_span(data)
+        if span is None:
+            raise ValueError(f"{algorithm} sort needs integer data")
+        if algorithm == "counting" and span[1] - span[0] >= COUNTING_MAX_SPAN:
+            raise ValueError(f"The value range {span[0]}..{span[1]} is too wide for counting sort")
+        if algorithm == "radix":
+            if view is None:
+                raise ValueError("radix sort needs NumPy and an integer buffer")
+            _radix_sort_numpy(view)
+        elif view is not None:
+            _counting_sort_numpy(view, *span)
+        else:
+            _counting_sort_python(data, *span)  # no NumPy view
+    elif algorithm == "timsort":
+        if view is not None:
+            view.sort(kind="stable")
+        elif isinstance(data, list):
+            data.sort()
+        else:
+            _store(data, sorted(data))
+    elif algorithm == "merge":
+        _store(data, merge_sort(data), view)
+    else:
+        values = data if isinstance(data, list) else data.tolist()
+        {"bubble": bubble_sort, "selection": selection_sort, "insertion": insertion_sort}[algorithm](values)
+        if values is not data:
+            _store(data, values, view)
+    return data
+
+
+def parse_numbers(text):
+    """
+    Parses whitespace-separated integers, into a NumPy array when available.
+
+    Returns:
+        A NumPy int64 array, or an array('q') without NumPy.
+    """
+    if np is not None:
+        return np.array(text.split(), dtype=np.int64)
+    return array('q', map(int, text.split()))
+
+
+_DISTRIBUTIONS = {
+    "random": lambda n, rng: [rng.randrange(-2 ** 40, 2 ** 40) for _ in range(n)],
+    "small range": lambda n, rng: [rng.randrange(100) for _ in range(n)],
+    "sorted": lambda n, rng: list(range(n)),
+    "reversed": lambda n, rng: list(range(n, 0, -1)),
+}
+
+
+def benchmark(sizes=(1000, 100_000, 1_000_000), seed=0):
+    """
+    Prints a table comparing sorted() with sort() on lists, array('q') and NumPy arrays.
+    """
+    rng = random.Random(seed)
+    containers = [("list", list), ("array('q')", lambda values: array('q', values))]
+    if np is not None:
+        containers.append(("ndarray", lambda values: np.array(values, dtype=np.int64)))
+    header = f"{'n':>9}  {'distribution':<13}{'sorted()':>10}"
+    for name, _ in containers:
+        header += f"{name:>12}{'':>10}"
+    print(header)
+    for n in sizes:
+        for distribution, make in _DISTRIBUTIONS.items():
+            values = make(n, rng)
+            start = time.perf_counter()
+            expected = sorted(values)
+            line = f"{n:>9}  {distribution:<13}{time.perf_counter() - start:>10.4f}"
+            for _, container in containers:
+                data = container(values)
+                chosen = choose_algorithm(data)
+                start = time.perf_counter()
+                sort(data)
+                elapsed = time.perf_counter() - start
+                assert list(data) == expected, (distribution, chosen)
+                line += f"{elapsed:>12.4f}{chosen:>10}"
+            print(line, flush=True)
+
+
+def check(size=5000, seed=0):
+    """
+    Sorts random full-range data of every array.array typecode (and the matching
+    NumPy dtype), and integers crowded at the top of each integer type, with
+    each buffer algorithm and compares against sorted().
+
+    Raises:
+        AssertionError: If any result differs.
+    """
+    rng = random.Random(seed)
+    for typecode in _ARRAY_DTYPES:
+        if typecode in "fd":
+            cases = [[rng.uniform(-1e6, 1e6) for _ in range(size)]]
+        else:
+            bits = array(typecode).itemsize * 8
+            lowest, highest = (0, 2 ** bits - 1) if typecode.isupper() else (-2 ** (bits - 1), 2 ** (bits - 1) - 1)
+            # The full range, and a narrow range at the top of the type, which auto sorts by counting
+            cases = [[rng.randint(lowest, highest) for _ in range(size)],
+                     [max(lowest, highest - rng.randrange(size)) for _ in range(size)]]
+        containers = [array]
+        if np is not None:
+            containers.append(lambda code, items: np.array(array(code, items)))
+        for case in cases:
+            expected = sorted(array(typecode, case).tolist())  # 'f' rounds to float32
+            for container in containers:
+                for algorithm in ("auto", "counting", "radix", "timsort"):
+                    data = container(typecode, case)
+                    try:
+                        sort(data, algorithm)
+                    except ValueError:
+                        continue  # e.g. counting sort on floats or a wide range
+                    assert data.tolist() == expected, (typecode, algorithm, type(data).__name__)
+    print(f"All {len(_ARRAY_DTYPES)} typecodes sorted correctly.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sort numbers read from stdin, or benchmark the sorting API.")
+    parser.add_argument("--algorithm", choices=ALGORITHMS, default="auto")
+    parser.add_argument("--benchmark", type=int, nargs="*", metavar="N", help="Benchmark these sizes.")
+    parser.add_argument("--check", action="store_true", help="Check every array typecode against sorted().")
+    args = parser.parse_args()
+
+    if args.check:
+        check()
+    elif args.benchmark is not None:
+        benchmark(args.benchmark or (1000, 100_000, 1_000_000))
+    else:
+        numbers = sort(parse_numbers(sys.stdin.read()), args.algorithm)
+        print(" ".join(map(str, numbers.tolist())))
@@ -0,0 +1,177 @@
+"""
+Headless batch Sudoku solver.
+
+Reads puzzles one per line (81 characters, '0' or '.' for empty cells; 256 or
+625 characters for 16x16 and 25x25 boards) from a file or stdin, solves them with one of the engines in sudoku_core.py and writes
+one solution line per puzzle, in input order, to a file or stdout.
+
+Puzzles are streamed: the input is read in chunks, the chunks are fanned out
+across a multiprocessing pool and only a bounded number of chunks is in flight
+at any time, so memory stays flat even for files with millions of lines.
+Lines that are not valid puzzles are written as "invalid", puzzles without a
+solution as "no solution".
+
+At the end a summary is printed to stderr: total time, puzzles per second,
+the p50/p99 solve latency per puzzle, the number of invalid lines (which
+have no latency) and the search counters (nodes, backtracks, maximum depth)
+of the engine, so engines can be compared on the same corpus.
+
+Usage:
+------
+    python sudoku_batch.py puzzles.txt -o solutions.txt --engine bitmask --workers 8
+    cat puzzles.txt | python sudoku_batch.py - > solutions.txt
+"""
+import argparse
+import os
+import sys
+import time
+from array import array
+from collections import deque
+from itertools import islice
+from multiprocessing import Pool
+
+from sudoku_core import SOLVERS, SearchStats, format_grid, parse_puzzle, solve
+
+
+def solve_line(line, engine):
+    """
+    Solves a single puzzle line.
+
+    Parameters:
+        line (str): A one-line puzzle (see sudoku_core.parse_puzzle).
+        engine (str): Name of the solver engine (see sudoku_core.SOLVERS).
+
+    Returns:
+        tuple: (output line, seconds spent solving, SearchStats). The seconds
+        are None for a line that is not a valid puzzle.
+    """
+    stats = SearchStats()
+    try:
+        grid = parse_puzzle(line)
+    except ValueError:
+        return "invalid", None, stats
+    start = time.perf_counter()
+    solved = solve(grid, engine, stats=stats)
+    elapsed = time.perf_counter() - start
+    return (format_grid(grid) if solved else "no solution"), elapsed, stats
+
+
+def solve_chunk(lines, engine):
+    """
+    Solves a chunk of puzzle lines; the unit of work sent to pool workers.
+
+    Returns:
+        list: (output line, seconds, SearchStats) for each input line, in order.
+    """
+    return [solve_line(line, engine) for line in lines]
+
+
+def read_chunks(stream, chunk_size):
+    """
+    Yields lists of up to chunk_size non-empty puzzle lines from a text stream.
+    """
+    lines = (line for line in stream if line.strip())
+    while True:
+        chunk = list(islice(lines, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def percentile(sorted_values, fraction):
+    """
+    Returns the nearest-rank percentile of an already sorted sequence.
+    """
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def solve_stream(source, target, engine="bitmask", workers=1, chunk_size=256, totals=None):
+    """
+    Solves every puzzle in source and writes the results to target in input order.
+
+    Parameters:
+        source: A text stream with one puzzle per line.
+        target: A text stream for the solution lines.
+        engine (str): Name of the solver engine.
+        workers (int): Number of worker processes; 1 solves in this process.
+        chunk_size (int): Number of puzzles sent to a worker at a time.
+        totals (SearchStats): Optional; receives the search counters summed over all puzzles.
+
+    Returns:
+        tuple: (array of per-puzzle solve latencies in seconds, in input order,
+        number of invalid lines). Invalid lines have no latency.
+    """
+    latencies = array('d')
+    invalid = 0
+
+    def write(results):
+        nonlocal invalid
+        for output, elapsed, stats in results:
+            target.write(output)
+            target.write('\n')
+            if elapsed is None:
+                invalid += 1
+                continue
+            latencies.append(elapsed)
+            if totals is not None:
+                totals.nodes += stats.nodes
+                totals.backtracks += stats.backtracks
+                totals.max_depth = max(totals.max_depth, stats.max_depth)
+
+    chunks = read_chunks(source, chunk_size)
+    if workers <= 1:
+        for chunk in chunks:
+            write(solve_chunk(chunk, engine))
+        return latencies, invalid
+
+    max_in_flight = workers * 4
+    pending = deque()
+    with Pool(workers) as pool:
+        for chunk in chunks:
+            pending.append(pool.apply_async(solve_chunk, (chunk, engine)))
+            if len(pending) >= max_in_flight:
+                write(pending.popleft().get())
+        while pending:
+            write(pending.popleft().get())
+    return latencies, invalid
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve Sudoku puzzles in bulk without a GUI.")
+    parser.add_argument("input", help="Puzzle file, one puzzle per line ('-' for stdin).")
+    parser.add_argument("-o", "--output", default="-", help="Where to write solutions ('-' for stdout).")
+    parser.add_argument("--engine", choices=sorted(SOLVERS), default="bitmask", help="Solver engine to use.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Number of worker processes.")
+    parser.add_argument("--chunk-size", type=int, default=256, help="Puzzles per work unit.")
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.input == "-" else open(args.input, 'r')
+    target = sys.stdout if args.output == "-" else open(args.output, 'w', buffering=1 << 20)
+    totals = SearchStats()
+    start = time.perf_counter()
+    try:
+        latencies, invalid = solve_stream(source, target, args.engine, args.workers, args.chunk_size, totals)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+    total = time.perf_counter() - start
+
+    count = len(latencies)
+    ordered = sorted(latencies)
+    rate = count / total if total > 0 else 0.0
+    print(f"Processed {count} puzzles in {total:.3f}s ({rate:.1f} puzzles/s)", file=sys.stderr)
+    if invalid:
+        print(f"Skipped {invalid} invalid lines", file=sys.stderr)
+    print(f"Latency per puzzle: p50 {percentile(ordered, 0.50) * 1000:.3f} ms, "
+          f"p99 {percentile(ordered, 0.99) * 1000:.3f} ms", file=sys.stderr)
+    print(f"Search ({args.engine}): {totals.nodes} nodes, {totals.backtracks} backtracks, "
+          f"max depth {totals.max_depth}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
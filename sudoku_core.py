@@ -0,0 +1,715 @@
+"""
+Sudoku solver core, independent of any GUI.
+
+Holds the solver engines used by "Sudoku Solver.py" so they can be imported
+and run without a display (for example by sudoku_batch.py):
+
+- solving: the original cell-by-cell recursive backtracking search
+- solving_iterative: the same search without recursion, over a precomputed
+  list of empty cells with an explicit undo stack
+- solving_bitmask: bitmask constraint propagation (naked/hidden singles + MRV)
+- solving_dlx: Dancing Links (Algorithm X) exact cover, with dlx_solutions
+  and count_solutions for lazy enumeration and uniqueness checks
+
+Every engine takes an NxN list of lists with 0 for empty cells, fills it in
+place and returns True on success. N is any square board size (9 for classic
+Sudoku, 16 and 25 for the larger variants with 4x4 and 5x5 boxes); it is taken
+from len(grid). Engines are selectable by name through SOLVERS / solve().
+parse_puzzle and format_grid convert to and from the common one-line puzzle
+format (81 characters for 9x9, 256 for 16x16, 625 for 25x25).
+
+Long solves can be observed and interrupted: every engine accepts an optional
+progress callable that is invoked once per search node. Raising SolveCancelled
+from it aborts the search. The engines registered in SOLVERS also accept a
+SearchStats object that collects nodes, backtracks and maximum search depth,
+so engines can be compared on the same puzzle corpus.
+"""
+
+import math
+
+SYMBOLS = "123456789ABCDEFGHIJKLMNOP"  # one-line symbol for values 1..25
+
+class SolveCancelled(Exception):
+    """Raised from a progress callback to abort a running solve."""
+
+class SearchStats:
+    """
+        Instrumentation counters filled in by the solver engines.
+
+        Counters accumulate over every solve the object is passed to, so one
+        instance can total a whole puzzle corpus.
+
+        Attributes:
+        nodes : int
+            Search nodes visited (a placement for the backtracking engine, a
+            propagate-and-branch step for the bitmask engine, a column choice for DLX).
+        backtracks : int
+            Dead ends from which the search had to step back.
+        max_depth : int
+            Largest number of guesses on the search stack at any time.
+        naked_singles, hidden_singles : int
+            Cells filled by each propagation technique (bitmask engine only).
+    """
+    def __init__(self):
+        self.nodes = 0
+        self.backtracks = 0
+        self.max_depth = 0
+        self.naked_singles = 0
+        self.hidden_singles = 0
+
+    def __repr__(self):
+        return (f"SearchStats(nodes={self.nodes}, backtracks={self.backtracks}, max_depth={self.max_depth}, "
+                f"naked_singles={self.naked_singles}, hidden_singles={self.hidden_singles})")
+
+def box_size(size):
+    """
+        Return the box side length for a board of the given size (3 for 9x9, 4 for 16x16, ...).
+
+        Raises ValueError if size is not a square number of at least 4.
+    """
+    box = math.isqrt(size)
+    if box < 2 or box * box != size:
+        raise ValueError(f"Board size must be a square number such as 9, 16 or 25, got {size}")
+    return box
+
+def valid_move(grid, row, col, number):
+    """
+        Check if placing a number at the specified position is valid according to Sudoku rules.
+
+        Parameters:
+        grid : list[list[int]]
+            An NxN Sudoku grid represented as a list of lists.
+        row : int
+            Row index (0-based) where the number is to be placed.
+        col : int
+            Column index (0-based) where the number is to be placed.
+        number : int
+            The number (1–N) to be placed in the grid.
+        --------------
+        Returns:
+        bool
+            True if the number can be legally placed at the given position;
+            False if it violates Sudoku constraints (row, column, or box).
+    """
+    if number in grid[row]:
+        return False
+    size = len(grid)
+    for x in range(size):
+        if grid[x][col] == number:
+            return False
+    box = box_size(size)
+    corner_row = row - (row % box)
+    corner_col = col - (col % box)
+    for i in range(box):
+        for j in range(box):
+            if grid[corner_row + i][corner_col + j] == number:
+                return False
+    return True
+
+def solving(grid, row=0, col=0, progress=None):
+    """
+       Recursively solves the given Sudoku grid using backtracking.
+
+       This function attempts to fill the grid starting from the specified cell (row, col),
+       moving left to right and top to bottom. If it finds a valid number for an empty cell,
+       it proceeds to the next cell. If no valid number is found, it backtracks to try another possibility.
+       If given, progress() is called once per search node.
+
+    -----------------
+       Returns:
+       bool
+           True if the grid can be completely and validly filled;
+           False if the puzzle has no solution from the current state.
+    """
+    if progress is not None:
+        progress()
+    size = len(grid)
+    if col == size:
+        if row == size - 1:
+            return True
+        else:
+            row += 1
+            col = 0
+    if grid[row][col] > 0:
+        return solving(grid, row, col + 1, progress)
+    for i in range(1, size + 1):
+        if valid_move(grid, row, col, i):
+            grid[row][col] = i
+            if solving(grid, row, col + 1, progress):
+                return True
+        grid[row][col] = 0
+    return False
+
+def solving_iterative(grid, progress=None, stats=None):
+    """
+       Solves the given Sudoku grid in place with iterative backtracking.
+
+       Explores the same cells in the same order as solving(), but the empty
+       cells are collected once up front and the search keeps an explicit
+       stack with the digit placed in each of them, so there is no recursion
+       and filled cells are never visited. Row, column and box contents are
+       tracked as digit bitmasks instead of being rescanned by valid_move.
+
+       Parameters:
+       grid : list[list[int]]
+           An NxN Sudoku grid with 0 for empty cells. Left unchanged on failure.
+       progress : callable, optional
+           Called once per search node (placement).
+       stats : SearchStats, optional
+           Receives the node, backtrack and maximum depth counters.
+    -----------------
+       Returns:
+       bool
+           True if the grid was solved; False if the puzzle has no solution.
+    """
+    size = len(grid)
+    side = box_size(size)
+    rows = [0] * size
+    cols = [0] * size
+    boxes = [0] * size
+    empties = []
+    for row in range(size):
+        for col in range(size):
+            number = grid[row][col]
+            box = (row // side) * side + col // side
+            if number == 0:
+                empties.append((row, col, box))
+                continue
+            bit = 1 << (number - 1)
+            if (rows[row] | cols[col] | boxes[box]) & bit:
+                return False
+            rows[row] |= bit
+            cols[col] |= bit
+            boxes[box] |= bit
+
+    stack = [0] * len(empties)  # digit currently placed in each empty cell, 0 if none
+    depth = 0
+    nodes = backtracks = max_depth = 0
+    while 0 <= depth < len(empties):
+        row, col, box = empties[depth]
+        number = stack[depth]
+        if number:
+            bit = 1 << (number - 1)
+            rows[row] ^= bit
+            cols[col] ^= bit
+            boxes[box] ^= bit
+        used = rows[row] | cols[col] | boxes[box]
+        number += 1
+        while number <= size and used & (1 << (number - 1)):
+            number += 1
+        if number <= size:
+            bit = 1 << (number - 1)
+            rows[row] |= bit
+            cols[col] |= bit
+            boxes[box] |= bit
+            grid[row][col] = number
+            stack[depth] = number
+            depth += 1
+            nodes += 1
+            if depth > max_depth:
+                max_depth = depth
+            if progress is not None:
+                progress()
+        else:
+            grid[row][col] = 0
+            stack[depth] = 0
+            depth -= 1
+            backtracks += 1
+
+    if stats is not None:
+        stats.nodes += nodes
+        stats.backtracks += backtracks
+        stats.max_depth = max(stats.max_depth, max_depth)
+    return depth == len(empties)
+
+class _Geometry:
+    """
+        Cell-to-unit lookup tables for one board size, built once and shared by every solve.
+
+        Cells are numbered row-major from 0 to size*size - 1. Digit d is stored
+        as the bit 1 << (d - 1), so a set of digits is a size-bit integer.
+    """
+    def __init__(self, size):
+        box = box_size(size)
+        self.size = size
+        self.n_cells = size * size
+        self.all_digits = (1 << size) - 1
+        self.row_of = [i // size for i in range(self.n_cells)]
+        self.col_of = [i % size for i in range(self.n_cells)]
+        self.box_of = [(i // size // box) * box + (i % size) // box for i in range(self.n_cells)]
+        self.units = ([[r * size + c for c in range(size)] for r in range(size)]
+                      + [[r * size + c for r in range(size)] for c in range(size)]
+                      + [[i for i in range(self.n_cells) if self.box_of[i] == b] for b in range(size)])
+        self.digit_of_bit = {1 << d: d + 1 for d in range(size)}
+
+_GEOMETRIES = {}
+
+def _geometry(size):
+    """Return the cached _Geometry for a board size."""
+    geometry = _GEOMETRIES.get(size)
+    if geometry is None:
+        geometry = _GEOMETRIES[size] = _Geometry(size)
+    return geometry
+
+def _assign(geo, cells, rows, cols, boxes, idx, bit, trail):
+    """Place a digit bit in cell idx, update the unit masks and record it on the trail."""
+    cells[idx] = bit
+    rows[geo.row_of[idx]] |= bit
+    cols[geo.col_of[idx]] |= bit
+    boxes[geo.box_of[idx]] |= bit
+    trail.append(idx)
+
+def _undo(geo, cells, rows, cols, boxes, trail):
+    """Remove every placement recorded on the trail, newest first."""
+    row_of, col_of, box_of = geo.row_of, geo.col_of, geo.box_of
+    while trail:
+        idx = trail.pop()
+        bit = cells[idx]
+        rows[row_of[idx]] ^= bit
+        cols[col_of[idx]] ^= bit
+        boxes[box_of[idx]] ^= bit
+        cells[idx] = 0
+
+def _propagate(geo, cells, rows, cols, boxes, trail, stats=None):
+    """
+        Apply naked and hidden singles until nothing changes.
+
+        Every placement is appended to the trail so the caller can undo it.
+        Hidden singles are only looked for once no naked single is left, so the
+        technique counters in stats reflect what the puzzle actually needs.
+        --------------
+        Returns:
+        tuple(bool, int, int)
+            (ok, idx, candidates). ok is False on a contradiction. When ok is True,
+            idx is -1 if the grid is complete, otherwise it is the empty cell with
+            the fewest candidates (MRV) and candidates is its bitmask.
+    """
+    all_digits = geo.all_digits
+    row_of, col_of, box_of = geo.row_of, geo.col_of, geo.box_of
+    while True:
+        placed = False
+        best_idx = -1
+        best_cand = 0
+        best_count = geo.size + 1
+        # Naked singles: a cell with exactly one candidate.
+        for idx in range(geo.n_cells):
+            if cells[idx]:
+                continue
+            cand = all_digits & ~(rows[row_of[idx]] | cols[col_of[idx]] | boxes[box_of[idx]])
+            if not cand:
+                return False, -1, 0
+            if not cand & (cand - 1):
+                _assign(geo, cells, rows, cols, boxes, idx, cand, trail)
+                placed = True
+                if stats is not None:
+                    stats.naked_singles += 1
+            elif not placed:
+                count = cand.bit_count()
+                if count < best_count:
+                    best_idx, best_cand, best_count = idx, cand, count
+        if placed:
+            continue
+        if best_idx < 0:
+            return True, -1, 0
+        # Hidden singles: a digit that fits in only one cell of a unit.
+        for unit in geo.units:
+            once = twice = used = 0
+            for idx in unit:
+                bit = cells[idx]
+                if bit:
+                    used |= bit
+                    continue
+                cand = all_digits & ~(rows[row_of[idx]] | cols[col_of[idx]] | boxes[box_of[idx]])
+                twice |= once & cand
+                once |= cand
+            if (once | used) != all_digits:
+                return False, -1, 0
+            only = once & ~twice & ~used
+            while only:
+                bit = only & -only
+                only ^= bit
+                for idx in unit:
+                    if not cells[idx] and not (rows[row_of[idx]] | cols[col_of[idx]] | boxes[box_of[idx]]) & bit:
+                        _assign(geo, cells, rows, cols, boxes, idx, bit, trail)
+                        placed = True
+                        if stats is not None:
+                            stats.hidden_singles += 1
+                        break
+                else:
+                    return False, -1, 0
+        if not placed:
+            return True, best_idx, best_cand
+
+def _bitmask_search(geo, cells, rows, cols, boxes, progress, stats, depth):
+    """Propagate, then branch on the MRV cell. Leaves the state untouched on failure."""
+    if progress is not None:
+        progress()
+    if stats is not None:
+        stats.nodes += 1
+        if depth > stats.max_depth:
+            stats.max_depth = depth
+    trail = []
+    ok, idx, cand = _propagate(geo, cells, rows, cols, boxes, trail, stats)
+    if ok:
+        if idx < 0:
+            return True
+        while cand:
+            bit = cand & -cand
+            cand ^= bit
+            branch = []
+            _assign(geo, cells, rows, cols, boxes, idx, bit, branch)
+            if _bitmask_search(geo, cells, rows, cols, boxes, progress, stats, depth + 1):
+                return True
+            _undo(geo, cells, rows, cols, boxes, branch)
+    _undo(geo, cells, rows, cols, boxes, trail)
+    if stats is not None:
+        stats.backtracks += 1
+    return False
+
+def _bitmask_count(geo, cells, rows, cols, boxes, limit, progress, stats, depth):
+    """Count solutions below the current state, up to limit. Leaves the state untouched."""
+    if progress is not None:
+        progress()
+    if stats is not None:
+        stats.nodes += 1
+        if depth > stats.max_depth:
+            stats.max_depth = depth
+    trail = []
+    count = 0
+    ok, idx, cand = _propagate(geo, cells, rows, cols, boxes, trail, stats)
+    if ok:
+        if idx < 0:
+            count = 1
+        while cand and count < limit:
+            bit = cand & -cand
+            cand ^= bit
+            branch = []
+            _assign(geo, cells, rows, cols, boxes, idx, bit, branch)
+            count += _bitmask_count(geo, cells, rows, cols, boxes, limit - count, progress, stats, depth + 1)
+            _undo(geo, cells, rows, cols, boxes, branch)
+    _undo(geo, cells, rows, cols, boxes, trail)
+    if count == 0 and stats is not None:
+        stats.backtracks += 1
+    return count
+
+def _bitmask_state(grid):
+    """
+        Build the bitmask search state (geometry, cells, row/col/box masks) for a grid.
+
+        Returns None if two clues already conflict.
+    """
+    geo = _geometry(len(grid))
+    cells = [0] * geo.n_cells
+    rows = [0] * geo.size
+    cols = [0] * geo.size
+    boxes = [0] * geo.size
+    trail = []
+    for idx in range(geo.n_cells):
+        value = grid[geo.row_of[idx]][geo.col_of[idx]]
+        if value:
+            bit = 1 << (value - 1)
+            if (rows[geo.row_of[idx]] | cols[geo.col_of[idx]] | boxes[geo.box_of[idx]]) & bit:
+                return None
+            _assign(geo, cells, rows, cols, boxes, idx, bit, trail)
+    return geo, cells, rows, cols, boxes
+
+def solving_bitmask(grid, progress=None, stats=None):
+    """
+       Solve the given Sudoku grid in place using bitmask constraint propagation.
+
+       Row, column and box contents are kept as N-bit integer masks, so the
+       candidates of a cell are a single OR/NOT. Naked and hidden singles are
+       applied before every branch, and the search branches on the empty cell
+       with the fewest candidates (minimum remaining values).
+
+       Parameters:
+       grid : list[list[int]]
+           An NxN Sudoku grid with 0 for empty cells. Filled in on success.
+       progress : callable, optional
+           Called once per search node.
+       stats : SearchStats, optional
+           Receives the node, backtrack and maximum depth counters.
+    -----------------
+       Returns:
+       bool
+           True if the grid was solved; False if the puzzle has no solution
+           (including clues that already conflict with each other).
+    """
+    state = _bitmask_state(grid)
+    if state is None:
+        return False
+    geo, cells, rows, cols, boxes = state
+    if not _bitmask_search(geo, cells, rows, cols, boxes, progress, stats, 0):
+        return False
+    for idx in range(geo.n_cells):
+        grid[geo.row_of[idx]][geo.col_of[idx]] = geo.digit_of_bit[cells[idx]]
+    return True
+
+class _DancingLinks:
+    """
+        Knuth's Dancing Links over the 4*N*N Sudoku constraints (324 for 9x9).
+
+        Node 0 is the root, nodes 1..4*N*N are column headers and every candidate
+        (row, col, digit) adds four nodes, one per constraint it satisfies:
+        the cell, the digit in the row, the digit in the column and the digit in the box.
+    """
+    def __init__(self, size=9):
+        box_side = box_size(size)
+        n_cells = size * size
+        n_columns = 4 * n_cells
+        self.left = [i - 1 for i in range(n_columns + 1)]
+        self.left[0] = n_columns
+        self.right = [i + 1 for i in range(n_columns + 1)]
+        self.right[n_columns] = 0
+        self.up = list(range(n_columns + 1))
+        self.down = list(range(n_columns + 1))
+        self.column = list(range(n_columns + 1))
+        self.size = [0] * (n_columns + 1)
+        self.candidate = [None] * (n_columns + 1)
+        self.first_node = {}
+        for row in range(size):
+            for col in range(size):
+                box = (row // box_side) * box_side + col // box_side
+                for d in range(size):
+                    self._add_row((row, col, d + 1), (
+                        1 + row * size + col,
+                        1 + n_cells + row * size + d,
+                        1 + 2 * n_cells + col * size + d,
+                        1 + 3 * n_cells + box * size + d,
+                    ))
+
+    def _add_row(self, candidate, columns):
+        first = len(self.column)
+        for k, c in enumerate(columns):
+            node = first + k
+            self.left.append(first + (k - 1) % 4)
+            self.right.append(first + (k + 1) % 4)
+            self.up.append(self.up[c])
+            self.down.append(c)
+            self.down[self.up[c]] = node
+            self.up[c] = node
+            self.column.append(c)
+            self.candidate.append(candidate)
+            self.size[c] += 1
+        self.first_node[candidate] = first
+
+    def cover(self, c):
+        left, right, up, down, column, size = self.left, self.right, self.up, self.down, self.column, self.size
+        right[left[c]] = right[c]
+        left[right[c]] = left[c]
+        i = down[c]
+        while i != c:
+            j = right[i]
+            while j != i:
+                down[up[j]] = down[j]
+                up[down[j]] = up[j]
+                size[column[j]] -= 1
+                j = right[j]
+            i = down[i]
+
+    def uncover(self, c):
+        left, right, up, down, column, size = self.left, self.right, self.up, self.down, self.column, self.size
+        i = up[c]
+        while i != c:
+            j = left[i]
+            while j != i:
+                size[column[j]] += 1
+                down[up[j]] = j
+                up[down[j]] = j
+                j = left[j]
+            i = up[i]
+        right[left[c]] = c
+        left[right[c]] = c
+
+    def select(self, candidate):
+        """
+            Commit a given clue by covering its four constraint columns.
+
+            Returns False if one of them is already covered, i.e. the clue
+            conflicts with an earlier one.
+        """
+        node = self.first_node[candidate]
+        for k in range(4):
+            c = self.column[node + k]
+            if self.right[self.left[c]] != c:
+                return False
+            self.cover(c)
+        return True
+
+    def search(self, partial, progress=None, stats=None):
+        """Recursively yield every exact cover (Algorithm X), choosing the smallest column first."""
+        if progress is not None:
+            progress()
+        if stats is not None:
+            stats.nodes += 1
+            if len(partial) > stats.max_depth:
+                stats.max_depth = len(partial)
+        right, down, column, size = self.right, self.down, self.column, self.size
+        c = right[0]
+        if c == 0:
+            yield list(partial)
+            return
+        best = c
+        while c != 0:
+            if size[c] < size[best]:
+                best = c
+            c = right[c]
+        if size[best] == 0:
+            if stats is not None:
+                stats.backtracks += 1
+            return
+        self.cover(best)
+        r = down[best]
+        while r != best:
+            partial.append(self.candidate[r])
+            j = right[r]
+            while j != r:
+                self.cover(column[j])
+                j = right[j]
+            yield from self.search(partial, progress, stats)
+            j = self.left[r]
+            while j != r:
+                self.uncover(column[j])
+                j = self.left[j]
+            partial.pop()
+            r = down[r]
+        self.uncover(best)
+
+def dlx_solutions(grid, progress=None, stats=None):
+    """
+       Lazily enumerate every solution of the grid with Dancing Links (Algorithm X).
+
+       The input grid is not modified.
+
+       Parameters:
+       grid : list[list[int]]
+           An NxN Sudoku grid with 0 for empty cells.
+       progress : callable, optional
+           Called once per search node.
+       stats : SearchStats, optional
+           Receives the node, backtrack and maximum depth counters.
+    -----------------
+       Yields:
+       list[list[int]]
+           A new, completely filled NxN grid for each solution.
+    """
+    size = len(grid)
+    links = _DancingLinks(size)
+    for row in range(size):
+        for col in range(size):
+            if grid[row][col] and not links.select((row, col, grid[row][col])):
+                return
+    for placements in links.search([], progress, stats):
+        solution = [list(r) for r in grid]
+        for row, col, number in placements:
+            solution[row][col] = number
+        yield solution
+
+def count_solutions(grid, limit=2, progress=None, stats=None, engine="dlx"):
+    """
+       Count the solutions of the grid, stopping as soon as limit is reached.
+
+       count_solutions(grid, 2) == 1 is the uniqueness check.
+
+       Parameters:
+       engine : str
+           "dlx" enumerates with Dancing Links; "bitmask" counts with the
+           propagation search, which is faster on puzzles that are close to solved.
+    -----------------
+       Returns:
+       int
+           The number of solutions found, at most limit.
+    """
+    if engine == "bitmask":
+        state = _bitmask_state(grid)
+        if state is None:
+            return 0
+        return _bitmask_count(*state, limit, progress, stats, 0)
+    if engine != "dlx":
+        raise ValueError(f"Unknown counting engine {engine!r}; choose 'dlx' or 'bitmask'")
+    count = 0
+    for _ in dlx_solutions(grid, progress, stats):
+        count += 1
+        if count >= limit:
+            break
+    return count
+
+def solving_dlx(grid, progress=None, stats=None):
+    """
+       Solve the given Sudoku grid in place with the Dancing Links exact-cover backend.
+
+    -----------------
+       Returns:
+       bool
+           True if the grid was solved; False if the puzzle has no solution.
+    """
+    for solution in dlx_solutions(grid, progress, stats):
+        for row in range(len(grid)):
+            grid[row][:] = solution[row]
+        return True
+    return False
+
+SOLVERS = {
+    "backtracking": solving_iterative,
+    "bitmask": solving_bitmask,
+    "dlx": solving_dlx,
+}
+
+def solve(grid, engine="bitmask", progress=None, stats=None):
+    """
+       Solve the grid in place with the solver engine registered under the given name.
+
+       Parameters:
+       grid : list[list[int]]
+           An NxN Sudoku grid with 0 for empty cells.
+       engine : str
+           One of the names in SOLVERS ("backtracking", "bitmask", "dlx").
+       progress : callable, optional
+           Called once per search node; raise SolveCancelled from it to abort.
+       stats : SearchStats, optional
+           Receives the node, backtrack and maximum depth counters.
+    -----------------
+       Returns:
+       bool
+           True if the grid was solved; False if the puzzle has no solution.
+    """
+    if engine not in SOLVERS:
+        raise ValueError(f"Unknown solver engine {engine!r}; choose one of {', '.join(SOLVERS)}")
+    return SOLVERS[engine](grid, progress=progress, stats=stats)
+
+def parse_puzzle(line):
+    """
+       Parse a one-line puzzle into a grid.
+
+       The board size follows from the line length: 81 characters for 9x9,
+       256 for 16x16, 625 for 25x25. Values are written with SYMBOLS
+       (1-9, then A for 10, B for 11, ...); '0' and '.' are empty cells.
+       Surrounding whitespace is ignored.
+
+       Parameters:
+       line : str
+           The puzzle in row-major order.
+    -----------------
+       Returns:
+       list[list[int]]
+           An NxN grid with 0 for empty cells.
+    """
+    line = line.strip()
+    size = math.isqrt(len(line))
+    if size * size != len(line):
+        raise ValueError(f"Puzzle length must be a square number such as 81, 256 or 625, got {len(line)}")
+    box_size(size)
+    values = []
+    for ch in line.upper():
+        if ch in "0.":
+            values.append(0)
+            continue
+        value = SYMBOLS.find(ch) + 1
+        if not 1 <= value <= size:
+            raise ValueError(f"Invalid character {ch!r} in a {size}x{size} puzzle")
+        values.append(value)
+    return [values[row * size:row * size + size] for row in range(size)]
+
+def format_grid(grid):
+    """Format a grid as a one-line puzzle using SYMBOLS, with '0' for empty cells."""
+    return "".join(SYMBOLS[value - 1] if value else "0" for row in grid for value in row)
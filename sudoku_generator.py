@@ -0,0 +1,213 @@
+"""
+Sudoku puzzle generator with uniqueness checking and difficulty rating.
+
+Builds on the solver engines in sudoku_core.py:
+
+1. A random complete grid is made by filling the boxes on the main diagonal
+   (which never constrain each other) with shuffled digits and letting the
+   bitmask solver complete the rest.
+2. Clues are removed in random order (in 180-degree symmetric pairs by
+   default). After each removal count_solutions(..., limit=2) checks that the
+   solution is still unique; if not, the clues are put back.
+3. The finished puzzle is rated by what the bitmask solver needs to solve it:
+
+   - easy: naked singles only
+   - medium: hidden singles as well, but no guessing
+   - hard: a few guesses (at most HARD_MAX_NODES search nodes)
+   - expert: anything that needs more search
+
+Puzzles can be generated in several processes at once; each task gets its own
+seeded random generator so runs are reproducible.
+
+Expert puzzles are rare (roughly 1 in 60 dug grids), so they take a few
+seconds each. Sizes above 9 work but are slow: digging a 16x16 grid runs
+thousands of uniqueness checks and takes about a minute per puzzle.
+
+Usage:
+------
+    python sudoku_generator.py -n 1000 --difficulty hard --workers 4 -o puzzles.txt --seed 1
+
+The output has one puzzle per line in the same format that sudoku_batch.py reads.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from collections import Counter
+from multiprocessing import Pool
+
+from sudoku_core import SearchStats, box_size, count_solutions, format_grid, solving_bitmask
+
+DIFFICULTIES = ("easy", "medium", "hard", "expert")
+HARD_MAX_NODES = 10
+MAX_ATTEMPTS = 2000  # fresh grids tried per puzzle before giving up on a requested difficulty
+
+
+def random_solution(size=9, rng=random):
+    """
+    Builds a random, completely filled Sudoku grid.
+
+    Parameters:
+        size (int): Board size (9, 16, 25, ...).
+        rng (random.Random): Source of randomness.
+
+    Returns:
+        list: A size x size grid with every cell filled.
+    """
+    box = box_size(size)
+    grid = [[0] * size for _ in range(size)]
+    for b in range(box):
+        digits = list(range(1, size + 1))
+        rng.shuffle(digits)
+        for k, digit in enumerate(digits):
+            grid[b * box + k // box][b * box + k % box] = digit
+    solving_bitmask(grid)
+    # Relabel the digits so the solver's fixed branching order does not show in the result.
+    labels = list(range(1, size + 1))
+    rng.shuffle(labels)
+    return [[labels[value - 1] for value in row] for row in grid]
+
+
+def rate_difficulty(puzzle):
+    """
+    Rates a puzzle by the techniques and search the bitmask solver needs.
+
+    Parameters:
+        puzzle (list): A grid with 0 for empty cells; it is not modified.
+
+    Returns:
+        tuple: (difficulty name, SearchStats of the solve).
+    """
+    stats = SearchStats()
+    solving_bitmask([row[:] for row in puzzle], stats=stats)
+    if stats.nodes == 1 and stats.hidden_singles == 0:
+        return "easy", stats
+    if stats.nodes == 1:
+        return "medium", stats
+    if stats.nodes <= HARD_MAX_NODES:
+        return "hard", stats
+    return "expert", stats
+
+
+def dig_puzzle(solution, rng=random, symmetric=True):
+    """
+    Removes clues from a full grid for as long as the solution stays unique.
+
+    Parameters:
+        solution (list): A completely filled grid; it is not modified.
+        rng (random.Random): Source of randomness for the removal order.
+        symmetric (bool): Remove cells in 180-degree rotational pairs.
+
+    Returns:
+        list: The puzzle grid, with 0 for empty cells.
+    """
+    size = len(solution)
+    puzzle = [row[:] for row in solution]
+    cells = [(row, col) for row in range(size) for col in range(size)]
+    rng.shuffle(cells)
+    for row, col in cells:
+        if not puzzle[row][col]:
+            continue
+        group = {(row, col)}
+        if symmetric:
+            group.add((size - 1 - row, size - 1 - col))
+        for r, c in group:
+            puzzle[r][c] = 0
+        if count_solutions(puzzle, 2, engine="bitmask") != 1:
+            for r, c in group:
+                puzzle[r][c] = solution[r][c]
+    return puzzle
+
+
+def generate_puzzle(size=9, difficulty=None, rng=random, symmetric=True):
+    """
+    Generates one puzzle with a unique solution.
+
+    Parameters:
+        size (int): Board size (9, 16, 25, ...).
+        difficulty (str): One of DIFFICULTIES, or None to accept any rating.
+        rng (random.Random): Source of randomness.
+        symmetric (bool): Keep the clues 180-degree rotationally symmetric.
+
+    Returns:
+        tuple: (puzzle, solution, difficulty name, SearchStats).
+    """
+    if difficulty is not None and difficulty not in DIFFICULTIES:
+        raise ValueError(f"Unknown difficulty {difficulty!r}; choose one of {', '.join(DIFFICULTIES)}")
+    for _ in range(MAX_ATTEMPTS):
+        solution = random_solution(size, rng)
+        puzzle = dig_puzzle(solution, rng, symmetric)
+        rating, stats = rate_difficulty(puzzle)
+        if difficulty is None or rating == difficulty:
+            return puzzle, solution, rating, stats
+    raise RuntimeError(f"No {difficulty} puzzle found in {MAX_ATTEMPTS} attempts")
+
+
+def _generate_task(args):
+    """Pool worker: generate the puzzle for one task index with its own seeded RNG."""
+    seed, index, size, difficulty, symmetric = args
+    rng = random.Random(f"{seed}-{index}")
+    puzzle, _, rating, _ = generate_puzzle(size, difficulty, rng, symmetric)
+    return format_grid(puzzle), rating
+
+
+def generate(count, size=9, difficulty=None, seed=None, workers=1, symmetric=True):
+    """
+    Yields count puzzles as (one-line puzzle, difficulty name) tuples.
+
+    Parameters:
+        count (int): Number of puzzles to generate.
+        size (int): Board size.
+        difficulty (str): Requested difficulty, or None for any.
+        seed: Base seed; task i uses its own generator seeded from (seed, i).
+        workers (int): Number of worker processes; 1 generates in this process.
+        symmetric (bool): Keep the clues rotationally symmetric.
+    """
+    if seed is None:
+        seed = random.randrange(1 << 32)
+    tasks = ((seed, index, size, difficulty, symmetric) for index in range(count))
+    if workers <= 1:
+        yield from map(_generate_task, tasks)
+        return
+    with Pool(workers) as pool:
+        yield from pool.imap(_generate_task, tasks, chunksize=8)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate Sudoku puzzles with a unique solution.")
+    parser.add_argument("-n", "--count", type=int, default=10, help="Number of puzzles to generate.")
+    parser.add_argument("--size", type=int, default=9, help="Board size (9, 16, 25, ...); 16 takes about a minute per puzzle.")
+    parser.add_argument("--difficulty", choices=DIFFICULTIES, help="Only keep puzzles of this difficulty.")
+    parser.add_argument("--seed", type=int, help="Seed for reproducible output.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Number of worker processes.")
+    parser.add_argument("--no-symmetry", action="store_true", help="Remove clues one at a time instead of in symmetric pairs.")
+    parser.add_argument("-o", "--output", default="-", help="Where to write puzzles ('-' for stdout).")
+    args = parser.parse_args(argv)
+
+    target = sys.stdout if args.output == "-" else open(args.output, 'w')
+    ratings = Counter()
+    start = time.perf_counter()
+    generated = 0
+    try:
+        for line, rating in generate(args.count, args.size, args.difficulty, args.seed,
+                                     args.workers, not args.no_symmetry):
+            target.write(line)
+            target.write('\n')
+            ratings[rating] += 1
+            generated += 1
+    except (RuntimeError, ValueError) as error:
+        print(f"Stopped after {generated} puzzles: {error}", file=sys.stderr)
+        return 1
+    finally:
+        if target is not sys.stdout:
+            target.close()
+    total = time.perf_counter() - start
+
+    rate = args.count / total * 60 if total > 0 else 0.0
+    print(f"Generated {args.count} puzzles in {total:.2f}s ({rate:.0f} puzzles/min)", file=sys.stderr)
+    print("Difficulty: " + ", ".join(f"{name} {ratings[name]}" for name in DIFFICULTIES), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,235 @@
+"""
+Computer players for Tic-Tac-Toe, importable without starting a game.
+
+- get_ai_move: the original five-rule heuristic (rule_move on bitboards)
+- get_perfect_move / perfect_moves: perfect play from the solved game tree
+  (negamax, alpha-beta pruning and a symmetry-folded transposition table)
+
+"Tic Toc Toe with AI.py" plays against these; tictactoe_arena.py pits them
+against each other.
+"""
+import random
+
+from mnk_game import check_winner as check_winner_mnk
+from tictactoe_bitboard import FULL, SYMMETRIES, canonical, is_full, is_win, player_mask, to_masks
+
+_CORNERS = (0, 2, 6, 8)
+_EDGES = (1, 3, 5, 7)
+
+def check_winner(board, player, last_move=None, k=3):
+    """
+    Checks if the specified player has won the game.
+
+    Parameters:
+        board (list): A list of rows representing the Tic-Tac-Toe board.
+        player (str): The player to check for a win ('X' or 'O').
+        last_move (tuple): Optional (row, col) of the latest move; when given
+            only the lines through it are checked.
+        k (int): Number in a row needed to win.
+
+    Returns:
+        bool: True if the player has won, False otherwise.
+    """
+    if last_move is not None or k != 3 or len(board) != 3 or len(board[0]) != 3:
+        return check_winner_mnk(board, player, k, last_move)
+    return is_win(player_mask(board, player))
+
+def get_ai_move(board, ai_player, human_player):
+    """
+    Determines the AI's move using a simple rule-based strategy.
+
+    Parameters:
+        board (list): A 3x3 list representing the Tic-Tac-Toe board.
+        ai_player (str): The AI's mark ('X' or 'O').
+        human_player (str): The human player's mark ('X' or 'O').
+
+    Returns:
+        tuple: The row and column of the AI's move.
+    """
+    cell = rule_move(*to_masks(board, ai_player, human_player))
+    return None if cell is None else divmod(cell, 3)
+
+def rule_move(me, opponent, rng=random):
+    """
+    The five rules of get_ai_move on a bitboard, for fast self-play.
+
+    Parameters:
+        me (int): Mask of the player to move.
+        opponent (int): Mask of the other player.
+        rng (random.Random): Source of randomness for the corner and edge order.
+
+    Returns:
+        int: The cell index (0..8) to play, or None if the board is full.
+    """
+    free = FULL & ~(me | opponent)
+    # Rule 1: win in the next move. Rule 2: block the opponent's winning move.
+    for mask in (me, opponent):
+        for cell in range(9):
+            bit = 1 << cell
+            if free & bit and is_win(mask | bit):
+                return cell
+
+    # Rule 3: Take the center if it's available
+    if free & 1 << 4:
+        return 4
+
+    # Rule 4: Take a corner if available; Rule 5: take any available edge
+    for cells in (_CORNERS, _EDGES):
+        cells = list(cells)
+        rng.shuffle(cells)
+        for cell in cells:
+            if free >> cell & 1:
+                return cell
+    return None
+
+# Positions are bitboards (see tictactoe_bitboard.py): one 9-bit mask for the
+# player to move and one for the opponent.
+_MOVE_ORDER = (4, 0, 2, 6, 8, 1, 3, 5, 7)  # center, corners, edges: good moves first for alpha-beta
+_EXACT, _LOWER, _UPPER = 0, 1, 2
+_INVERSE_SYMMETRIES = tuple(tuple(perm.index(cell) for cell in range(9)) for perm in SYMMETRIES)
+
+_transposition_table = {}
+_move_table = {}
+
+def _negamax(me, opponent, alpha, beta):
+    """
+    Scores the position for the player to move with negamax and alpha-beta pruning.
+
+    Results are cached in a transposition table keyed on the canonical position
+    (the 8 board symmetries folded together), together with whether they are
+    exact values or alpha-beta bounds.
+
+    Parameters:
+        me (int): Mask of the player to move.
+        opponent (int): Mask of the other player.
+        alpha (int), beta (int): The search window.
+
+    Returns:
+        int: Positive if the player to move wins (larger for faster wins),
+        0 for a draw, negative if they lose.
+    """
+    key = canonical(me, opponent)[0]
+    entry = _transposition_table.get(key)
+    if entry is not None:
+        value, flag = entry
+        if flag == _EXACT or (flag == _LOWER and value >= beta) or (flag == _UPPER and value <= alpha):
+            return value
+
+    original_alpha = alpha
+    taken = me | opponent
+    empties = 9 - taken.bit_count()
+    best = -10
+    for cell in _MOVE_ORDER:
+        bit = 1 << cell
+        if taken & bit:
+            continue
+        mine = me | bit
+        if is_win(mine):
+            score = empties
+        elif empties == 1:
+            score = 0
+        else:
+            score = -_negamax(opponent, mine, -beta, -alpha)
+        if score > best:
+            best = score
+        if best > alpha:
+            alpha = best
+        if alpha >= beta:
+            break
+
+    if best <= original_alpha:
+        flag = _UPPER
+    elif best >= beta:
+        flag = _LOWER
+    else:
+        flag = _EXACT
+    _transposition_table[key] = (best, flag)
+    return best
+
+def _best_moves(me, opponent):
+    """
+    Returns the exact value of the position and every cell that achieves it.
+    """
+    taken = me | opponent
+    empties = 9 - taken.bit_count()
+    scores = {}
+    for cell in range(9):
+        bit = 1 << cell
+        if taken & bit:
+            continue
+        mine = me | bit
+        if is_win(mine):
+            scores[cell] = empties
+        elif empties == 1:
+            scores[cell] = 0
+        else:
+            scores[cell] = -_negamax(opponent, mine, -10, 10)
+    best = max(scores.values())
+    return best, [cell for cell, score in scores.items() if score == best]
+
+def _build_move_table():
+    """
+    Solves every reachable position once and stores its best moves.
+
+    Positions are stored under their canonical key, with the moves expressed
+    in the canonical orientation, so symmetric positions share one entry.
+    The key does not depend on which mark moves first, so the table serves
+    the AI whether it plays X or O.
+    """
+    stack = [(0, 0)]
+    while stack:
+        me, opponent = stack.pop()
+        key, symmetry = canonical(me, opponent)
+        if key in _move_table:
+            continue
+        _, moves = _best_moves(me, opponent)
+        _move_table[key] = [SYMMETRIES[symmetry][cell] for cell in moves]
+        for cell in range(9):
+            bit = 1 << cell
+            if (me | opponent) & bit:
+                continue
+            mine = me | bit
+            if not is_win(mine) and not is_full(mine, opponent):
+                stack.append((opponent, mine))
+
+def perfect_moves(me, opponent):
+    """
+    Looks up every perfect-play move for the player to move on a bitboard.
+
+    The whole game tree is solved once, on the first call, with negamax,
+    alpha-beta pruning and a symmetry-folded transposition table. After that
+    every call is a table lookup.
+
+    Parameters:
+        me (int): Mask of the player to move.
+        opponent (int): Mask of the other player.
+
+    Returns:
+        list: The cell indices (0..8) of all equally good moves.
+    """
+    if not _move_table:
+        _build_move_table()
+    key, symmetry = canonical(me, opponent)
+    moves = _move_table.get(key)
+    if moves is None:
+        # Not reachable in a legal game (e.g. a hand-edited board); solve it directly.
+        return _best_moves(me, opponent)[1]
+    inverse = _INVERSE_SYMMETRIES[symmetry]
+    return [inverse[cell] for cell in moves]
+
+def get_perfect_move(board, ai_player, human_player):
+    """
+    Determines a perfect-play move for the AI.
+
+    Among equally good moves one is picked at random.
+
+    Parameters:
+        board (list): A 3x3 list representing the Tic-Tac-Toe board.
+        ai_player (str): The AI's mark ('X' or 'O').
+        human_player (str): The human player's mark ('X' or 'O').
+
+    Returns:
+        tuple: The row and column of the AI's move.
+    """
+    me, opponent = to_masks(board, ai_player, human_player)
+    return divmod(random.choice(perfect_moves(me, opponent)), 3)
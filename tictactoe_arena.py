@@ -0,0 +1,285 @@
+"""
+Headless self-play and tournament harness for the Tic-Tac-Toe family.
+
+Players are plain callables `player(game, rng) -> cell` that receive an
+mnk_game.MNKGame (with the player to move on turn) and a random.Random, and
+return the cell to play. The built-in players are registered by name in
+PLAYERS:
+
+- random: a uniformly random legal move
+- rules: the original five-rule get_ai_move (3x3 only)
+- perfect: perfect play from the solved game table (3x3 only)
+- search: mnk_game.search_move limited to SEARCH_DEPTH plies (any board)
+- mcts: tictactoe_mcts.MCTSPlayer with MCTS_PLAYOUTS playouts per move (any board)
+
+run_tournament plays every ordered pair of entrants (each side gets to move
+first) N times across a process pool. Every task gets its own RNG stream
+seeded from (seed, pairing, chunk), so results do not depend on how tasks are
+spread over workers. Game records can be streamed to a JSONL file, one game
+per line: {"x": name, "o": name, "result": "x" | "o" | "draw", "moves": [cells]}.
+
+On the classic 3x3 board, pairings of players that also have a bitboard form
+`player(me, opponent, rng) -> cell` (registered in BITBOARD_PLAYERS) are played
+on two 9-bit masks with the tictactoe_bitboard win table instead of an
+MNKGame, which is an order of magnitude faster.
+
+Usage:
+------
+    python tictactoe_arena.py random rules perfect -n 1000 --workers 4 --seed 1 --log games.jsonl
+    python tictactoe_arena.py random search --board 7 7 4 -n 20
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from itertools import permutations
+from multiprocessing import Pool
+
+from mnk_game import MNKGame, search_move
+from tictactoe_ai import perfect_moves, rule_move
+from tictactoe_bitboard import FULL, free_cells, is_win
+from tictactoe_mcts import MCTSPlayer
+
+SEARCH_DEPTH = 3
+MCTS_PLAYOUTS = 1000
+CHUNK_SIZE = 50  # games per pool task
+
+
+# _FREE_CELLS[taken] lists the empty cells of a 3x3 board whose taken cells are the mask taken.
+_FREE_CELLS = tuple(tuple(free_cells(taken, 0)) for taken in range(FULL + 1))
+
+
+def random_bits(me, opponent, rng):
+    """Plays a uniformly random empty cell of a 3x3 bitboard."""
+    return rng.choice(_FREE_CELLS[me | opponent])
+
+
+def perfect_bits(me, opponent, rng):
+    """Plays a random one of the perfect-play moves from the solved table."""
+    return rng.choice(perfect_moves(me, opponent))
+
+
+BITBOARD_PLAYERS = {
+    "random": random_bits,
+    "rules": rule_move,  # the five rules of get_ai_move
+    "perfect": perfect_bits,
+}
+
+
+def _masks(game):
+    """Returns (mask of the player to move, mask of the opponent) of a 3x3 MNKGame."""
+    player = game.to_move
+    me = opponent = 0
+    for cell in game.moves:
+        if game.cells[cell] == player:
+            me |= 1 << cell
+        else:
+            opponent |= 1 << cell
+    return me, opponent
+
+
+def random_player(game, rng):
+    """Plays a uniformly random legal move."""
+    return rng.choice(game.legal_moves())
+
+
+def rules_player(game, rng):
+    """Plays the original rule-based get_ai_move (3x3 boards only)."""
+    return rule_move(*_masks(game), rng)
+
+
+def perfect_player(game, rng):
+    """Plays a random one of the perfect-play moves from the solved table (3x3 boards only)."""
+    return perfect_bits(*_masks(game), rng)
+
+
+def search_player(game, rng):
+    """Plays mnk_game.search_move with a fixed depth, so games are reproducible."""
+    return search_move(game, max_depth=SEARCH_DEPTH, time_budget=float("inf"))
+
+
+_mcts = MCTSPlayer(playouts=MCTS_PLAYOUTS)
+
+
+def mcts_player(game, rng):
+    """Plays MCTS with a fixed playout budget, so games are reproducible; the tree is kept within a game."""
+    if len(game.moves) < 2:
+        _mcts.reset()
+    return _mcts.choose(game, rng)
+
+
+PLAYERS = {
+    "random": random_player,
+    "rules": rules_player,
+    "perfect": perfect_player,
+    "search": search_player,
+    "mcts": mcts_player,
+}
+CLASSIC_ONLY = {"rules", "perfect"}
+
+
+def play_game(x_player, o_player, rows=3, cols=3, k=3, rng=random):
+    """
+    Plays one game between two player callables without any input or output.
+
+    Parameters:
+        x_player, o_player (callable): Players for the first and second side.
+        rows (int), cols (int), k (int): Board shape and number in a row to win.
+        rng (random.Random): Randomness handed to the players.
+
+    Returns:
+        tuple: (winner, moves) where winner is 0 for X, 1 for O or None for a
+        draw, and moves is the list of cells played.
+    """
+    game = MNKGame(rows, cols, k)
+    players = (x_player, o_player)
+    while True:
+        cell = players[game.to_move](game, rng)
+        if game.cells[cell] >= 0:
+            raise ValueError(f"Player {game.marks[game.to_move]} chose the occupied cell {cell}")
+        if game.play(cell):
+            return game.winner, game.moves
+        if game.is_full():
+            return None, game.moves
+
+
+def play_game_bitboard(x_player, o_player, rng=random):
+    """
+    Plays one 3x3 game between two bitboard players, `player(me, opponent, rng) -> cell`.
+
+    Returns:
+        tuple: (winner, moves) as for play_game.
+    """
+    masks = [0, 0]
+    players = (x_player, o_player)
+    moves = []
+    player = 0
+    while True:
+        cell = players[player](masks[player], masks[1 - player], rng)
+        bit = 1 << cell
+        if (masks[0] | masks[1]) & bit:
+            raise ValueError(f"Player {'XO'[player]} chose the occupied cell {cell}")
+        masks[player] |= bit
+        moves.append(cell)
+        if is_win(masks[player]):
+            return player, moves
+        if masks[0] | masks[1] == FULL:
+            return None, moves
+        player = 1 - player
+
+
+def _play_chunk(task):
+    """
+    Pool worker: plays one chunk of games for a pairing with its own RNG stream.
+
+    Returns:
+        list: (x name, o name, winner, moves) for every game.
+    """
+    x_name, o_name, first_game, count, board, seed = task
+    rng = random.Random(f"{seed}-{x_name}-{o_name}-{first_game}")
+    if tuple(board) == (3, 3, 3) and x_name in BITBOARD_PLAYERS and o_name in BITBOARD_PLAYERS:
+        x_player, o_player = BITBOARD_PLAYERS[x_name], BITBOARD_PLAYERS[o_name]
+        return [(x_name, o_name) + play_game_bitboard(x_player, o_player, rng) for _ in range(count)]
+    x_player, o_player = PLAYERS[x_name], PLAYERS[o_name]
+    return [(x_name, o_name) + play_game(x_player, o_player, *board, rng=rng) for _ in range(count)]
+
+
+def run_tournament(names, games, board=(3, 3, 3), seed=0, workers=1, log=None):
+    """
+    Plays every ordered pair of entrants games times and tallies the results.
+
+    Parameters:
+        names (list): Player names from PLAYERS.
+        games (int): Games per ordered pairing (so 2 * games per pair of players).
+        board (tuple): (rows, cols, k).
+        seed (int): Base seed for the per-task RNG streams.
+        workers (int): Number of worker processes; 1 plays in this process.
+        log (file): Optional text stream that receives one JSON game record per line.
+
+    Returns:
+        dict: results[a][b] = [wins, draws, losses] of a against b, over both colors.
+    """
+    names = list(dict.fromkeys(names))
+    for name in names:
+        if name not in PLAYERS:
+            raise ValueError(f"Unknown player {name!r}; choose from {', '.join(PLAYERS)}")
+        if name in CLASSIC_ONLY and tuple(board) != (3, 3, 3):
+            raise ValueError(f"Player {name!r} only plays on the classic 3x3 board")
+
+    pairings = list(permutations(names, 2)) if len(names) > 1 else [(names[0], names[0])]
+    tasks = [(x_name, o_name, first, min(CHUNK_SIZE, games - first), tuple(board), seed)
+             for x_name, o_name in pairings
+             for first in range(0, games, CHUNK_SIZE)]
+    results = {a: {b: [0, 0, 0] for b in names} for a in names}
+
+    def record(chunk):
+        for x_name, o_name, winner, moves in chunk:
+            if winner is None:
+                results[x_name][o_name][1] += 1
+                if o_name != x_name:
+                    results[o_name][x_name][1] += 1
+            else:
+                won, lost = (x_name, o_name) if winner == 0 else (o_name, x_name)
+                results[won][lost][0] += 1
+                results[lost][won][2] += 1
+            if log is not None:
+                outcome = "draw" if winner is None else "xo"[winner]
+                log.write(json.dumps({"x": x_name, "o": o_name, "result": outcome, "moves": moves},
+                                     separators=(",", ":")))
+                log.write("\n")
+
+    if workers <= 1:
+        for task in tasks:
+            record(_play_chunk(task))
+    else:
+        with Pool(workers) as pool:
+            for chunk in pool.imap_unordered(_play_chunk, tasks):
+                record(chunk)
+    return results
+
+
+def format_results(results):
+    """
+    Formats the win/draw/loss matrix: each row is a player's W/D/L against each column.
+    """
+    names = list(results)
+    rows = {a: ["/".join(str(n) for n in results[a][b]) if a != b or len(names) == 1 else "-" for b in names]
+            for a in names}
+    width = max(12, max(len(text) for text in names + [cell for row in rows.values() for cell in row]) + 2)
+    lines = ["".ljust(width) + "".join(name.rjust(width) for name in names)]
+    for a in names:
+        lines.append(a.ljust(width) + "".join(cell.rjust(width) for cell in rows[a]))
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play Tic-Tac-Toe AIs against each other.")
+    parser.add_argument("players", nargs="+", choices=sorted(PLAYERS), help="Entrants.")
+    parser.add_argument("-n", "--games", type=int, default=100, help="Games per ordered pairing.")
+    parser.add_argument("--board", type=int, nargs=3, default=(3, 3, 3), metavar=("ROWS", "COLS", "K"))
+    parser.add_argument("--seed", type=int, default=0, help="Base seed for reproducible runs.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Number of worker processes.")
+    parser.add_argument("--log", help="Write one JSON game record per line to this file.")
+    args = parser.parse_args(argv)
+
+    log = open(args.log, 'w', buffering=1 << 20) if args.log else None
+    start = time.perf_counter()
+    try:
+        results = run_tournament(args.players, args.games, args.board, args.seed, args.workers, log)
+    finally:
+        if log is not None:
+            log.close()
+    total = time.perf_counter() - start
+
+    entrants = len(args.players)
+    played = args.games * (entrants * (entrants - 1) if entrants > 1 else 1)
+    print("Wins/draws/losses of each row player against each column player (both colors):")
+    print(format_results(results))
+    rate = played / total if total > 0 else 0.0
+    print(f"{played} games in {total:.2f}s ({rate:.0f} games/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Compact bitboard representation for Tic-Tac-Toe, used by the classic 3x3
+players in tictactoe_ai.py (and through them "Tic Toc Toe with AI.py").
+
+A position is two 9-bit integers, one per player. Cell (row, col) is bit
+row * 3 + col. Win detection tests the player's mask against a precomputed
+512-entry table built from the 8 winning line masks, so checking a win,
+a full board or the free cells never touches a list.
+
+The 8 board symmetries (rotations and reflections) are also precomputed as
+512-entry lookup tables so a search can fold symmetric positions together.
+"""
+
+FULL = 0x1FF
+
+# Rows, columns and the two diagonals.
+WIN_MASKS = (
+    0b000000111, 0b000111000, 0b111000000,
+    0b001001001, 0b010010010, 0b100100100,
+    0b100010001, 0b001010100,
+)
+
+# _WINNING[mask] is 1 if mask contains a complete line.
+_WINNING = bytes(int(any(mask & line == line for line in WIN_MASKS)) for mask in range(FULL + 1))
+
+# Cell i moves to cell perm[i] under each symmetry.
+SYMMETRIES = (
+    (0, 1, 2, 3, 4, 5, 6, 7, 8),  # identity
+    (2, 5, 8, 1, 4, 7, 0, 3, 6),  # rotate 90
+    (8, 7, 6, 5, 4, 3, 2, 1, 0),  # rotate 180
+    (6, 3, 0, 7, 4, 1, 8, 5, 2),  # rotate 270
+    (2, 1, 0, 5, 4, 3, 8, 7, 6),  # mirror left-right
+    (6, 7, 8, 3, 4, 5, 0, 1, 2),  # mirror top-bottom
+    (0, 3, 6, 1, 4, 7, 2, 5, 8),  # main diagonal
+    (8, 5, 2, 7, 4, 1, 6, 3, 0),  # anti-diagonal
+)
+
+
+def _permute_mask(mask, perm):
+    result = 0
+    for cell in range(9):
+        if mask >> cell & 1:
+            result |= 1 << perm[cell]
+    return result
+
+
+# SYMMETRY_MAPS[s][mask] is mask transformed by SYMMETRIES[s].
+SYMMETRY_MAPS = tuple(tuple(_permute_mask(mask, perm) for mask in range(FULL + 1)) for perm in SYMMETRIES)
+
+
+def is_win(mask):
+    """
+    Checks if a player's mask contains a complete line.
+
+    Parameters:
+        mask (int): The 9-bit mask of one player's marks.
+
+    Returns:
+        bool: True if the player has three in a row.
+    """
+    return _WINNING[mask] == 1
+
+
+def is_full(x_mask, o_mask):
+    """
+    Checks if every cell is taken.
+
+    Returns:
+        bool: True if the board is full.
+    """
+    return x_mask | o_mask == FULL
+
+
+def free_cells(x_mask, o_mask):
+    """
+    Lists the empty cells.
+
+    Returns:
+        list: Indices 0..8 of the empty cells, in order.
+    """
+    taken = x_mask | o_mask
+    return [cell for cell in range(9) if not taken >> cell & 1]
+
+
+def player_mask(board, player):
+    """
+    Extracts one player's marks from a 3x3 list board.
+
+    Parameters:
+        board (list): A 3x3 list of marks, with " " for empty cells.
+        player (str): The mark to collect ('X' or 'O').
+
+    Returns:
+        int: The 9-bit mask of the player's cells.
+    """
+    mask = 0
+    for row in range(3):
+        for col in range(3):
+            if board[row][col] == player:
+                mask |= 1 << (row * 3 + col)
+    return mask
+
+
+def to_masks(board, x_player="X", o_player="O"):
+    """
+    Converts a 3x3 list board into bitboard form.
+
+    Parameters:
+        board (list): A 3x3 list of marks, with " " for empty cells.
+        x_player (str), o_player (str): The marks of the two players.
+
+    Returns:
+        tuple: (x_mask, o_mask).
+    """
+    return player_mask(board, x_player), player_mask(board, o_player)
+
+
+def to_board(x_mask, o_mask, x_player="X", o_player="O"):
+    """
+    Converts a bitboard back into the 3x3 list form used by print_board.
+
+    Returns:
+        list: A 3x3 list of marks, with " " for empty cells.
+    """
+    board = [[" " for _ in range(3)] for _ in range(3)]
+    for cell in range(9):
+        if x_mask >> cell & 1:
+            board[cell // 3][cell % 3] = x_player
+        elif o_mask >> cell & 1:
+            board[cell // 3][cell % 3] = o_player
+    return board
+
+
+def canonical(me, opponent):
+    """
+    Folds the 8 symmetries of a position together.
+
+    Parameters:
+        me (int): Mask of the player to move.
+        opponent (int): Mask of the other player.
+
+    Returns:
+        tuple: ((me, opponent) of the canonical position, index into SYMMETRIES
+        that maps the given position onto it).
+    """
+    best = (me, opponent)
+    best_index = 0
+    for index in range(1, 8):
+        table = SYMMETRY_MAPS[index]
+        key = (table[me], table[opponent])
+        if key < best:
+            best, best_index = key, index
+    return best, best_index
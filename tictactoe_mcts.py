@@ -0,0 +1,265 @@
+"""
+Monte Carlo Tree Search player for the Tic-Tac-Toe family (any mnk_game board).
+
+Each iteration walks down the tree with UCT (upper confidence bound applied
+to trees), expands one new move, scores it with a batch of random playouts
+and backs the result up to the root. The move finally played is the most
+visited child of the root.
+
+- Budget: a number of playouts, a time budget in seconds, or both (whichever
+  runs out first), so every move stays within a fixed latency.
+- Tree reuse: the player keeps its tree between moves and, on the next call,
+  descends to the node for the moves played since, so earlier work is kept.
+- Rollouts: ROLLOUT_BATCH random games per expanded node, played on a plain
+  copy of the cell list with a last-move win check.
+- Root parallelization: with workers > 1, workers - 1 helper processes grow
+  independent trees from the same position and their root statistics are
+  added to the local tree's before the move is chosen.
+
+Usage:
+------
+    player = MCTSPlayer(time_budget=1.0, workers=4)
+    cell = player.choose(game)   # game is an mnk_game.MNKGame
+    player.close()
+
+MCTSPlayer instances are also players in the `player(game, rng) -> cell`
+form used by tictactoe_arena.py.
+"""
+import math
+import random
+import time
+from multiprocessing import Pool
+
+from mnk_game import DIRECTIONS, MNKGame
+
+EXPLORATION = math.sqrt(2)
+ROLLOUT_BATCH = 4  # random playouts per expanded node
+
+
+class _Node:
+    """A position in the search tree, reached by player playing move."""
+
+    __slots__ = ("move", "player", "parent", "children", "untried", "visits", "wins", "terminal")
+
+    def __init__(self, move, player, parent, untried, terminal=False):
+        self.move = move
+        self.player = player
+        self.parent = parent
+        self.children = []
+        self.untried = untried
+        self.visits = 0
+        self.wins = 0.0  # playout results for player: 1 per win, 0.5 per draw
+        self.terminal = terminal
+
+
+def _wins(cells, cell, rows, cols, k):
+    """Checks if the stone on cell completes k in a row (same walk as MNKGame.check_winner)."""
+    player = cells[cell]
+    row, col = divmod(cell, cols)
+    for d_row, d_col in DIRECTIONS:
+        count = 1
+        for sign in (1, -1):
+            r, c = row + sign * d_row, col + sign * d_col
+            while 0 <= r < rows and 0 <= c < cols and cells[r * cols + c] == player:
+                count += 1
+                r += sign * d_row
+                c += sign * d_col
+        if count >= k:
+            return True
+    return False
+
+
+def rollouts(game, count, rng=random):
+    """
+    Plays count random games to the end from the current position.
+
+    Parameters:
+        game (MNKGame): The position; it is not modified.
+        count (int): Number of playouts.
+        rng (random.Random): Source of randomness.
+
+    Returns:
+        list: [player 0 wins, player 1 wins, draws].
+    """
+    results = [0, 0, 0]
+    rows, cols, k = game.rows, game.cols, game.k
+    empty = game.legal_moves()
+    first = game.to_move
+    for _ in range(count):
+        cells = game.cells[:]
+        rng.shuffle(empty)
+        player = first
+        for cell in empty:
+            cells[cell] = player
+            if _wins(cells, cell, rows, cols, k):
+                results[player] += 1
+                break
+            player = 1 - player
+        else:
+            results[2] += 1
+    return results
+
+
+def _new_root(game):
+    return _Node(None, 1 - game.to_move, None, game.candidate_moves(), game.is_over())
+
+
+def _search(root, game, playouts, deadline, exploration, rng):
+    """
+    Grows the tree under root for up to playouts playouts or until deadline.
+    At least one iteration is always made so the root has a move to offer.
+
+    Returns:
+        int: The number of playouts made.
+    """
+    done = 0
+    log, sqrt = math.log, math.sqrt
+    while done < playouts and (not done or time.perf_counter() < deadline):
+        node = root
+        depth = 0
+        # Selection
+        while not node.untried and node.children and not node.terminal:
+            scale = exploration * sqrt(log(node.visits))
+            node = max(node.children, key=lambda child: child.wins / child.visits + scale / sqrt(child.visits))
+            game.play(node.move)
+            depth += 1
+        # Expansion
+        if node.untried and not node.terminal:
+            move = node.untried.pop(rng.randrange(len(node.untried)))
+            player = game.to_move
+            won = game.play(move)
+            depth += 1
+            terminal = won or game.is_full()
+            child = _Node(move, player, node, [] if terminal else game.candidate_moves(), terminal)
+            node.children.append(child)
+            node = child
+        # Simulation
+        if node.terminal:
+            results = [0, 0, ROLLOUT_BATCH]
+            if game.winner is not None:
+                results = [0, 0, 0]
+                results[game.winner] = ROLLOUT_BATCH
+        else:
+            results = rollouts(game, ROLLOUT_BATCH, rng)
+        # Backpropagation
+        n = sum(results)
+        draws = results[2] * 0.5
+        while node is not None:
+            node.visits += n
+            node.wins += results[node.player] + draws
+            node = node.parent
+        for _ in range(depth):
+            game.undo()
+        done += n
+    return done
+
+
+def _root_stats(root):
+    return {child.move: (child.visits, child.wins) for child in root.children}
+
+
+def _helper_search(task):
+    """Pool worker: grows an independent tree from the position and returns its root statistics."""
+    rows, cols, k, moves, playouts, time_budget, exploration, seed = task
+    deadline = time.perf_counter() + time_budget
+    game = MNKGame(rows, cols, k)
+    for cell in moves:
+        game.play(cell)
+    root = _new_root(game)
+    _search(root, game, playouts, deadline, exploration, random.Random(seed))
+    return _root_stats(root)
+
+
+class MCTSPlayer:
+    """
+    Chooses moves with Monte Carlo Tree Search, keeping its tree between moves.
+    """
+
+    def __init__(self, playouts=None, time_budget=None, workers=1, exploration=EXPLORATION, rng=None):
+        """
+        Parameters:
+            playouts (int): Playouts per move and per tree, or None for no limit.
+            time_budget (float): Seconds per move, or None for no limit. When
+                neither budget is given the default is one second.
+            workers (int): Number of trees grown in parallel (processes).
+            exploration (float): The UCT exploration constant.
+            rng (random.Random): Source of randomness when none is passed to choose.
+        """
+        if playouts is None and time_budget is None:
+            time_budget = 1.0
+        self.playouts = playouts if playouts is not None else math.inf
+        self.time_budget = time_budget if time_budget is not None else math.inf
+        self.workers = workers
+        self.exploration = exploration
+        self.rng = rng or random.Random()
+        self.last_playouts = 0
+        self._root = None
+        self._root_moves = ()
+        self._root_shape = None
+        self._pool = None
+
+    def _reuse_root(self, game):
+        """Returns the stored subtree for the game's position, or a fresh root."""
+        shape = (game.rows, game.cols, game.k)
+        node = self._root
+        if node is not None and shape == self._root_shape \
+                and tuple(game.moves[:len(self._root_moves)]) == self._root_moves:
+            for move in game.moves[len(self._root_moves):]:
+                node = next((child for child in node.children if child.move == move), None)
+                if node is None:
+                    break
+        else:
+            node = None
+        if node is None:
+            node = _new_root(game)
+        node.parent = None
+        self._root, self._root_moves, self._root_shape = node, tuple(game.moves), shape
+        return node
+
+    def choose(self, game, rng=None):
+        """
+        Picks a move for the player to move.
+
+        Parameters:
+            game (MNKGame): The position; it is restored before returning.
+            rng (random.Random): Optional source of randomness for this move.
+
+        Returns:
+            int: The chosen cell.
+        """
+        rng = rng or self.rng
+        if game.is_over():
+            raise ValueError("The game is already over")
+        deadline = time.perf_counter() + self.time_budget
+        root = self._reuse_root(game)
+
+        pending = None
+        if self.workers > 1:
+            if self._pool is None:
+                self._pool = Pool(self.workers - 1)
+            tasks = [(game.rows, game.cols, game.k, list(game.moves), self.playouts, self.time_budget,
+                      self.exploration, rng.getrandbits(64)) for _ in range(self.workers - 1)]
+            pending = self._pool.map_async(_helper_search, tasks)
+
+        self.last_playouts = _search(root, game, self.playouts, deadline, self.exploration, rng)
+        totals = {move: visits for move, (visits, _) in _root_stats(root).items()}
+        if pending is not None:
+            for stats in pending.get():
+                for move, (visits, _) in stats.items():
+                    totals[move] = totals.get(move, 0) + visits
+                    self.last_playouts += visits
+        return max(totals, key=totals.get)
+
+    def __call__(self, game, rng=None):
+        return self.choose(game, rng)
+
+    def reset(self):
+        """Forgets the stored tree, e.g. before a new game."""
+        self._root, self._root_moves, self._root_shape = None, (), None
+
+    def close(self):
+        """Shuts down the helper processes, if any."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None